@@ -0,0 +1,83 @@
+"""Benchmark of the chord fingerings search against an exhaustive enumeration.
+
+Run it with :
+
+    python benchmarks/bench_chord_fingerings.py
+"""
+import timeit
+from itertools import product
+from typing import Callable, List, Optional
+
+from fretboardgtr.fingerings import search_chord_fingerings, vectorized_chord_fingerings
+from fretboardgtr.notes_creators import ChordFromName, NotesContainer
+from fretboardgtr.utils import HAS_NUMPY, get_note_from_index
+
+TUNINGS = {
+    4: ["E", "A", "D", "G"],
+    5: ["B", "E", "A", "D", "G"],
+    6: ["E", "A", "D", "G", "B", "E"],
+    7: ["B", "E", "A", "D", "G", "B", "E"],
+    8: ["F#", "B", "E", "A", "D", "G", "B", "E"],
+}
+
+
+def exhaustive_chord_fingerings(
+    container: NotesContainer, tuning: List[str], max_spacing: int = 5
+) -> List[List[Optional[int]]]:
+    """Enumerate every combination of the scale, then filter them."""
+    fingerings = []
+    for combination in product(*container.get_scale(tuning, max_spacing)):
+        non_zero_numbers = [num for num in combination if num != 0]
+        if len(set(non_zero_numbers)) > 4:
+            continue
+        new_combination: List[Optional[int]] = list(combination)
+        while len(non_zero_numbers) >= 2:
+            if max(non_zero_numbers) - min(non_zero_numbers) <= max_spacing:
+                break
+            minimum = min(non_zero_numbers)
+            new_combination[new_combination.index(minimum)] = None
+            non_zero_numbers.remove(minimum)
+        notes = {
+            get_note_from_index(index, note)
+            for index, note in zip(new_combination, tuning)
+            if index is not None
+        }
+        if notes == set(container.notes):
+            fingerings.append(new_combination)
+    return fingerings
+
+
+def best_time(function: Callable[[], object], repeat: int) -> float:
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def main() -> None:
+    chord = ChordFromName(root="C", quality="7").build()
+    print(
+        f"{'strings':>8} {'voicings':>9} {'exhaustive':>11}"
+        f" {'search':>14} {'vectorized':>14}"
+    )
+    for number_of_strings, tuning in TUNINGS.items():
+        repeat = 3 if number_of_strings < 8 else 1
+        search_inputs = chord._chord_search_inputs(tuning, 5)
+        exhaustive = best_time(
+            lambda: exhaustive_chord_fingerings(chord, tuning), repeat
+        )
+        search = best_time(
+            lambda: list(search_chord_fingerings(*search_inputs)), repeat
+        )
+        line = (
+            f"{number_of_strings:>8} {len(chord.get_chord_fingerings(tuning)):>9}"
+            f" {exhaustive:>10.3f}s"
+            f" {search:>7.3f}s {exhaustive / search:>5.1f}x"
+        )
+        if HAS_NUMPY:
+            vectorized = best_time(
+                lambda: vectorized_chord_fingerings(*search_inputs), repeat
+            )
+            line += f" {vectorized:>7.3f}s {exhaustive / vectorized:>5.1f}x"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
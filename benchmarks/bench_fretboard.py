@@ -0,0 +1,124 @@
+"""Benchmark of the batched FretBoard.add_notes against adding notes one by one,
+of FretBoard.from_template against building the whole fretboard, of a
+pooled fretboard against a new fretboard for each fingering, of the
+memory used by the notes with and without compact layers, and of a lazy
+fretboard only asked for its size.
+
+The board has 8 strings and 24 frets, the notes of a scale are drawn over
+the whole neck.
+
+Run it with :
+
+    python benchmarks/bench_fretboard.py
+"""
+import timeit
+import tracemalloc
+from typing import Callable
+
+from fretboardgtr.fretboard import FretBoard, pooled_fretboard
+from fretboardgtr.fretboards.config import FretBoardConfig, FretBoardGeneralConfig
+from fretboardgtr.notes_creators import NotesContainer, ScaleFromName
+
+NUMBER = 200
+TUNING = ["F#", "B", "E", "A", "D", "G", "B", "E"]
+
+
+def note_by_note(fretboard: FretBoard, scale: NotesContainer) -> None:
+    """Previous add_notes, one add_note per string and note."""
+    for string_no, _ in enumerate(fretboard.tuning):
+        for note in scale.notes:
+            fretboard.add_note(string_no, note, scale.root)
+
+
+def per_call(function: Callable[[], object]) -> float:
+    """Best time of a call in milliseconds."""
+    return min(timeit.repeat(function, number=NUMBER, repeat=3)) / NUMBER * 1e3
+
+
+def notes_memory(config: FretBoardConfig, compact: bool) -> int:
+    """Memory allocated by the notes of a scale over the whole neck, in bytes."""
+    fretboard = FretBoard.from_template(TUNING, config, compact=compact)
+    scale = ScaleFromName(root="E", mode="Dominantbebop").build()
+    fretboard.add_notes(scale)
+    fretboard.reset()
+    tracemalloc.start()
+    fretboard.add_notes(scale)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main() -> None:
+    config = FretBoardConfig(general=FretBoardGeneralConfig(first_fret=1, last_fret=24))
+    fretboard = FretBoard(tuning=TUNING, config=config)
+    print(f"{'scale':>16} {'notes':>6} {'one by one':>11} {'batched':>9}")
+    for mode in ["Majorpentatonic", "Ionian", "Dominantbebop"]:
+        scale = ScaleFromName(root="E", mode=mode).build()
+
+        def one_by_one() -> None:
+            fretboard.elements.notes = []
+            note_by_note(fretboard, scale)
+
+        def batched() -> None:
+            fretboard.elements.notes = []
+            fretboard.add_notes(scale)
+
+        batched()
+        number_of_notes = len(fretboard.elements.notes)
+        one_by_one_time = per_call(one_by_one)
+        batched_time = per_call(batched)
+        print(
+            f"{mode:>16} {number_of_notes:>6} {one_by_one_time:>9.2f}ms"
+            f" {batched_time:>7.2f}ms {one_by_one_time / batched_time:>5.1f}x"
+        )
+
+    init_time = per_call(lambda: FretBoard(tuning=TUNING, config=config))
+    template_time = per_call(lambda: FretBoard.from_template(TUNING, config))
+    print(
+        f"\nconstruction: init {init_time * 1e3:.1f}us,"
+        f" template {template_time * 1e3:.1f}us, {init_time / template_time:.1f}x"
+    )
+
+    fingering = [None, None, 0, 2, 2, 1, 0, 0]
+
+    def new_fretboard() -> None:
+        FretBoard(tuning=TUNING, config=config).add_fingering(fingering)
+
+    def pooled() -> None:
+        with pooled_fretboard(TUNING, config) as fretboard:
+            fretboard.add_fingering(fingering)
+
+    new_time = per_call(new_fretboard)
+    pooled_time = per_call(pooled)
+    print(
+        f"fingering: new {new_time * 1e3:.1f}us,"
+        f" pooled {pooled_time * 1e3:.1f}us, {new_time / pooled_time:.1f}x"
+    )
+
+    memory = notes_memory(config, compact=False)
+    compact_memory = notes_memory(config, compact=True)
+    print(
+        f"notes memory: objects {memory / 1024:.1f}KiB,"
+        f" compact {compact_memory / 1024:.1f}KiB, {memory / compact_memory:.1f}x"
+    )
+
+    scale = ScaleFromName(root="E", mode="Ionian").build()
+
+    def sized(lazy: bool) -> Callable[[], object]:
+        def build() -> object:
+            fretboard = FretBoard(tuning=TUNING, config=config, lazy=lazy)
+            fretboard.add_notes(scale)
+            return fretboard.get_size()
+
+        return build
+
+    eager_time = per_call(sized(False))
+    lazy_time = per_call(sized(True))
+    print(
+        f"size only: eager {eager_time * 1e3:.1f}us,"
+        f" lazy {lazy_time * 1e3:.1f}us, {eager_time / lazy_time:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Benchmark of the pitch class tables of utils against the previous scans,
+and of the batch functions against a loop of single calls.
+
+Run it with :
+
+    python benchmarks/bench_utils.py
+"""
+import random
+import timeit
+from typing import Callable, List
+
+from fretboardgtr.constants import CHROMATICS_NOTES, FLAT_ALTERATIONS
+from fretboardgtr.utils import (
+    HAS_NUMPY,
+    chromatic_position_from_root,
+    get_note_from_index,
+    intervals_to_names,
+    note_to_interval,
+    note_to_interval_name,
+    notes_to_intervals,
+    np,
+)
+
+NUMBER = 100_000
+BATCH_SIZE = 1_000_000
+
+
+def scan_chromatics_from_root(root: str) -> List[str]:
+    notes = []
+    root_idx = CHROMATICS_NOTES.index(root)
+    for i, _ in enumerate(CHROMATICS_NOTES):
+        notes.append(CHROMATICS_NOTES[(root_idx + i) % 12])
+    return notes
+
+
+def scan_to_sharp_note(note: str) -> str:
+    if note in FLAT_ALTERATIONS:
+        note = FLAT_ALTERATIONS[note]
+    return note
+
+
+def scan_get_note_from_index(index: int, root: str) -> str:
+    return scan_chromatics_from_root(root)[index % 12]
+
+
+def scan_chromatic_position_from_root(note: str, root: str) -> int:
+    idx = 0
+    for _idx, chromatic_note in enumerate(scan_chromatics_from_root(root)):
+        if chromatic_note == scan_to_sharp_note(note):
+            idx = _idx
+    return idx
+
+
+def scan_note_to_interval(note: str, root: str) -> int:
+    return scan_chromatic_position_from_root(scan_to_sharp_note(note), root)
+
+
+def per_call(function: Callable[[], object]) -> float:
+    """Best time of a call in microseconds."""
+    return min(timeit.repeat(function, number=NUMBER, repeat=3)) / NUMBER * 1e6
+
+
+def main() -> None:
+    cases = {
+        "get_note_from_index": (
+            lambda: scan_get_note_from_index(7, "C"),
+            lambda: get_note_from_index(7, "C"),
+        ),
+        "chromatic_position_from_root": (
+            lambda: scan_chromatic_position_from_root("Bb", "C"),
+            lambda: chromatic_position_from_root("Bb", "C"),
+        ),
+        "note_to_interval": (
+            lambda: scan_note_to_interval("G", "C"),
+            lambda: note_to_interval("G", "C"),
+        ),
+    }
+    print(f"{'function':>30} {'scan':>9} {'tables':>9}")
+    for name, (scan, tables) in cases.items():
+        scan_time = per_call(scan)
+        tables_time = per_call(tables)
+        print(
+            f"{name:>30} {scan_time:>7.2f}us {tables_time:>7.2f}us"
+            f" {scan_time / tables_time:>5.1f}x"
+        )
+
+    rng = random.Random(0)
+    notes = rng.choices(CHROMATICS_NOTES + list(FLAT_ALTERATIONS), k=BATCH_SIZE)
+    roots = rng.choices(CHROMATICS_NOTES, k=BATCH_SIZE)
+    loop_time = min(
+        timeit.repeat(
+            lambda: [note_to_interval_name(n, r) for n, r in zip(notes, roots)],
+            number=1,
+            repeat=3,
+        )
+    )
+    if HAS_NUMPY:
+        # Arrays in, arrays out : no Python object per interval
+        batch_notes, batch_roots = np.array(notes), np.array(roots)
+    else:
+        batch_notes, batch_roots = notes, roots
+    batch_time = min(
+        timeit.repeat(
+            lambda: intervals_to_names(notes_to_intervals(batch_notes, batch_roots)),
+            number=1,
+            repeat=3,
+        )
+    )
+    print(
+        f"\n{BATCH_SIZE} interval names: loop {loop_time:.2f}s,"
+        f" batch {batch_time:.2f}s, {loop_time / batch_time:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""Precompute the chord fingerings of many roots, qualities and tunings.
+
+The catalog can be built from python with build_voicing_catalog or from
+the command line :
+
+    python -m fretboardgtr.catalog --tuning E,A,D,G,B,E --workers 8 catalog.jsonl
+"""
+import argparse
+import json
+import os
+from dataclasses import asdict, dataclass
+from itertools import product
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from fretboardgtr.constants import CHORDS_DICT_ESSENTIAL, CHROMATICS_NOTES
+from fretboardgtr.notes_creators import ChordFromName
+
+_Task = Tuple[Tuple[str, ...], str, str, int, int, int]
+
+
+@dataclass
+class ChordVoicings:
+    """Fingerings of a chord for a given tuning."""
+
+    tuning: List[str]
+    root: str
+    quality: str
+    fingerings: List[List[Optional[int]]]
+
+
+def _build_voicings(task: _Task) -> ChordVoicings:
+    tuning, root, quality, max_spacing, min_notes_in_chord, number_of_fingers = task
+    fingerings = (
+        ChordFromName(root=root, quality=quality)
+        .build()
+        .get_chord_fingerings(
+            list(tuning), max_spacing, min_notes_in_chord, number_of_fingers
+        )
+    )
+    return ChordVoicings(list(tuning), root, quality, fingerings)
+
+
+def build_voicing_catalog(
+    tunings: Sequence[Sequence[str]],
+    qualities: Optional[Sequence[str]] = None,
+    roots: Optional[Sequence[str]] = None,
+    workers: Optional[int] = 1,
+    chunksize: int = 4,
+    max_spacing: int = 5,
+    min_notes_in_chord: int = 2,
+    number_of_fingers: int = 4,
+) -> Iterator[ChordVoicings]:
+    """Lazily build the fingerings of every tuning, quality and root.
+
+    The chords are spread over a pool of worker processes by chunks of
+    chunksize chords. They are yielded as soon as they are built, in the
+    order of the tunings, then qualities, then roots.
+
+    Parameters
+    ----------
+    tunings : Sequence[Sequence[str]]
+        Tunings to build the fingerings for
+    qualities : Optional[Sequence[str]]
+        Chord qualities, by default every quality of CHORDS_DICT_ESSENTIAL
+    roots : Optional[Sequence[str]]
+        Chord roots, by default the 12 chromatic notes
+    workers : Optional[int]
+        Number of worker processes, by default 1 (no pool). None uses
+        every available core.
+    chunksize : int
+        Number of chords sent at once to a worker
+    max_spacing : int
+        Maximum spacing between notes
+    min_notes_in_chord : int
+        Minimum number of notes in chord
+    number_of_fingers : int
+        Number of fingers allowed
+
+    Yields
+    ------
+    ChordVoicings
+        Fingerings of a chord for a tuning
+    """
+    qualities = list(CHORDS_DICT_ESSENTIAL) if qualities is None else qualities
+    roots = CHROMATICS_NOTES if roots is None else roots
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"Number of workers should be at least 1. Got {workers}")
+
+    tasks: Iterator[_Task] = (
+        (
+            tuple(tuning),
+            root,
+            quality,
+            max_spacing,
+            min_notes_in_chord,
+            number_of_fingers,
+        )
+        for tuning, quality, root in product(tunings, qualities, roots)
+    )
+    if workers == 1:
+        yield from map(_build_voicings, tasks)
+        return
+
+    with Pool(workers) as pool:
+        yield from pool.imap(_build_voicings, tasks, chunksize=chunksize)
+
+
+def write_voicing_catalog(
+    catalog: Iterable[ChordVoicings], to: Union[Path, str]
+) -> int:
+    """Write the catalog as JSON lines, one chord per line.
+
+    Each chord is written as soon as it is consumed from the catalog.
+
+    Parameters
+    ----------
+    catalog : Iterable[ChordVoicings]
+        Catalog to write, for example from build_voicing_catalog
+    to : Union[Path, str]
+        Path to write to
+
+    Returns
+    -------
+    int
+        Number of chords written
+    """
+    to = Path(to)
+    to.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    with open(to, "w") as file:
+        for voicings in catalog:
+            file.write(json.dumps(asdict(voicings)) + "\n")
+            written += 1
+    return written
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="fretboardgtr-catalog",
+        description="Precompute the chord fingerings of roots, qualities and tunings",
+    )
+    parser.add_argument("output", type=Path, help="JSON lines file to write")
+    parser.add_argument(
+        "--index",
+        action="store_true",
+        help="Write a memory-mapped voicing index instead of JSON lines",
+    )
+    parser.add_argument(
+        "--tuning",
+        action="append",
+        required=True,
+        help="Comma separated tuning, eg E,A,D,G,B,E. Can be repeated",
+    )
+    parser.add_argument(
+        "--quality",
+        action="append",
+        help="Chord quality. Can be repeated. Default to every quality",
+    )
+    parser.add_argument(
+        "--root",
+        action="append",
+        help="Chord root. Can be repeated. Default to the 12 chromatic notes",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes. Default to the number of cores",
+    )
+    parser.add_argument("--chunksize", type=int, default=4)
+    parser.add_argument("--max-spacing", type=int, default=5)
+    parser.add_argument("--min-notes-in-chord", type=int, default=2)
+    parser.add_argument("--number-of-fingers", type=int, default=4)
+    parsed = parser.parse_args(args)
+
+    tunings = [tuning.split(",") for tuning in parsed.tuning]
+    if parsed.index:
+        from fretboardgtr.voicing_index import build_voicing_index
+
+        written = build_voicing_index(
+            parsed.output,
+            tunings,
+            parsed.quality,
+            parsed.root,
+            workers=parsed.workers,
+            chunksize=parsed.chunksize,
+            max_spacing=parsed.max_spacing,
+            min_notes_in_chord=parsed.min_notes_in_chord,
+            number_of_fingers=parsed.number_of_fingers,
+        )
+        print(f"{written} chords indexed in {parsed.output}")
+        return None
+
+    catalog = build_voicing_catalog(
+        tunings,
+        parsed.quality,
+        parsed.root,
+        workers=parsed.workers,
+        chunksize=parsed.chunksize,
+        max_spacing=parsed.max_spacing,
+        min_notes_in_chord=parsed.min_notes_in_chord,
+        number_of_fingers=parsed.number_of_fingers,
+    )
+    written = write_voicing_catalog(catalog, parsed.output)
+    print(f"{written} chords written to {parsed.output}")
+
+
+if __name__ == "__main__":
+    main()
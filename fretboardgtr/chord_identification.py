@@ -0,0 +1,148 @@
+"""Name the chord played by a fingering.
+
+Every root and quality of CHORDS_DICT_ESSENTIAL is indexed once by its
+pitch class bitmask and bass pitch class, so identifying a fingering is a
+single dictionary lookup.
+"""
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from fretboardgtr.constants import CHORDS_DICT_ESSENTIAL, CHROMATICS_NOTES
+from fretboardgtr.utils import note_to_pitch_class
+
+
+class ChordMatch(NamedTuple):
+    """Chord matching the notes of a fingering.
+
+    inversion is the position of the bass among the sorted chord tones, 0
+    for a chord in root position.
+    """
+
+    root: str
+    quality: str
+    bass: str
+    inversion: int
+
+    @property
+    def name(self) -> str:
+        """Name of the chord, eg C, Cm7 or C/E."""
+        name = self.root if self.quality == "M" else f"{self.root}{self.quality}"
+        if self.inversion:
+            name += f"/{self.bass}"
+        return name
+
+
+@lru_cache(maxsize=None)
+def _chord_table() -> Dict[Tuple[int, int], Tuple[ChordMatch, ...]]:
+    """Get the chords of each (pitch class bitmask, bass pitch class).
+
+    Chords in root position come first, then in the order of
+    CHORDS_DICT_ESSENTIAL and of the roots.
+    """
+    matches: Dict[Tuple[int, int], List[Tuple[int, ChordMatch]]] = {}
+    for root_pitch_class, root in enumerate(CHROMATICS_NOTES):
+        for quality, intervals in CHORDS_DICT_ESSENTIAL.items():
+            chord_tones = sorted({interval % 12 for interval in intervals})
+            mask = 0
+            for interval in chord_tones:
+                mask |= 1 << (root_pitch_class + interval) % 12
+            for inversion, interval in enumerate(chord_tones):
+                bass_pitch_class = (root_pitch_class + interval) % 12
+                match = ChordMatch(
+                    root, quality, CHROMATICS_NOTES[bass_pitch_class], inversion
+                )
+                matches.setdefault((mask, bass_pitch_class), []).append(
+                    (inversion, match)
+                )
+    return {
+        key: tuple(
+            match for _, match in sorted(candidates, key=lambda item: item[0] != 0)
+        )
+        for key, candidates in matches.items()
+    }
+
+
+def _identify(
+    fingering: Sequence[Optional[int]], open_pitch_classes: Sequence[int]
+) -> List[ChordMatch]:
+    mask = 0
+    bass_pitch_class = None
+    for fret, open_pitch_class in zip(fingering, open_pitch_classes):
+        if fret is None:
+            continue
+        pitch_class = (open_pitch_class + fret) % 12
+        if bass_pitch_class is None:
+            bass_pitch_class = pitch_class
+        mask |= 1 << pitch_class
+    if bass_pitch_class is None:
+        return []
+    return list(_chord_table().get((mask, bass_pitch_class), ()))
+
+
+def identify_chord(
+    fingering: Sequence[Optional[int]], tuning: Sequence[str]
+) -> List[ChordMatch]:
+    """Get the chords whose notes are exactly the notes of the fingering.
+
+    The bass is the note of the first played string of the tuning.
+
+    Parameters
+    ----------
+    fingering : Sequence[Optional[int]]
+        Fret of each string, None for muted strings
+    tuning : Sequence[str]
+        Note of each open string
+
+    Returns
+    -------
+    List[ChordMatch]
+        Matching chords, the ones in root position first. Empty if no chord
+        of CHORDS_DICT_ESSENTIAL matches.
+
+    Raises
+    ------
+    ValueError
+        If the fingering and the tuning have not the same number of strings
+
+    Example
+    -------
+    >>> identify_chord([None, 3, 2, 0, 1, 0], ["E", "A", "D", "G", "B", "E"])
+        [ChordMatch(root='C', quality='M', bass='C', inversion=0),
+         ChordMatch(root='E', quality='m#5', bass='C', inversion=2)]
+    """
+    return identify_chords([fingering], tuning)[0]
+
+
+def identify_chords(
+    fingerings: Iterable[Sequence[Optional[int]]], tuning: Sequence[str]
+) -> List[List[ChordMatch]]:
+    """Get the matching chords of many fingerings of the same tuning.
+
+    See identify_chord.
+
+    Parameters
+    ----------
+    fingerings : Iterable[Sequence[Optional[int]]]
+        Fingerings to identify
+    tuning : Sequence[str]
+        Note of each open string
+
+    Returns
+    -------
+    List[List[ChordMatch]]
+        Matching chords of each fingering
+
+    Raises
+    ------
+    ValueError
+        If a fingering and the tuning have not the same number of strings
+    """
+    open_pitch_classes = [note_to_pitch_class(note) for note in tuning]
+    identified = []
+    for fingering in fingerings:
+        if len(fingering) != len(tuning):
+            raise ValueError(
+                f"Fingering {fingering} should have one fret per string of {tuning}"
+            )
+        identified.append(_identify(fingering, open_pitch_classes))
+    return identified
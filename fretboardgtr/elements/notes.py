@@ -1,5 +1,7 @@
-from dataclasses import dataclass
-from typing import Optional, Tuple
+import copy
+from dataclasses import FrozenInstanceError, dataclass, fields
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, Optional, Tuple, Union, overload
 
 from fretboardgtr.constants import BLACK, WHITE
 
@@ -33,32 +35,43 @@ class OpenNote(FretBoardElement):
         position: Tuple[float, float],
         config: Optional[OpenNoteConfig] = None,
     ):
-        self.config = config if config else OpenNoteConfig()
+        self._config = config if config else OpenNoteConfig()
         self.name = name
         self.x = position[0]
         self.y = position[1]
 
+    @property
+    def config(self) -> OpenNoteConfig:
+        """Configuration of the note, a shared style is copied when read."""
+        self._config = _editable(self._config)
+        return self._config
+
+    @config.setter
+    def config(self, config: OpenNoteConfig) -> None:
+        self._config = config
+
     def get_svg(self) -> svgwrite.base.BaseElement:
         """Convert the OpenNote to a svgwrite object.
 
         This maps the OpenNoteConfig configuration attributes to the svg
         attributes
         """
+        config = self._config
         note = svgwrite.container.Group()
         circle = svgwrite.shapes.Circle(
             (self.x, self.y),
-            r=self.config.radius,
-            fill=self.config.color,
-            stroke=self.config.stroke_color,
-            stroke_width=self.config.stroke_width,
+            r=config.radius,
+            fill=config.color,
+            stroke=config.stroke_color,
+            stroke_width=config.stroke_width,
         )
         text = svgwrite.text.Text(
             self.name,
             insert=(self.x, self.y),
             dy=[TEXT_OFFSET],
-            font_size=self.config.fontsize,
-            fill=self.config.text_color,
-            font_weight=self.config.fontweight,
+            font_size=config.fontsize,
+            fill=config.text_color,
+            font_weight=config.fontweight,
             style=TEXT_STYLE,
         )
         note.add(circle)
@@ -86,35 +99,154 @@ class FrettedNote(FretBoardElement):
         position: Tuple[float, float],
         config: Optional[FrettedNoteConfig] = None,
     ):
-        self.config = config if config else FrettedNoteConfig()
+        self._config = config if config else FrettedNoteConfig()
         self.name = name
         self.x = position[0]
         self.y = position[1]
 
+    @property
+    def config(self) -> FrettedNoteConfig:
+        """Configuration of the note, a shared style is copied when read."""
+        self._config = _editable(self._config)
+        return self._config
+
+    @config.setter
+    def config(self, config: FrettedNoteConfig) -> None:
+        self._config = config
+
     def get_svg(self) -> svgwrite.base.BaseElement:
         """Convert the FrettedNote to a svgwrite object.
 
         This maps the FrettedNoteConfig configuration attributes to the
         svg attributes
         """
+        config = self._config
         note = svgwrite.container.Group()
         circle = svgwrite.shapes.Circle(
             (self.x, self.y),
-            r=self.config.radius,
-            fill=self.config.color,
-            stroke=self.config.stroke_color,
-            stroke_width=self.config.stroke_width,
+            r=config.radius,
+            fill=config.color,
+            stroke=config.stroke_color,
+            stroke_width=config.stroke_width,
         )
 
         text = svgwrite.text.Text(
             self.name,
             insert=(self.x, self.y),
             dy=[TEXT_OFFSET],
-            font_size=self.config.fontsize,
-            fill=self.config.text_color,
+            font_size=config.fontsize,
+            fill=config.text_color,
             font_weight="bold",
             style=TEXT_STYLE,
         )
         note.add(circle)
         note.add(text)
         return note
+
+
+class _SharedStyle:
+    """Read-only note configuration, shared by every note of the same style.
+
+    Shared styles are built by get_note_style and should be replaced, not
+    modified. Reading the config of a note gives an editable copy of its
+    style, see _editable.
+    """
+
+    _config_type: ClassVar[type]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __hash__(self) -> int:
+        return hash((type(self), tuple(vars(self).values())))
+
+    def __copy__(self) -> Any:
+        # Copies are editable configurations, as before the styles were shared
+        return self._config_type(**vars(self))
+
+
+class OpenNoteStyle(_SharedStyle, OpenNoteConfig):
+    """Shared, read-only OpenNoteConfig."""
+
+    _config_type = OpenNoteConfig
+
+
+class FrettedNoteStyle(_SharedStyle, FrettedNoteConfig):
+    """Shared, read-only FrettedNoteConfig."""
+
+    _config_type = FrettedNoteConfig
+
+
+def _editable(config: Any) -> Any:
+    """Copy a shared style into a configuration owned by a single note."""
+    if isinstance(config, _SharedStyle):
+        return copy.copy(config)
+    return config
+
+
+_STYLE_TYPES: Dict[type, type] = {
+    OpenNoteConfig: OpenNoteStyle,
+    OpenNoteStyle: OpenNoteStyle,
+    FrettedNoteConfig: FrettedNoteStyle,
+    FrettedNoteStyle: FrettedNoteStyle,
+}
+
+
+@lru_cache(maxsize=1024)
+def _note_style(style_type: type, values: Tuple[Any, ...]) -> Any:
+    style: Any = object.__new__(style_type)
+    for field, value in zip(fields(style_type), values):
+        object.__setattr__(style, field.name, value)
+    return style
+
+
+@overload
+def get_note_style(
+    config: OpenNoteConfig, color: Optional[str] = None
+) -> OpenNoteConfig:
+    ...
+
+
+@overload
+def get_note_style(
+    config: FrettedNoteConfig, color: Optional[str] = None
+) -> FrettedNoteConfig:
+    ...
+
+
+def get_note_style(
+    config: Union[OpenNoteConfig, FrettedNoteConfig], color: Optional[str] = None
+) -> Union[OpenNoteConfig, FrettedNoteConfig]:
+    """Get the shared style of a note configuration with another color.
+
+    There is a single read-only style for each distinct configuration and
+    color, so notes of the same style reference the same object.
+    Subclasses of the configurations are copied instead. Styles only save
+    memory, the SVG of each note still holds its own style attributes.
+
+    Parameters
+    ----------
+    config : Union[OpenNoteConfig, FrettedNoteConfig]
+        Base configuration
+    color : Optional[str]
+        Color of the style, by default the color of the configuration
+
+    Returns
+    -------
+    Union[OpenNoteConfig, FrettedNoteConfig]
+        Shared style
+    """
+    style_type = _STYLE_TYPES.get(type(config))
+    if style_type is None:
+        config = copy.copy(config)
+        if color is not None:
+            config.color = color
+        return config
+
+    values = {field.name: getattr(config, field.name) for field in fields(config)}
+    if color is not None:
+        values["color"] = color
+    return _note_style(style_type, tuple(values.values()))
@@ -0,0 +1,510 @@
+import heapq
+from dataclasses import dataclass
+from itertools import product
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+from fretboardgtr.utils import np
+
+# Maximum number of combinations evaluated at once by the vectorized search
+VECTORIZED_BLOCK_SIZE = 2**18
+# Highest fret of the vectorized search, frets are bits of int64 values
+MAX_VECTORIZED_FRET = 62
+
+
+def _reduce_fingering(
+    combination: Sequence[int],
+    max_spacing: int,
+    min_notes_in_chord: int,
+) -> List[Optional[int]]:
+    """Mute the lowest fretted strings until the fingering fits the spacing.
+
+    The lowest fretted notes are muted one by one (first string first on ties)
+    while the spacing between fretted notes exceeds max_spacing, unless fewer
+    than min_notes_in_chord fretted notes remain. Open strings are never muted.
+    """
+    fretted = sorted(
+        (fret, string_no) for string_no, fret in enumerate(combination) if fret != 0
+    )
+    reduced: List[Optional[int]] = list(combination)
+    if not fretted:
+        return reduced
+
+    highest = fretted[-1][0]
+    out_of_reach = 0
+    while highest - fretted[out_of_reach][0] > max_spacing:
+        out_of_reach += 1
+
+    to_mute = min(out_of_reach, max(0, len(fretted) - min_notes_in_chord + 1))
+    for _, string_no in fretted[:to_mute]:
+        reduced[string_no] = None
+    return reduced
+
+
+def search_chord_fingerings(
+    scale: List[List[int]],
+    pitch_classes: List[List[int]],
+    chord_mask: int,
+    max_spacing: int = 5,
+    min_notes_in_chord: int = 2,
+    number_of_fingers: int = 4,
+    keep_branch: Optional[Callable[[List[int], int], bool]] = None,
+) -> Iterator[List[Optional[int]]]:
+    """Yield the chord fingerings using a pruned depth-first search.
+
+    Strings are visited one by one and a branch is dropped as soon as :
+        the distinct fretted positions go over number_of_fingers
+        the chord tones still missing cannot fit on the remaining strings
+
+    Fretted notes that are more than max_spacing below the highest fretted
+    note of the branch will be muted, so they do not count as chord tones.
+
+    The fingerings are yielded in the same order as an exhaustive
+    enumeration of every combination of the scale.
+
+    Parameters
+    ----------
+    scale : List[List[int]]
+        Sorted frets available on each string
+    pitch_classes : List[List[int]]
+        Pitch class bit (1 << pitch class) of each fret of the scale
+    chord_mask : int
+        Bitmask of the pitch classes that must appear in the chord
+    max_spacing : int
+        Maximum spacing between notes
+    min_notes_in_chord : int
+        Minimum number of notes in chord
+    number_of_fingers : int
+        Number of fingers allowed
+    keep_branch : Optional[Callable[[List[int], int], bool]]
+        Called with the frets of the strings visited so far and their highest
+        fret, the branch is dropped if it returns False
+
+    Yields
+    ------
+    List[Optional[int]]
+        Fingering with None for muted strings
+    """
+    number_of_strings = len(scale)
+    # Fretted notes out of the spacing are only guaranteed to be muted when
+    # the chord cannot run out of notes before, see _reduce_fingering.
+    out_of_reach_muted = min_notes_in_chord <= 2
+    combination: List[int] = []
+    combination_bits: List[int] = []
+    fret_counts: List[int] = [0] * (max((max(s) for s in scale if s), default=0) + 1)
+
+    def reachable_mask(highest: int) -> int:
+        mask = 0
+        for fret, bit in zip(combination, combination_bits):
+            if fret == 0 or not out_of_reach_muted or highest - fret <= max_spacing:
+                mask |= bit
+        return mask
+
+    def visit(string_no: int, distinct: int, highest: int) -> Iterator[List[int]]:
+        if string_no == number_of_strings:
+            yield combination
+            return
+
+        remaining_strings = number_of_strings - string_no - 1
+        for fret, bit in zip(scale[string_no], pitch_classes[string_no]):
+            new_distinct = distinct
+            if fret != 0 and fret_counts[fret] == 0:
+                new_distinct += 1
+                if new_distinct > number_of_fingers:
+                    continue
+            new_highest = max(highest, fret)
+
+            combination.append(fret)
+            combination_bits.append(bit)
+            missing = chord_mask & ~reachable_mask(new_highest)
+            if bin(missing).count("1") <= remaining_strings and (
+                keep_branch is None or keep_branch(combination, new_highest)
+            ):
+                fret_counts[fret] += 1
+                yield from visit(string_no + 1, new_distinct, new_highest)
+                fret_counts[fret] -= 1
+            combination.pop()
+            combination_bits.pop()
+
+    for combination_found in visit(0, 0, 0):
+        fingering = _reduce_fingering(
+            combination_found, max_spacing, min_notes_in_chord
+        )
+        mask = 0
+        for fret, bit in zip(fingering, combination_bits):
+            if fret is not None:
+                mask |= bit
+        if mask == chord_mask:
+            yield fingering
+
+
+@dataclass
+class PlayabilityWeights:
+    """Weights of the penalties and bonus of playability_score.
+
+    Every weight should be positive, a weight of 0 disables its term.
+    """
+
+    span: float = 1.0
+    barre: float = 2.0
+    muted_interior: float = 3.0
+    position: float = 0.5
+    root_in_bass: float = 2.0
+
+    def __post_init__(self) -> None:
+        for name, weight in vars(self).items():
+            if weight < 0:
+                raise ValueError(f"Weight {name} should be positive. Got {weight}")
+
+
+def playability_score(
+    fingering: Sequence[Optional[int]],
+    open_pitch_classes: Sequence[int],
+    root_pitch_class: int,
+    weights: Optional[PlayabilityWeights] = None,
+) -> float:
+    """Score how easy a fingering is to play, the higher the better.
+
+    The score is 0 minus the weighted penalties, plus a bonus :
+        span              distance between the lowest and highest fretted notes
+        barre             fretted strings sharing a fret with another string
+        muted_interior    muted strings between the first and last played ones
+        position          highest fretted note, lower positions are preferred
+        root_in_bass      bonus if the lowest played string is the chord root
+
+    Parameters
+    ----------
+    fingering : Sequence[Optional[int]]
+        Fingering with None for muted strings
+    open_pitch_classes : Sequence[int]
+        Pitch class of each open string
+    root_pitch_class : int
+        Pitch class of the chord root
+    weights : Optional[PlayabilityWeights]
+        Weights of each term, by default PlayabilityWeights()
+
+    Returns
+    -------
+    float
+        Playability score
+    """
+    weights = PlayabilityWeights() if weights is None else weights
+    fretted = [fret for fret in fingering if fret is not None and fret != 0]
+    played = [string_no for string_no, fret in enumerate(fingering) if fret is not None]
+
+    span = max(fretted) - min(fretted) if fretted else 0
+    barre = len(fretted) - len(set(fretted))
+    muted_interior = 0
+    if played:
+        muted_interior = played[-1] - played[0] + 1 - len(played)
+    position = max(fretted, default=0)
+
+    score = -(
+        weights.span * span
+        + weights.barre * barre
+        + weights.muted_interior * muted_interior
+        + weights.position * position
+    )
+    if played:
+        bass_string = played[0]
+        bass_fret = fingering[bass_string] or 0
+        if (open_pitch_classes[bass_string] + bass_fret) % 12 == root_pitch_class:
+            score += weights.root_in_bass
+    return score
+
+
+def _playability_upper_bound(
+    combination: List[int],
+    highest: int,
+    open_pitch_classes: Sequence[int],
+    root_pitch_class: int,
+    max_spacing: int,
+    min_notes_in_chord: int,
+    weights: PlayabilityWeights,
+) -> float:
+    """Get a score that no fingering starting with combination can beat.
+
+    The highest fret of the fingering is at least highest and is never muted.
+    Fretted notes within max_spacing of it are never muted either. When
+    min_notes_in_chord <= 2, the ones out of max_spacing are always muted.
+    """
+    fretted = [fret for fret in combination if fret != 0]
+    lowest = min((fret for fret in fretted if highest - fret <= max_spacing), default=0)
+    # Span and position penalties, unless the highest fret moves far enough
+    # for the lowest note to be muted
+    penalty = min(
+        weights.position * highest + weights.span * (highest - lowest),
+        weights.position * (lowest + max_spacing + 1),
+    )
+
+    out_of_reach_muted = min_notes_in_chord <= 2
+    surely_muted = [
+        fret != 0 and out_of_reach_muted and highest - fret > max_spacing
+        for fret in combination
+    ]
+    played = [string_no for string_no, fret in enumerate(combination) if fret == 0]
+    if played:
+        # Muted strings between two open strings
+        muted_interior = sum(surely_muted[played[0] : played[-1]])
+        penalty += weights.muted_interior * muted_interior
+
+    # The bass is known once an open string follows surely muted strings only
+    bass_string = None
+    for string_no, fret in enumerate(combination):
+        if fret == 0:
+            bass_string = string_no
+        if not surely_muted[string_no]:
+            break
+
+    bonus = weights.root_in_bass
+    if bass_string is not None and open_pitch_classes[bass_string] != root_pitch_class:
+        bonus = 0
+    return bonus - penalty
+
+
+def best_chord_fingerings(
+    scale: List[List[int]],
+    pitch_classes: List[List[int]],
+    chord_mask: int,
+    open_pitch_classes: Sequence[int],
+    root_pitch_class: int,
+    k: int = 5,
+    max_spacing: int = 5,
+    min_notes_in_chord: int = 2,
+    number_of_fingers: int = 4,
+    weights: Optional[PlayabilityWeights] = None,
+) -> List[List[Optional[int]]]:
+    """Get the k most playable chord fingerings, best first.
+
+    The k best fingerings found so far are kept in a heap. The highest
+    fretted note of a branch is never muted, so it bounds the position
+    penalty and the score of every fingering of the branch. Branches
+    that cannot beat the k-th best fingering are dropped.
+
+    Gives the same fingerings as sorting every fingering of
+    search_chord_fingerings by decreasing score (first found first on
+    ties) and keeping the first k.
+
+    Parameters
+    ----------
+    scale : List[List[int]]
+        Sorted frets available on each string
+    pitch_classes : List[List[int]]
+        Pitch class bit (1 << pitch class) of each fret of the scale
+    chord_mask : int
+        Bitmask of the pitch classes that must appear in the chord
+    open_pitch_classes : Sequence[int]
+        Pitch class of each open string
+    root_pitch_class : int
+        Pitch class of the chord root
+    k : int
+        Number of fingerings to get
+    max_spacing : int
+        Maximum spacing between notes
+    min_notes_in_chord : int
+        Minimum number of notes in chord
+    number_of_fingers : int
+        Number of fingers allowed
+    weights : Optional[PlayabilityWeights]
+        Weights of the playability score, by default PlayabilityWeights()
+
+    Returns
+    -------
+    List[List[Optional[int]]]
+        At most k fingerings with None for muted strings, best first
+
+    Raises
+    ------
+    ValueError
+        If k is negative
+    """
+    if k < 0:
+        raise ValueError(f"k should be positive. Got {k}")
+    if k == 0:
+        return []
+    weights = PlayabilityWeights() if weights is None else weights
+    # Min heap of (score, -order, fingering), the worst kept fingering first
+    best: List[Tuple[float, int, List[Optional[int]]]] = []
+
+    def keep_branch(combination: List[int], highest: int) -> bool:
+        if len(best) < k:
+            return True
+        upper_bound = _playability_upper_bound(
+            combination,
+            highest,
+            open_pitch_classes,
+            root_pitch_class,
+            max_spacing,
+            min_notes_in_chord,
+            weights,
+        )
+        return upper_bound > best[0][0]
+
+    fingerings = search_chord_fingerings(
+        scale,
+        pitch_classes,
+        chord_mask,
+        max_spacing,
+        min_notes_in_chord,
+        number_of_fingers,
+        keep_branch,
+    )
+    for order, fingering in enumerate(fingerings):
+        score = playability_score(
+            fingering, open_pitch_classes, root_pitch_class, weights
+        )
+        if len(best) < k:
+            heapq.heappush(best, (score, -order, fingering))
+        elif score > best[0][0]:
+            heapq.heapreplace(best, (score, -order, fingering))
+    return [fingering for _, _, fingering in sorted(best, reverse=True)]
+
+
+def _popcount(values: "np.ndarray") -> "np.ndarray":
+    """Count the bits set in each value of an int64 array."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values)
+    as_bytes = values.astype(np.int64).view(np.uint8).reshape(-1, 8)
+    return np.unpackbits(as_bytes, axis=1).sum(axis=1)
+
+
+def _vectorized_block(
+    combinations: "np.ndarray",
+    bits: "np.ndarray",
+    chord_mask: int,
+    max_spacing: int,
+    min_notes_in_chord: int,
+    number_of_fingers: int,
+) -> List[List[Optional[int]]]:
+    """Filter and reduce a block of combinations with array operations.
+
+    Each column of the (strings, combinations) arrays is a combination.
+    Mirrors _reduce_fingering and the chord tones coverage check of
+    search_chord_fingerings on each of them.
+    """
+    # Distinct fretted positions
+    used_frets = np.bitwise_or.reduce(np.left_shift(1, combinations), axis=0)
+    keep = _popcount(used_frets & ~1) <= number_of_fingers
+    combinations, bits = combinations[:, keep], bits[:, keep]
+
+    # Lowest fretted notes to mute, first string first on ties
+    fretted = combinations != 0
+    muted = fretted & (combinations.max(axis=0) - combinations > max_spacing)
+    if min_notes_in_chord > 2:
+        to_mute = np.minimum(
+            muted.sum(axis=0),
+            np.maximum(0, fretted.sum(axis=0) - min_notes_in_chord + 1),
+        )
+        for string_no, string_frets in enumerate(combinations):
+            lower = (combinations < string_frets) | (
+                (combinations == string_frets)
+                & (np.arange(len(combinations)) < string_no)[:, None]
+            )
+            rank = (fretted & lower).sum(axis=0)
+            muted[string_no] &= rank < to_mute
+
+    # Chord tones coverage
+    covered = np.bitwise_or.reduce(np.where(muted, 0, bits), axis=0)
+    keep = covered == chord_mask
+    rows = np.where(muted, -1, combinations)[:, keep].T.tolist()
+    return [[None if fret < 0 else fret for fret in row] for row in rows]
+
+
+def _grid(columns: List[List[int]], size: int) -> "np.ndarray":
+    """Get every combination of the columns values as columns of an array."""
+    grid = np.meshgrid(
+        *[np.array(column, np.int64) for column in columns], indexing="ij"
+    )
+    return np.stack(grid).reshape(len(columns), size)
+
+
+def vectorized_chord_fingerings(
+    scale: List[List[int]],
+    pitch_classes: List[List[int]],
+    chord_mask: int,
+    max_spacing: int = 5,
+    min_notes_in_chord: int = 2,
+    number_of_fingers: int = 4,
+) -> List[List[Optional[int]]]:
+    """Get the chord fingerings by filtering a grid of combinations with numpy.
+
+    Candidate frets of every string are laid out in an integer array, and the
+    spacing, number of fingers and chord tones coverage filters are applied as
+    array operations. The grid is processed by blocks of leading strings to
+    bound memory usage.
+
+    Gives the same fingerings, in the same order, as search_chord_fingerings,
+    which is used instead for frets above MAX_VECTORIZED_FRET.
+
+    Parameters
+    ----------
+    scale : List[List[int]]
+        Sorted frets available on each string
+    pitch_classes : List[List[int]]
+        Pitch class bit (1 << pitch class) of each fret of the scale
+    chord_mask : int
+        Bitmask of the pitch classes that must appear in the chord
+    max_spacing : int
+        Maximum spacing between notes
+    min_notes_in_chord : int
+        Minimum number of notes in chord
+    number_of_fingers : int
+        Number of fingers allowed
+
+    Returns
+    -------
+    List[List[Optional[int]]]
+        Fingerings with None for muted strings
+
+    Raises
+    ------
+    ImportError
+        If numpy is not installed
+    """
+    if np is None:
+        raise ImportError("Cannot vectorize the search because numpy is missing")
+    if (
+        not scale
+        or any(not frets for frets in scale)
+        or max(max(frets) for frets in scale) > MAX_VECTORIZED_FRET
+    ):
+        return list(
+            search_chord_fingerings(
+                scale,
+                pitch_classes,
+                chord_mask,
+                max_spacing,
+                min_notes_in_chord,
+                number_of_fingers,
+            )
+        )
+
+    # Leading strings are enumerated in Python, trailing ones as a grid
+    split = len(scale) - 1
+    block_size = len(scale[-1])
+    while split > 0 and block_size * len(scale[split - 1]) <= VECTORIZED_BLOCK_SIZE:
+        split -= 1
+        block_size *= len(scale[split])
+
+    number_of_strings = len(scale)
+    combinations = np.empty((number_of_strings, block_size), np.int64)
+    bits = np.empty((number_of_strings, block_size), np.int64)
+    combinations[split:] = _grid(scale[split:], block_size)
+    bits[split:] = _grid(pitch_classes[split:], block_size)
+
+    fingerings: List[List[Optional[int]]] = []
+    head_strings = [list(zip(s, b)) for s, b in zip(scale, pitch_classes)][:split]
+    for head in product(*head_strings):
+        for string_no, (fret, bit) in enumerate(head):
+            combinations[string_no] = fret
+            bits[string_no] = bit
+        fingerings.extend(
+            _vectorized_block(
+                combinations,
+                bits,
+                chord_mask,
+                max_spacing,
+                min_notes_in_chord,
+                number_of_fingers,
+            )
+        )
+    return fingerings
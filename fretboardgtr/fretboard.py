@@ -1,6 +1,24 @@
 import copy
+import threading
+from array import array
+from contextlib import contextmanager
+from dataclasses import dataclass, field, is_dataclass
 from pathlib import Path
-from typing import Dict, List, Literal, Optional, Tuple, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    MutableSequence,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+from xml.etree.ElementTree import Element
 
 from fretboardgtr.constants import STANDARD_TUNING
 from fretboardgtr.elements.background import Background
@@ -9,23 +27,41 @@ from fretboardgtr.elements.cross import Cross
 from fretboardgtr.elements.fret_number import FretNumber
 from fretboardgtr.elements.frets import Fret
 from fretboardgtr.elements.neck_dots import NeckDot
-from fretboardgtr.elements.notes import FrettedNote, OpenNote
+from fretboardgtr.elements.notes import (
+    FrettedNote,
+    FrettedNoteConfig,
+    OpenNote,
+    OpenNoteConfig,
+    get_note_style,
+)
 from fretboardgtr.elements.nut import Nut
 from fretboardgtr.elements.strings import String
 from fretboardgtr.elements.tuning import Tuning
 from fretboardgtr.exporters import EXPORTERS
 from fretboardgtr.fretboards.base import FretBoardLike
+from fretboardgtr.fretboards.compact import CompactElementLayer, build_element
 from fretboardgtr.fretboards.config import FretBoardConfig
-from fretboardgtr.fretboards.converters import FretBoardToSVGConverter
+from fretboardgtr.fretboards.converters import (
+    FretBoardToSVGConverter,
+    serialise_elements,
+)
 from fretboardgtr.fretboards.elements import FretBoardElements
 from fretboardgtr.fretboards.horizontal import HorizontalFretBoard
 from fretboardgtr.fretboards.vertical import VerticalFretBoard
+from fretboardgtr.neck_map import NeckMap, get_neck_map
+from fretboardgtr.note_colors import NoteColors
 from fretboardgtr.notes_creators import NotesContainer
+from fretboardgtr.transposition import (
+    transpose_fingering,
+    transpose_note,
+    transpose_scale,
+)
 from fretboardgtr.utils import (
     chromatic_position_from_root,
     get_note_from_index,
     get_valid_dots,
     note_to_interval_name,
+    note_to_pitch_class,
     scale_to_enharmonic,
 )
 
@@ -43,26 +79,498 @@ def build_config(config: Optional[Union[Dict, FretBoardConfig]]) -> FretBoardCon
         raise ValueError(msg)
 
 
+class _NoteLayerCall(NamedTuple):
+    """Call adding to the notes and crosses, replayed when transposing."""
+
+    kind: str
+    args: Tuple[Any, ...]
+    # Transposition of the fretboard when the call was made
+    transposition: int
+
+
+# Method drawing each kind of recorded call
+_DRAWERS = {
+    "note": "_draw_note",
+    "notes": "_draw_notes",
+    "index": "_draw_single_note_from_index",
+    "fingering": "_draw_fingering",
+    "scale": "_draw_scale",
+    "element": "_draw_element",
+}
+
+
+# Layers of FretBoardElements built by init, their configuration has the
+# same name
+SKELETON_LAYERS = (
+    "background",
+    "fret_numbers",
+    "neck_dots",
+    "frets",
+    "nut",
+    "tuning",
+    "strings",
+)
+# Layers of FretBoardElements added by the user
+NOTE_LAYERS = ("notes", "crosses", "customs")
+# Maximum number of skeletons kept by FretBoard.from_template
+SKELETON_CACHE_SIZE = 64
+# Maximum number of free fretboards kept by pooled_fretboard for each
+# tuning, orientation and configuration
+POOL_SIZE = 4
+# Maximum number of drawn calls kept by a fretboard to transpose them
+MAX_NOTE_LAYER_CALLS = 256
+
+
+class _LayerFragment(NamedTuple):
+    """Serialised elements of a layer, valid while the layer is unchanged."""
+
+    elements: Tuple[FretBoardElement, ...]
+    # Configuration and state of the elements when they were serialised
+    config_key: Tuple[Any, ...]
+    xml: List[Element]
+
+
+@dataclass
+class _PositionIndex:
+    """Index in a layer of the element drawn at each place of the neck.
+
+    Places are a string and a fret index, 0 being the open string.
+    """
+
+    layer: MutableSequence[Any]
+    # Length of the layer after the last element added by the fretboard
+    length: int
+    # Fret indexes of each string in positions
+    stride: int
+    # Position in the layer of the element of each place, -1 for none
+    positions: "array[int]" = field(default_factory=lambda: array("i"))
+    # Places beyond the frets of the fretboard
+    others: Dict[Tuple[int, int], int] = field(default_factory=dict)
+
+    def get(self, string_no: int, index: int) -> int:
+        if 0 <= index < self.stride:
+            place = string_no * self.stride + index
+            return self.positions[place] if place < len(self.positions) else -1
+        return self.others.get((string_no, index), -1)
+
+    def set(self, string_no: int, index: int, position: int) -> None:
+        if 0 <= index < self.stride:
+            place = string_no * self.stride + index
+            if place >= len(self.positions):
+                self.positions.extend(
+                    array("i", [-1]) * (place + 1 - len(self.positions))
+                )
+            self.positions[place] = position
+        else:
+            self.others[(string_no, index)] = position
+
+
+_skeletons: Dict[
+    Tuple[Any, ...], Tuple[FretBoardElements, Dict[str, _LayerFragment]]
+] = {}
+# Guards _skeletons and the serialised layers they share between threads
+_skeletons_lock = threading.Lock()
+
+
+def _merge_calls(
+    previous: _NoteLayerCall, call: _NoteLayerCall, note_policy: str
+) -> Optional[_NoteLayerCall]:
+    """Merge two consecutive calls, None if they cannot be merged.
+
+    Calls are only merged when drawing the merged call gives the same
+    elements as drawing both of them under the note policy. A repeated
+    call draws the same notes at the same places, it is drawn once unless
+    notes are stacked. When existing notes are kept, a container whose
+    pitch classes are all drawn by the previous container draws nothing.
+    """
+    if (
+        note_policy == "stack"
+        or call.kind != previous.kind
+        or call.transposition != previous.transposition
+        # Note elements have no place, they are always added
+        or call.kind == "element"
+    ):
+        return None
+    if call.args == previous.args:
+        return previous
+    if call.kind == "notes" and note_policy == "keep":
+        (first,), (second,) = previous.args, call.args
+        if second.pitch_class_mask & ~first.pitch_class_mask == 0:
+            return previous
+    return None
+
+
+def _config_values(config: Any) -> Tuple[Any, ...]:
+    # Note colors are only used by the notes
+    return tuple(
+        value for value in vars(config).values() if not isinstance(value, NoteColors)
+    )
+
+
+def _element_state(element: FretBoardElement) -> Tuple[Any, ...]:
+    # Configurations are modified in place, their values are copied
+    return tuple(
+        _config_values(value) if is_dataclass(value) else value
+        for value in vars(element).values()
+    )
+
+
+def _skeleton_key(
+    tuning: List[str], vertical: bool, config: FretBoardConfig
+) -> Tuple[Any, ...]:
+    config_key = (_config_values(config.general),) + tuple(
+        _config_values(getattr(config, layer)) for layer in SKELETON_LAYERS
+    )
+    return (tuple(tuning), vertical, config_key)
+
+
+def clear_skeleton_cache() -> None:
+    """Remove every skeleton cached by FretBoard.from_template."""
+    with _skeletons_lock:
+        _skeletons.clear()
+
+
+# Free fretboards of each thread, by tuning, orientation and configuration
+_pools = threading.local()
+
+
+def _pool_key(
+    tuning: List[str], vertical: bool, config: FretBoardConfig, compact: bool
+) -> Tuple[Any, ...]:
+    notes_key = tuple(
+        _config_values(getattr(config, layer))
+        for layer in ("open_notes", "fretted_notes", "cross")
+    ) + (
+        tuple(vars(config.general.open_colors).values()),
+        tuple(vars(config.general.fretted_colors).values()),
+    )
+    return _skeleton_key(tuning, vertical, config) + (notes_key, compact)
+
+
+def _free_fretboards() -> Dict[Tuple[Any, ...], List["FretBoard"]]:
+    free = getattr(_pools, "fretboards", None)
+    if free is None:
+        free = _pools.fretboards = {}
+    return free
+
+
+@contextmanager
+def pooled_fretboard(
+    tuning: Optional[List[str]] = None,
+    config: Optional[Union[Dict, FretBoardConfig]] = None,
+    vertical: bool = False,
+    compact: bool = False,
+) -> Iterator["FretBoard"]:
+    """Borrow a fretboard without notes from the pool of the current thread.
+
+    Fretboards are created with FretBoard.from_template, from a copy of the
+    configuration, and are given back to the pool at the end of the with
+    block after removing their notes, crosses and custom elements. Each
+    thread has its own pool, a fretboard is never used by two threads.
+
+    Parameters
+    ----------
+    tuning : Optional[List[str]]
+        Tuning of the fretboard, by default the standard tuning
+    config : Optional[Union[Dict, FretBoardConfig]]
+        Configuration of the fretboard
+    vertical : bool
+        Whether the fretboard is vertical
+    compact : bool
+        Whether the notes and crosses are stored in compact layers
+
+    Yields
+    ------
+    FretBoard
+        Fretboard without notes, crosses and custom elements
+
+    Example
+    -------
+    >>> for name, fingering in fingerings.items():
+    ...     with pooled_fretboard(config=config) as fretboard:
+    ...         fretboard.add_fingering(fingering)
+    ...         fretboard.export(f"{name}.svg")
+    """
+    tuning = tuning if tuning is not None else STANDARD_TUNING
+    built_config = build_config(config).validate()
+    key = _pool_key(tuning, vertical, built_config, compact)
+    free_fretboards = _free_fretboards()
+    free = free_fretboards.get(key)
+    if free is None:
+        if len(free_fretboards) >= SKELETON_CACHE_SIZE:
+            # Drop the oldest pool
+            del free_fretboards[next(iter(free_fretboards))]
+        free = free_fretboards[key] = []
+    fretboard = (
+        free.pop()
+        if free
+        else FretBoard.from_template(
+            list(tuning), copy.deepcopy(built_config), vertical, compact
+        )
+    )
+    try:
+        yield fretboard
+    finally:
+        fretboard.reset()
+        # A fretboard whose tuning or configuration was changed is not
+        # given back
+        if len(free) < POOL_SIZE and key == _pool_key(
+            fretboard.tuning, vertical, fretboard.config, compact
+        ):
+            free.append(fretboard)
+
+
+def clear_fretboard_pool() -> None:
+    """Remove every free fretboard of the pool of the current thread."""
+    _free_fretboards().clear()
+
+
 class FretBoard(FretBoardLike):
     def __init__(
         self,
         tuning: Optional[List[str]] = None,
         config: Optional[Union[Dict, FretBoardConfig]] = None,
         vertical: bool = False,
+        compact: bool = False,
+        lazy: bool = False,
     ):
+        self._setup(tuning, config, vertical, compact, lazy)
+        if lazy:
+            self._skeleton_pending = True
+        else:
+            self.init()
+
+    def _setup(
+        self,
+        tuning: Optional[List[str]],
+        config: Optional[Union[Dict, FretBoardConfig]],
+        vertical: bool,
+        compact: bool,
+        lazy: bool,
+    ) -> None:
         self.tuning = tuning if tuning is not None else STANDARD_TUNING
 
         self.config = build_config(config).validate()
-        self.elements = FretBoardElements()
+        self._elements = FretBoardElements()
+        if compact:
+            self._elements.use_compact_layers()
         self.fretboard: Union[HorizontalFretBoard, VerticalFretBoard] = (
             HorizontalFretBoard(tuning, self.config)
             if not vertical
             else VerticalFretBoard(tuning, self.config)
         )
-        self.init()
+        # Calls adding notes, to rebuild the notes when transposing
+        self._note_layer: List[_NoteLayerCall] = []
+        # Whether drawn calls were dropped, the notes cannot be transposed
+        self._calls_dropped = False
+        self._transposition = 0
+        # Lazy fretboards only draw the calls when their elements are read
+        self._lazy = lazy
+        self._skeleton_pending = False
+        self._drawn_calls = 0
+        self._drawn_transposition = 0
+        # Serialised skeleton layers, shared by the fretboards of a template
+        self._svg_fragments: Dict[str, _LayerFragment] = {}
+        # Notes and crosses of each place of the neck
+        self._position_indexes: Dict[str, _PositionIndex] = {}
+
+    @classmethod
+    def from_template(
+        cls,
+        tuning: Optional[List[str]] = None,
+        config: Optional[Union[Dict, FretBoardConfig]] = None,
+        vertical: bool = False,
+        compact: bool = False,
+        lazy: bool = False,
+    ) -> "FretBoard":
+        """Create a fretboard sharing a cached skeleton.
+
+        The skeleton (background, fret numbers, neck dots, frets, nut,
+        tuning and strings) is built once for each tuning, orientation and
+        configuration, from a copy of the configuration. Fretboards created
+        from the same template share the skeleton elements, which should
+        not be modified, and only own their notes, crosses and custom
+        elements.
+
+        Parameters
+        ----------
+        tuning : Optional[List[str]]
+            Tuning of the fretboard, by default the standard tuning
+        config : Optional[Union[Dict, FretBoardConfig]]
+            Configuration of the fretboard
+        vertical : bool
+            Whether the fretboard is vertical
+        compact : bool
+            Whether the notes and crosses are stored in compact layers, see
+            FretBoardElements.use_compact_layers
+        lazy : bool
+            Whether the notes are only drawn when the elements are read
+
+        Returns
+        -------
+        FretBoard
+            New fretboard, without notes
+
+        Example
+        -------
+        >>> for fingering in fingerings:
+        ...     fretboard = FretBoard.from_template(config=config)
+        ...     fretboard.add_fingering(fingering)
+        """
+        fretboard = cls.__new__(cls)
+        fretboard._setup(tuning, config, vertical, compact, lazy)
+        key = _skeleton_key(fretboard.tuning, vertical, fretboard.config)
+        with _skeletons_lock:
+            cached = _skeletons.get(key)
+        if cached is None:
+            # Built outside of the lock, the first skeleton stored is kept
+            skeleton = cls(
+                list(fretboard.tuning), copy.deepcopy(fretboard.config), vertical
+            ).elements
+            with _skeletons_lock:
+                cached = _skeletons.get(key)
+                if cached is None:
+                    if len(_skeletons) >= SKELETON_CACHE_SIZE:
+                        # Drop the oldest skeleton
+                        _skeletons.pop(next(iter(_skeletons)), None)
+                    cached = _skeletons[key] = (skeleton, {})
+        skeleton, fretboard._svg_fragments = cached
+        for layer in SKELETON_LAYERS:
+            value = getattr(skeleton, layer)
+            setattr(
+                fretboard._elements,
+                layer,
+                list(value) if isinstance(value, list) else value,
+            )
+        return fretboard
+
+    @property
+    def elements(self) -> FretBoardElements:
+        """Elements of the fretboard, drawn first if the fretboard is lazy."""
+        if self._lazy:
+            self._draw_pending()
+        return self._elements
+
+    @elements.setter
+    def elements(self, elements: FretBoardElements) -> None:
+        self._elements = elements
 
     def set_config(self, config: FretBoardConfig) -> None:
         self.config = config
+        self.invalidate_svg_cache()
+
+    def invalidate_svg_cache(self) -> None:
+        """Serialise every skeleton layer again at the next export.
+
+        Layers are serialised again when their elements are added, removed,
+        replaced or modified, or when their configuration changes, so this
+        is only needed after modifying a value held by an element in place,
+        eg a list.
+        """
+        self._svg_fragments = {}
+
+    def get_layer_xml(self, layer: str) -> Optional[List[Element]]:
+        """Get the serialised elements of a skeleton layer.
+
+        Skeleton layers are serialised once and cached until their
+        configuration, their elements or the attributes of their elements
+        change.
+        Notes, crosses and custom elements are not cached, None is returned
+        for them.
+
+        Parameters
+        ----------
+        layer : str
+            Name of a field of FretBoardElements
+
+        Returns
+        -------
+        Optional[List[Element]]
+            XML of each element of the layer, shared and not to be modified
+        """
+        if layer not in SKELETON_LAYERS:
+            return None
+        value = getattr(self.elements, layer)
+        elements: Tuple[FretBoardElement, ...] = (
+            tuple(value)
+            if isinstance(value, list)
+            else ()
+            if value is None
+            else (value,)
+        )
+        config_key = (
+            _config_values(self.config.general),
+            _config_values(getattr(self.config, layer)),
+            tuple(_element_state(element) for element in elements),
+        )
+        with _skeletons_lock:
+            fragment = self._svg_fragments.get(layer)
+        if (
+            fragment is None
+            or fragment.config_key != config_key
+            or len(fragment.elements) != len(elements)
+            or any(
+                cached is not element
+                for cached, element in zip(fragment.elements, elements)
+            )
+        ):
+            fragment = _LayerFragment(
+                elements, config_key, serialise_elements(list(elements))
+            )
+            with _skeletons_lock:
+                self._svg_fragments[layer] = fragment
+        return fragment.xml
+
+    def clear_notes(self) -> None:
+        """Remove the notes and the crosses of the fretboard.
+
+        The rest of the fretboard is kept, the fretboard can be used again
+        for other notes without building it again.
+        """
+        self.reset(("notes", "crosses"))
+
+    def reset(self, layers: Optional[Iterable[str]] = None) -> None:
+        """Reset layers of the fretboard to their state after init.
+
+        Notes, crosses and custom elements are removed, skeleton layers are
+        built again from the configuration. Removing the notes or the
+        crosses also forgets the calls that added them and the
+        transposition of the fretboard : transpose only replays the calls
+        made after the reset.
+
+        Parameters
+        ----------
+        layers : Optional[Iterable[str]]
+            Names of the fields of FretBoardElements to reset, by default
+            the notes, the crosses and the custom elements
+
+        Raises
+        ------
+        ValueError
+            If a layer is not a field of FretBoardElements
+        """
+        layers = NOTE_LAYERS if layers is None else tuple(layers)
+        unknown = [
+            layer for layer in layers if layer not in NOTE_LAYERS + SKELETON_LAYERS
+        ]
+        if unknown:
+            availables = ", ".join(SKELETON_LAYERS + NOTE_LAYERS)
+            raise ValueError(
+                f"Unknown layers {', '.join(unknown)}."
+                f" Available layers are {availables}"
+            )
+        for layer in layers:
+            self._elements.clear_layer(layer)
+            if layer in SKELETON_LAYERS and not self._skeleton_pending:
+                # Serialised layers may be shared with other fretboards
+                self.invalidate_svg_cache()
+                getattr(self, f"add_{layer}")()
+        if "notes" in layers or "crosses" in layers:
+            self._note_layer = []
+            self._transposition = 0
+            self._drawn_calls = 0
+            self._drawn_transposition = 0
+            self._calls_dropped = False
 
     def init(self) -> None:
         """Init the fretboard by adding essential elements.
@@ -76,6 +584,7 @@ class FretBoard(FretBoardLike):
             tuning
             strings
         """
+        self._skeleton_pending = False
         self.add_background()
         self.add_fret_numbers()
         self.add_neck_dots()
@@ -89,7 +598,7 @@ class FretBoard(FretBoardLike):
         x, y = self.fretboard.get_background_start_position()
         width, height = self.fretboard.get_background_dimensions()
         background = Background((x, y), (width, height), config=self.config.background)
-        self.elements.background = background
+        self._elements.background = background
 
     def add_neck_dots(self) -> None:
         """Build and add neck dot elements."""
@@ -99,7 +608,7 @@ class FretBoard(FretBoardLike):
         for dot in dots:
             for position in self.fretboard.get_neck_dot_position(dot):
                 center_dot = NeckDot(position, config=self.config.neck_dots)
-                self.elements.neck_dots.append(center_dot)
+                self._elements.neck_dots.append(center_dot)
 
     def add_frets(self) -> None:
         """Build and add fret elements."""
@@ -115,7 +624,7 @@ class FretBoard(FretBoardLike):
             position = self.fretboard.get_fret_position(fret_no)
 
             fret = Fret(position[0], position[1], config=self.config.frets)
-            self.elements.frets.append(fret)
+            self._elements.frets.append(fret)
 
     def add_strings(self) -> None:
         """Build and add string elements."""
@@ -124,7 +633,7 @@ class FretBoard(FretBoardLike):
         for string_no, _ in enumerate(self.tuning):
             start, end = self.fretboard.get_strings_position(string_no)
             string = String(start, end, config=self.config.strings)
-            self.elements.strings.append(string)
+            self._elements.strings.append(string)
 
     def add_nut(self) -> None:
         """Build and add nut element."""
@@ -133,7 +642,7 @@ class FretBoard(FretBoardLike):
             return None
         start, end = position
         nut = Nut(start, end, config=self.config.nut)
-        self.elements.nut = nut
+        self._elements.nut = nut
 
     def add_fret_numbers(self) -> None:
         """Build and add fret number elements."""
@@ -146,7 +655,7 @@ class FretBoard(FretBoardLike):
         for dot in dots:
             x, y = self.fretboard.get_fret_number_position(dot)
             fret_number = FretNumber(str(dot), (x, y), config=self.config.fret_numbers)
-            self.elements.fret_numbers.append(fret_number)
+            self._elements.fret_numbers.append(fret_number)
 
     def add_tuning(self) -> None:
         """Build and add tuning element."""
@@ -156,17 +665,9 @@ class FretBoard(FretBoardLike):
         for string_no, note in enumerate(tuning):
             x, y = self.fretboard.get_tuning_position(string_no)
             tuning_note = Tuning(note, (x, y), config=self.config.tuning)
-            self.elements.tuning.append(tuning_note)
-
-    def _get_open_note(
-        self, position: Tuple[float, float], note: str, root: Optional[str] = None
-    ) -> OpenNote:
-        config = copy.copy(self.config.open_notes)
-        if root and self.config.general.open_color_scale:
-            idx = chromatic_position_from_root(note, root)
-            color = self.config.general.open_colors.from_interval(idx)
-            config.color = color
+            self._elements.tuning.append(tuning_note)
 
+    def _note_label(self, note: str, root: Optional[str]) -> str:
         if root and self.config.general.show_degree_name:
             note = note_to_interval_name(note, root)
 
@@ -174,70 +675,138 @@ class FretBoard(FretBoardLike):
             self.config.general.show_degree_name or self.config.general.show_note_name
         ):
             note = ""
+        return note
 
-        _note = OpenNote(note, position, config=config)
-        return _note
+    def _open_note_config(self, note: str, root: Optional[str]) -> OpenNoteConfig:
+        color = None
+        if root and self.config.general.open_color_scale:
+            idx = chromatic_position_from_root(note, root)
+            color = self.config.general.open_colors.from_interval(idx)
+        return get_note_style(self.config.open_notes, color)
 
-    def _get_fretted_note(
-        self, position: Tuple[float, float], note: str, root: Optional[str] = None
-    ) -> FrettedNote:
-        config = copy.copy(self.config.fretted_notes)
+    def _fretted_note_config(self, note: str, root: Optional[str]) -> FrettedNoteConfig:
+        color = None
         if root and self.config.general.fretted_color_scale:
             idx = chromatic_position_from_root(note, root)
             color = self.config.general.fretted_colors.from_interval(idx)
-            config.color = color
+        return get_note_style(self.config.fretted_notes, color)
 
-        if root and self.config.general.show_degree_name:
-            note = note_to_interval_name(note, root)
+    def _get_open_note(
+        self, position: Tuple[float, float], note: str, root: Optional[str] = None
+    ) -> OpenNote:
+        config = self._open_note_config(note, root)
+        return OpenNote(self._note_label(note, root), position, config=config)
 
-        if not (
-            self.config.general.show_degree_name or self.config.general.show_note_name
+    def _get_fretted_note(
+        self, position: Tuple[float, float], note: str, root: Optional[str] = None
+    ) -> FrettedNote:
+        config = self._fretted_note_config(note, root)
+        return FrettedNote(self._note_label(note, root), position, config=config)
+
+    def _position_index(self, layer: str) -> _PositionIndex:
+        elements = getattr(self._elements, layer)
+        index = self._position_indexes.get(layer)
+        if (
+            index is None
+            or index.layer is not elements
+            or index.length != len(elements)
         ):
-            note = ""
+            # New layer, or layer modified from outside : the elements
+            # already in it are not indexed
+            index = self._position_indexes[layer] = _PositionIndex(
+                elements,
+                len(elements),
+                self.config.general.last_fret - self.config.general.first_fret + 2,
+            )
+        return index
 
-        _note = FrettedNote(note, position, config=config)
-        return _note
+    def _place(
+        self,
+        index: _PositionIndex,
+        string_no: int,
+        fret_index: int,
+        element_type: Type[FretBoardElement],
+        name: str,
+        position: Tuple[float, float],
+        config: Any,
+    ) -> None:
+        """Add an element at a place of the neck, following the note policy."""
+        layer = index.layer
+        policy = self.config.general.note_policy
+        if policy != "stack":
+            existing = index.get(string_no, fret_index)
+            if existing != -1:
+                if policy != "replace":
+                    return None
+                if isinstance(layer, CompactElementLayer):
+                    layer.replace(existing, element_type, name, position, config)
+                else:
+                    layer[existing] = build_element(
+                        element_type, name, position, config
+                    )
+                return None
+            index.set(string_no, fret_index, len(layer))
+        if isinstance(layer, CompactElementLayer):
+            # Stored without building the element
+            layer.add(element_type, name, position, config)
+        else:
+            layer.append(build_element(element_type, name, position, config))
+        index.length += 1
 
     def _add_single_note(
         self, string_no: int, index: int, note: str, root: Optional[str] = None
     ) -> None:
         position = self.fretboard.get_single_note_position(string_no, index)
-        _note: Union[OpenNote, FrettedNote]
+        element_type: Type[FretBoardElement] = OpenNote
+        config: Any = None
         if index == 0:
-            _note = self._get_open_note(position, note, root)
+            config = self._open_note_config(note, root)
         else:
-            _note = self._get_fretted_note(position, note, root)
-        self.elements.notes.append(_note)
+            element_type = FrettedNote
+            config = self._fretted_note_config(note, root)
+        self._place(
+            self._position_index("notes"),
+            string_no,
+            index,
+            element_type,
+            self._note_label(note, root),
+            position,
+            config,
+        )
 
     def add_note(self, string_no: int, note: str, root: Optional[str] = None) -> None:
         """Build and add notes element."""
         if string_no < 0 or string_no > len(self.tuning):
             raise ValueError(f"String number is invalid. Tuning is {self.tuning}")
+        self._add("note", string_no, note, root)
 
-        # Note when fret == 0
-        string_root = self.fretboard.get_list_in_good_order(self.tuning)[string_no]
-        # Note when fret == N
-        string_root = get_note_from_index(
-            self.config.general.first_fret - 1, string_root
+    def _draw_note(self, string_no: int, note: str, root: Optional[str]) -> None:
+        self._add_pitch_class(string_no, note_to_pitch_class(note), note, root)
+
+    def _get_neck_map(self) -> NeckMap:
+        # Index 0 of a string is the fret before the first fret
+        return get_neck_map(
+            self.fretboard.get_list_in_good_order(self.tuning),
+            self.config.general.first_fret - 1,
+            self.config.general.last_fret,
         )
-        # Index of the note from root
-        _idx = chromatic_position_from_root(note, string_root)
-        indices = []
-        # We add 1 as it is one-indexed for first fret
-        number_of_frets = (
-            self.config.general.last_fret - self.config.general.first_fret
-        ) + 1
-        while _idx <= number_of_frets:
-            indices.append(_idx)
-            _idx += 12
 
-        for idx in indices:
-            self._add_single_note(string_no, idx, note, root)
+    def _add_pitch_class(
+        self, string_no: int, pitch_class: int, note: str, root: Optional[str] = None
+    ) -> None:
+        neck_map = self._get_neck_map()
+        for fret in neck_map.frets[string_no][pitch_class]:
+            self._add_single_note(string_no, fret - neck_map.first_fret, note, root)
 
     def add_single_note_from_index(
         self, string_no: int, index: int, root: Optional[str] = None
     ) -> None:
         """Build and add background element."""
+        self._add("index", string_no, index, root)
+
+    def _draw_single_note_from_index(
+        self, string_no: int, index: int, root: Optional[str]
+    ) -> None:
         string_note = self.tuning[string_no]
         note = get_note_from_index(index, string_note)
 
@@ -252,21 +821,26 @@ class FretBoard(FretBoardLike):
     ) -> None:
         if finger_position is None:
             position = self.fretboard.get_cross_position(string_no)
-            cross = Cross(position, config=self.config.cross)
-            self.elements.crosses.append(cross)
+            self._place(
+                self._position_index("crosses"),
+                # A single cross per string
+                string_no,
+                0,
+                Cross,
+                "X",
+                position,
+                self.config.cross,
+            )
             return None
 
-        string_note = get_note_from_index(
-            finger_position,
-            self.fretboard.get_list_in_good_order(self.tuning)[string_no],
-        )
+        string_note = self._get_neck_map().note(string_no, finger_position)
         if finger_position > 0:
             # We add 1 as it is one-indexed
             finger_position = finger_position - self.config.general.first_fret + 1
             if finger_position <= 0:
                 return None
         if repeat_over_fretboard:
-            self.add_note(string_no, string_note, root)
+            self._draw_note(string_no, string_note, root)
         else:
             self._add_single_note(string_no, finger_position, string_note, root)
 
@@ -278,12 +852,55 @@ class FretBoard(FretBoardLike):
         scale : NotesContainer
             Object representing the root and the associated scale
         """
+        # Calls are replayed later, they keep copies of mutable arguments
+        self._add("notes", scale._copy())
+
+    def _draw_notes(self, scale: NotesContainer) -> None:
         notes = scale.notes
         if self.config.general.enharmonic:
             notes = scale_to_enharmonic(scale.notes)
-        for string_no, _ in enumerate(self.tuning):
-            for note in notes:
-                self.add_note(string_no, note, scale.root)
+
+        # Label and shared styles of each pitch class, resolved once for the
+        # whole scale. Notes sharing a pitch class would be drawn at the same
+        # place, the first one is kept.
+        styles: Dict[int, Tuple[str, OpenNoteConfig, FrettedNoteConfig]] = {}
+        for note, pitch_class in zip(notes, scale.pitch_classes):
+            if pitch_class in styles:
+                continue
+            styles[pitch_class] = (
+                self._note_label(note, scale.root),
+                self._open_note_config(note, scale.root),
+                self._fretted_note_config(note, scale.root),
+            )
+
+        neck_map = self._get_neck_map()
+        get_position = self.fretboard.get_single_note_position
+        positions = self._position_index("notes")
+        for string_no, string_frets in enumerate(neck_map.frets):
+            for pitch_class, (label, open_config, fretted_config) in styles.items():
+                for fret in string_frets[pitch_class]:
+                    index = fret - neck_map.first_fret
+                    position = get_position(string_no, index)
+                    if index == 0:
+                        self._place(
+                            positions,
+                            string_no,
+                            index,
+                            OpenNote,
+                            label,
+                            position,
+                            open_config,
+                        )
+                    else:
+                        self._place(
+                            positions,
+                            string_no,
+                            index,
+                            FrettedNote,
+                            label,
+                            position,
+                            fretted_config,
+                        )
 
     def add_fingering(
         self, fingering: List[Optional[int]], root: Optional[str] = None
@@ -309,6 +926,11 @@ class FretBoard(FretBoardLike):
                 f"Fingering size does not match tuning size. Got {len(fingering)}"
                 f", expected {len(self.tuning)}"
             )
+        self._add("fingering", list(fingering), root)
+
+    def _draw_fingering(
+        self, fingering: List[Optional[int]], root: Optional[str]
+    ) -> None:
         for string_no, finger_position in enumerate(
             self.fretboard.get_list_in_good_order(fingering)
         ):
@@ -342,7 +964,16 @@ class FretBoard(FretBoardLike):
                 f"Scale has not the same size as tuning."
                 f" Got {len(scale)} expected {len(self.tuning)}"
             )
+        self._add(
+            "scale", [list(frets) for frets in scale], root, repeat_over_fretboard
+        )
 
+    def _draw_scale(
+        self,
+        scale: List[List[Optional[int]]],
+        root: Optional[str],
+        repeat_over_fretboard: bool,
+    ) -> None:
         for string_no, finger_positions in enumerate(
             self.fretboard.get_list_in_good_order(scale)
         ):
@@ -366,7 +997,149 @@ class FretBoard(FretBoardLike):
         ValueError
             If the note is not a Union[OpenNote, FrettedNote]
         """
-        self.elements.notes.append(note)
+        self._add("element", note)
+
+    def _draw_element(self, note: Union[OpenNote, FrettedNote]) -> None:
+        # Note elements have no place, they are always added
+        index = self._position_index("notes")
+        self._elements.notes.append(note)
+        index.length += 1
+
+    def _add(self, kind: str, *args: Any) -> None:
+        """Record a call adding notes, and draw it unless the fretboard is lazy.
+
+        Mutable arguments should be copied by the caller, calls are drawn
+        again when transposing and lazy fretboards draw them later.
+
+        Calls of lazy fretboards that are not drawn yet are merged with the
+        previous call when possible.
+        """
+        call = _NoteLayerCall(kind, args, self._transposition)
+        if self._lazy and len(self._note_layer) > self._drawn_calls:
+            merged = _merge_calls(
+                self._note_layer[-1], call, self.config.general.note_policy
+            )
+            if merged is not None:
+                self._note_layer[-1] = merged
+                return None
+        self._note_layer.append(call)
+        if not self._lazy:
+            self._draw_pending()
+
+    def _draw_pending(self) -> None:
+        """Draw the skeleton and the calls that are not drawn yet."""
+        if self._skeleton_pending:
+            self.init()
+        if self._drawn_transposition != self._transposition:
+            # Every call is drawn again in the new key
+            self._elements.clear_layer("notes")
+            self._elements.clear_layer("crosses")
+            self._drawn_calls = 0
+            self._drawn_transposition = self._transposition
+        for call in self._note_layer[self._drawn_calls :]:
+            self._replay(call, self._transposition - call.transposition)
+        self._drawn_calls = len(self._note_layer)
+        if self._drawn_calls > MAX_NOTE_LAYER_CALLS:
+            # Keeping every call of a long lived fretboard would not be bounded
+            self._note_layer = []
+            self._drawn_calls = 0
+            self._calls_dropped = True
+
+    def transpose(self, semitones: int) -> None:
+        """Transpose the notes of the fretboard by a number of semitones.
+
+        Only the notes and crosses are rebuilt, the rest of the fretboard is
+        kept. Every call adding notes is replayed in the new key :
+        containers are transposed, fingerings and scales are moved along the
+        neck with transposition.transpose_fingering and
+        transposition.transpose_scale, and are dropped if they do not fit the
+        frets of the fretboard. Note elements added with add_note_element are
+        kept as is.
+
+        Transpositions add up and are always computed from the original
+        calls, transposing back restores the original notes. At most
+        MAX_NOTE_LAYER_CALLS drawn calls are kept, fretboards that drew more
+        since their notes were cleared cannot be transposed.
+        Lazy fretboards only redraw the notes when their elements are read.
+
+        Parameters
+        ----------
+        semitones : int
+            Number of semitones to transpose by, may be negative
+
+        Raises
+        ------
+        ValueError
+            If the calls adding the notes were dropped
+
+        Example
+        -------
+        >>> fretboard = FretBoard()
+        >>> fretboard.add_fingering([None, 3, 2, 0, 1, 0], root="C")
+        >>> for key in range(12):
+        ...     fretboard.export(f"key_{key}.svg")
+        ...     fretboard.transpose(1)
+        """
+        if self._calls_dropped:
+            raise ValueError(
+                f"Cannot transpose a fretboard that drew more than "
+                f"{MAX_NOTE_LAYER_CALLS} calls since its notes were cleared"
+            )
+        self._transposition += semitones
+        if not self._lazy:
+            self._draw_pending()
+
+    def _replay(self, call: _NoteLayerCall, semitones: int) -> None:
+        # Note elements are never transposed
+        if call.kind == "element" or semitones % 12 == 0:
+            getattr(self, _DRAWERS[call.kind])(*call.args)
+            return None
+
+        first_fret = self.config.general.first_fret
+        last_fret = self.config.general.last_fret
+        if call.kind == "notes":
+            (scale,) = call.args
+            self._draw_notes(scale.transpose(semitones))
+            return None
+
+        root = call.args[-1] if call.kind != "scale" else call.args[1]
+        if root is not None:
+            root = transpose_note(root, semitones)
+        if call.kind == "note":
+            string_no, note, _ = call.args
+            self._draw_note(string_no, transpose_note(note, semitones), root)
+        elif call.kind == "index":
+            string_no, index, _ = call.args
+            # Index 0 is the open string, index 1 the first fret
+            number_of_frets = last_fret - first_fret + 1
+            moved = transpose_fingering([index], semitones, 0, number_of_frets)
+            if moved is not None and moved[0] is not None:
+                self._draw_single_note_from_index(string_no, moved[0], root)
+        elif call.kind == "fingering":
+            fingering = transpose_fingering(
+                call.args[0], semitones, first_fret, last_fret
+            )
+            if fingering is not None:
+                self._draw_fingering(fingering, root)
+        elif call.kind == "scale":
+            scale, _, repeat_over_fretboard = call.args
+            if repeat_over_fretboard:
+                # Only the pitch class of each fret matters, frets below
+                # the first fret would not be drawn
+                scale = [
+                    [
+                        None
+                        if fret is None
+                        else first_fret + (fret + semitones - first_fret) % 12
+                        for fret in frets
+                    ]
+                    for frets in scale
+                ]
+            else:
+                scale = transpose_scale(scale, semitones, first_fret, last_fret)
+            if scale is not None:
+                self._draw_scale(scale, root, repeat_over_fretboard)
+        return None
 
     def add_element(self, element: FretBoardElement) -> None:
         """Add an element to the fretboard.
@@ -385,7 +1158,7 @@ class FretBoard(FretBoardLike):
         """
         if not issubclass(type(element), FretBoardElement):
             raise ValueError("Element should be a 'FretBoardElement'")
-        self.elements.customs.append(element)
+        self._elements.customs.append(element)
 
     def get_elements(self) -> FretBoardElements:
         return self.elements
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional, Tuple, Union
+from xml.etree.ElementTree import Element
 
 from fretboardgtr.elements.base import FretBoardElement
 from fretboardgtr.elements.notes import FrettedNote, OpenNote
@@ -52,3 +53,12 @@ class FretBoardLike(ABC):
     @abstractmethod
     def get_elements(self) -> FretBoardElements:
         pass
+
+    def get_layer_xml(self, layer: str) -> Optional[List[Element]]:
+        """Get the serialised elements of a layer of FretBoardElements.
+
+        Fretboards can override it to cache the layers that did not change.
+        None means that the layer is not cached and is serialised from its
+        elements.
+        """
+        return None
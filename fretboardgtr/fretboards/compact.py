@@ -0,0 +1,321 @@
+"""Compact storage of the notes and crosses of FretBoardElements.
+
+Skeleton elements are shared by the fretboards of a template, the notes
+and the crosses are what each fretboard owns. A CompactElementLayer keeps
+them in typed arrays instead of one Python object per element, and builds
+the elements again only when the layer is read.
+"""
+from array import array
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    MutableSequence,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
+
+from fretboardgtr.elements.base import FretBoardElement
+from fretboardgtr.elements.cross import Cross
+from fretboardgtr.elements.notes import FrettedNote, OpenNote
+
+# Kind of each stored element
+_OPEN_NOTE = 0
+_FRETTED_NOTE = 1
+_CROSS = 2
+# Element kept as is, eg an instance of a subclass
+_OBJECT = 3
+
+_KINDS: Dict[type, int] = {
+    OpenNote: _OPEN_NOTE,
+    FrettedNote: _FRETTED_NOTE,
+    Cross: _CROSS,
+}
+# Attributes of the elements that are stored in the columns, notes keep
+# their configuration in _config
+_ATTRIBUTES = {
+    _OPEN_NOTE: {"_config", "name", "x", "y"},
+    _FRETTED_NOTE: {"_config", "name", "x", "y"},
+    _CROSS: {"config", "name", "x", "y"},
+}
+
+_E = TypeVar("_E", bound=FretBoardElement)
+
+
+def build_element(
+    element_type: Type[_E], name: str, position: Tuple[float, float], config: Any
+) -> _E:
+    """Build an OpenNote, a FrettedNote or a Cross, the name of crosses is X."""
+    if element_type is Cross:
+        return cast(_E, Cross(position, config=config))
+    return element_type(name, position, config=config)  # type: ignore
+
+
+class CompactElementLayer(MutableSequence[_E]):
+    """List of elements stored in typed columns.
+
+    Open notes, fretted notes and crosses are stored as their position,
+    their kind, the index of their configuration in a table of styles and
+    the index of their name in a table of labels. Other elements, and
+    elements with extra attributes or positions that are not floats, are
+    kept as is.
+
+    Elements are built again each time they are read : modifying a read
+    element does not modify the layer, replace it instead.
+
+    Example
+    -------
+    >>> notes = CompactElementLayer()
+    >>> notes.append(OpenNote("E", (30.0, 30.0)))
+    >>> notes[0].name
+        'E'
+    """
+
+    def __init__(self, elements: Iterable[_E] = ()):
+        self.clear()
+        self.extend(elements)
+
+    def clear(self) -> None:
+        self._x = array("d")
+        self._y = array("d")
+        self._kinds = array("B")
+        # Index of the style, or of the element itself for kept elements
+        self._style_indexes = array("I")
+        self._label_indexes = array("I")
+        self._styles: List[Any] = []
+        self._style_ids: Dict[int, int] = {}
+        self._labels: List[str] = []
+        self._label_ids: Dict[str, int] = {}
+
+    def _style_index(self, style: Any) -> int:
+        index = self._style_ids.get(id(style))
+        if index is None:
+            index = self._style_ids[id(style)] = len(self._styles)
+            # Keeping the style alive keeps its id unique
+            self._styles.append(style)
+        return index
+
+    def _label_index(self, label: str) -> int:
+        index = self._label_ids.get(label)
+        if index is None:
+            index = self._label_ids[label] = len(self._labels)
+            self._labels.append(label)
+        return index
+
+    def _columns(self, element: FretBoardElement) -> Tuple[int, float, float, int, int]:
+        kind = _KINDS.get(type(element), _OBJECT)
+        if kind != _OBJECT:
+            attributes = vars(element)
+            if (
+                attributes.keys() != _ATTRIBUTES[kind]
+                or type(attributes["x"]) is not float
+                or type(attributes["y"]) is not float
+                or (kind == _CROSS and attributes["name"] != "X")
+            ):
+                kind = _OBJECT
+        if kind == _OBJECT:
+            return (_OBJECT, 0.0, 0.0, self._style_index(element), 0)
+        element = cast(Union[OpenNote, FrettedNote, Cross], element)
+        # Reading the config of a note would copy a shared style
+        config = attributes["config" if kind == _CROSS else "_config"]
+        return (
+            kind,
+            element.x,
+            element.y,
+            self._style_index(config),
+            self._label_index(element.name),
+        )
+
+    def _element(self, index: int) -> _E:
+        kind = self._kinds[index]
+        style = self._styles[self._style_indexes[index]]
+        if kind == _OBJECT:
+            return cast(_E, style)
+        position = (self._x[index], self._y[index])
+        if kind == _CROSS:
+            return cast(_E, Cross(position, config=style))
+        label = self._labels[self._label_indexes[index]]
+        if kind == _OPEN_NOTE:
+            return cast(_E, OpenNote(label, position, config=style))
+        return cast(_E, FrettedNote(label, position, config=style))
+
+    def _built_columns(
+        self,
+        element_type: Type[_E],
+        name: str,
+        position: Tuple[float, float],
+        config: Any,
+    ) -> Tuple[int, float, float, int, int]:
+        kind = _KINDS.get(element_type, _OBJECT)
+        x, y = position
+        if kind == _OBJECT or type(x) is not float or type(y) is not float:
+            return self._columns(build_element(element_type, name, position, config))
+        return (
+            kind,
+            x,
+            y,
+            self._style_index(config),
+            0 if kind == _CROSS else self._label_index(name),
+        )
+
+    def _set_columns(
+        self, index: int, columns: Tuple[int, float, float, int, int]
+    ) -> None:
+        kind, x, y, style_index, label_index = columns
+        self._x[index] = x
+        self._y[index] = y
+        self._kinds[index] = kind
+        self._style_indexes[index] = style_index
+        self._label_indexes[index] = label_index
+
+    def add(
+        self,
+        element_type: Type[_E],
+        name: str,
+        position: Tuple[float, float],
+        config: Any,
+    ) -> None:
+        """Append an element without building it.
+
+        Parameters
+        ----------
+        element_type : Type[_E]
+            OpenNote, FrettedNote or Cross
+        name : str
+            Name of the note, ignored for crosses
+        position : Tuple[float, float]
+            Position of the element
+        config : Any
+            Configuration of the element
+        """
+        kind, x, y, style_index, label_index = self._built_columns(
+            element_type, name, position, config
+        )
+        self._x.append(x)
+        self._y.append(y)
+        self._kinds.append(kind)
+        self._style_indexes.append(style_index)
+        self._label_indexes.append(label_index)
+
+    def replace(
+        self,
+        index: int,
+        element_type: Type[_E],
+        name: str,
+        position: Tuple[float, float],
+        config: Any,
+    ) -> None:
+        """Replace an element without building the new one, see add."""
+        index = range(len(self))[index]
+        self._set_columns(
+            index, self._built_columns(element_type, name, position, config)
+        )
+
+    def insert(self, index: int, value: _E) -> None:
+        kind, x, y, style_index, label_index = self._columns(value)
+        self._x.insert(index, x)
+        self._y.insert(index, y)
+        self._kinds.insert(index, kind)
+        self._style_indexes.insert(index, style_index)
+        self._label_indexes.insert(index, label_index)
+
+    def append(self, value: _E) -> None:
+        kind, x, y, style_index, label_index = self._columns(value)
+        self._x.append(x)
+        self._y.append(y)
+        self._kinds.append(kind)
+        self._style_indexes.append(style_index)
+        self._label_indexes.append(label_index)
+
+    def extend(self, values: Iterable[_E]) -> None:
+        for value in values:
+            self.append(value)
+
+    def __len__(self) -> int:
+        return len(self._kinds)
+
+    def __iter__(self) -> Iterator[_E]:
+        for index in range(len(self._kinds)):
+            yield self._element(index)
+
+    @overload
+    def __getitem__(self, index: int) -> _E:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[_E]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[_E, List[_E]]:
+        if isinstance(index, slice):
+            return [self._element(i) for i in range(len(self))[index]]
+        return self._element(range(len(self))[index])
+
+    @overload
+    def __setitem__(self, index: int, value: _E) -> None:
+        ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[_E]) -> None:
+        ...
+
+    def __setitem__(
+        self, index: Union[int, slice], value: Union[_E, Iterable[_E]]
+    ) -> None:
+        if isinstance(index, slice):
+            elements = list(self)
+            elements[index] = cast(Iterable[_E], value)
+            self.clear()
+            self.extend(elements)
+            return None
+        index = range(len(self))[index]
+        self._set_columns(index, self._columns(cast(_E, value)))
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        if isinstance(index, int):
+            index = range(len(self))[index]
+        for column in (
+            self._x,
+            self._y,
+            self._kinds,
+            self._style_indexes,
+            self._label_indexes,
+        ):
+            del column[index]
+
+    def _keys(self) -> List[Tuple[int, float, float, Any, Optional[str]]]:
+        return [
+            (
+                kind,
+                x,
+                y,
+                self._styles[style_index],
+                None if kind in (_CROSS, _OBJECT) else self._labels[label_index],
+            )
+            for kind, x, y, style_index, label_index in zip(
+                self._kinds,
+                self._x,
+                self._y,
+                self._style_indexes,
+                self._label_indexes,
+            )
+        ]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (CompactElementLayer, list)):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        if not isinstance(other, CompactElementLayer):
+            other = CompactElementLayer(other)
+        return self._keys() == other._keys()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
@@ -12,6 +12,10 @@ from fretboardgtr.elements.strings import StringConfig
 from fretboardgtr.elements.tuning import TuningConfig
 from fretboardgtr.note_colors import NoteColors
 
+# What a note added where the fretboard already has one does :
+# replace it, keep the existing one, or be drawn over it
+NOTE_POLICIES = ("replace", "keep", "stack")
+
 
 @dataclass
 class FretBoardGeneralConfig(ConfigIniter):
@@ -35,6 +39,7 @@ class FretBoardGeneralConfig(ConfigIniter):
     open_colors: NoteColors = field(default_factory=NoteColors)
     fretted_colors: NoteColors = field(default_factory=NoteColors)
     enharmonic: bool = True
+    note_policy: str = "replace"
 
 
 @dataclass
@@ -73,4 +78,9 @@ class FretBoardConfig(ConfigIniter):
             self.general.first_fret = 1
         if self.general.last_fret < self.general.first_fret:
             self.general.last_fret = self.general.first_fret
+        if self.general.note_policy not in NOTE_POLICIES:
+            raise ValueError(
+                f"Invalid note policy {self.general.note_policy}."
+                f" Available policies are {', '.join(NOTE_POLICIES)}"
+            )
         return self
@@ -1,4 +1,6 @@
 from dataclasses import fields
+from typing import List, MutableSequence
+from xml.etree.ElementTree import Element
 
 import svgwrite
 
@@ -6,6 +8,22 @@ from fretboardgtr.elements.base import FretBoardElement
 from fretboardgtr.fretboards.base import FretBoardLike
 
 
+class SerialisedElement:
+    """Element already serialised to XML, added as is to a drawing."""
+
+    def __init__(self, xml: Element):
+        self.xml = xml
+        self.elementname = xml.tag
+
+    def get_xml(self) -> Element:
+        return self.xml
+
+
+def serialise_elements(elements: List[FretBoardElement]) -> List[Element]:
+    """Serialise elements to XML, to add them to drawings later."""
+    return [element.get_svg().get_xml() for element in elements]
+
+
 class FretBoardToSVGConverter:
     """Convert a FretboardLike object to a svgwrite object.
 
@@ -36,10 +54,16 @@ class FretBoardToSVGConverter:
         drawing = self.get_empty()
         elements = self._fretboard.get_elements()
         for key in fields(elements):
+            layer_xml = self._fretboard.get_layer_xml(key.name)
+            if layer_xml is not None:
+                # Layer serialised and cached by the fretboard
+                for xml in layer_xml:
+                    drawing.add(SerialisedElement(xml))
+                continue
             element = getattr(elements, key.name, None)
             if element is None:
                 continue
-            if isinstance(element, list):
+            if isinstance(element, MutableSequence):
                 for sub in element:
                     drawing = self.add_to_drawing(drawing, sub)
             else:
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field, fields
-from typing import List, Optional, Union
+from typing import List, MutableSequence, Optional, Union
 
 from fretboardgtr.elements.background import Background
 from fretboardgtr.elements.base import FretBoardElement
@@ -11,11 +11,16 @@ from fretboardgtr.elements.notes import FrettedNote, OpenNote
 from fretboardgtr.elements.nut import Nut
 from fretboardgtr.elements.strings import String
 from fretboardgtr.elements.tuning import Tuning
+from fretboardgtr.fretboards.compact import CompactElementLayer
 
 
 @dataclass
 class FretBoardElements:
-    """Container dataclass for the different elements of fretboards."""
+    """Container dataclass for the different elements of fretboards.
+
+    Notes and crosses are lists, or CompactElementLayer once
+    use_compact_layers is called.
+    """
 
     background: Optional[Background] = None
     fret_numbers: List[FretNumber] = field(default_factory=list)
@@ -24,16 +29,16 @@ class FretBoardElements:
     nut: Optional[Nut] = None
     tuning: List[Tuning] = field(default_factory=list)
     strings: List[String] = field(default_factory=list)
-    notes: List[Union[OpenNote, FrettedNote]] = field(default_factory=list)
-    crosses: List[Cross] = field(default_factory=list)
+    notes: MutableSequence[Union[OpenNote, FrettedNote]] = field(default_factory=list)
+    crosses: MutableSequence[Cross] = field(default_factory=list)
     customs: List[FretBoardElement] = field(default_factory=list)
 
     def to_list(self) -> List[FretBoardElement]:
         """Convert the elements to a flat list of element."""
-        flat_elements = []
+        flat_elements: List[FretBoardElement] = []
         for element in fields(self):
             value = getattr(self, element.name)
-            if isinstance(value, list):
+            if isinstance(value, MutableSequence):
                 flat_elements.extend(value)
             elif value is not None:
                 flat_elements.append(value)
@@ -41,3 +46,31 @@ class FretBoardElements:
 
     def __len__(self) -> int:
         return len(self.to_list())
+
+    def use_compact_layers(self) -> None:
+        """Store the notes and the crosses in CompactElementLayer.
+
+        Elements already added are moved to the compact layers.
+        """
+        if not isinstance(self.notes, CompactElementLayer):
+            self.notes = CompactElementLayer(self.notes)
+        if not isinstance(self.crosses, CompactElementLayer):
+            self.crosses = CompactElementLayer(self.crosses)
+
+    def clear_layer(self, layer: str) -> None:
+        """Replace a layer by an empty one, compact layers stay compact.
+
+        Parameters
+        ----------
+        layer : str
+            Name of a field
+        """
+        value = getattr(self, layer)
+        empty: Optional[MutableSequence[FretBoardElement]] = (
+            CompactElementLayer()
+            if isinstance(value, CompactElementLayer)
+            else []
+            if isinstance(value, list)
+            else None
+        )
+        setattr(self, layer, empty)
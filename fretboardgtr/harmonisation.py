@@ -0,0 +1,178 @@
+"""Chords fitting in scales, and scales containing chords.
+
+The subset relation between the pitch class bitmasks of every root and
+mode of SCALES_DICT and every root and quality of CHORDS_DICT_ESSENTIAL is
+computed once, on first use. Queries are then dictionary lookups.
+"""
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+from fretboardgtr.constants import (
+    CHORDS_DICT_ESSENTIAL,
+    CHROMATICS_NOTES,
+    SCALES_DICT,
+)
+from fretboardgtr.utils import note_to_pitch_class
+
+
+class Scale(NamedTuple):
+    """Scale of SCALES_DICT on a root."""
+
+    root: str
+    mode: str
+
+
+class Chord(NamedTuple):
+    """Chord of CHORDS_DICT_ESSENTIAL on a root."""
+
+    root: str
+    quality: str
+
+
+class _Harmonisation(NamedTuple):
+    chords_in_scale: Dict[Scale, Tuple[Chord, ...]]
+    scales_containing: Dict[Chord, Tuple[Scale, ...]]
+
+
+def _mask(root_pitch_class: int, intervals: Sequence[int]) -> int:
+    mask = 0
+    for interval in intervals:
+        mask |= 1 << (root_pitch_class + interval) % 12
+    return mask
+
+
+def _distance(from_root: str, to_root: str) -> int:
+    return (note_to_pitch_class(to_root) - note_to_pitch_class(from_root)) % 12
+
+
+@lru_cache(maxsize=None)
+def _harmonisation() -> _Harmonisation:
+    """Get the chords of every scale and the scales of every chord.
+
+    Chords of a scale are sorted by root from the root of the scale, then
+    in the order of CHORDS_DICT_ESSENTIAL. Scales of a chord are sorted by
+    root from the root of the chord, then in the order of SCALES_DICT.
+    """
+    scale_masks = {
+        Scale(root, mode): _mask(root_pitch_class, intervals)
+        for root_pitch_class, root in enumerate(CHROMATICS_NOTES)
+        for mode, intervals in SCALES_DICT.items()
+    }
+    chord_masks = {
+        Chord(root, quality): _mask(root_pitch_class, intervals)
+        for root_pitch_class, root in enumerate(CHROMATICS_NOTES)
+        for quality, intervals in CHORDS_DICT_ESSENTIAL.items()
+    }
+    # Many scales and chords share the same pitch classes, the subset
+    # relation is computed once for each pair of distinct masks
+    scales_by_mask: Dict[int, List[Scale]] = {}
+    for scale, mask in scale_masks.items():
+        scales_by_mask.setdefault(mask, []).append(scale)
+    chords_by_mask: Dict[int, List[Chord]] = {}
+    for chord, mask in chord_masks.items():
+        chords_by_mask.setdefault(mask, []).append(chord)
+
+    chords_in_scale: Dict[Scale, List[Chord]] = {scale: [] for scale in scale_masks}
+    scales_containing: Dict[Chord, List[Scale]] = {chord: [] for chord in chord_masks}
+    for scale_mask, scales in scales_by_mask.items():
+        for chord_mask, chords in chords_by_mask.items():
+            if chord_mask & ~scale_mask:
+                continue
+            for scale in scales:
+                chords_in_scale[scale].extend(chords)
+            for chord in chords:
+                scales_containing[chord].extend(scales)
+
+    chord_order = {chord: order for order, chord in enumerate(chord_masks)}
+    scale_order = {scale: order for order, scale in enumerate(scale_masks)}
+    return _Harmonisation(
+        {
+            scale: tuple(
+                sorted(
+                    chords,
+                    key=lambda chord: (
+                        _distance(scale.root, chord.root),
+                        chord_order[chord],
+                    ),
+                )
+            )
+            for scale, chords in chords_in_scale.items()
+        },
+        {
+            chord: tuple(
+                sorted(
+                    scales,
+                    key=lambda scale: (
+                        _distance(chord.root, scale.root),
+                        scale_order[scale],
+                    ),
+                )
+            )
+            for chord, scales in scales_containing.items()
+        },
+    )
+
+
+def _chromatic_root(root: str) -> str:
+    """Spell the root as in CHROMATICS_NOTES, any spelling is accepted."""
+    return CHROMATICS_NOTES[note_to_pitch_class(root)]
+
+
+def chords_in_scale(root: str, mode: str) -> List[Chord]:
+    """Get the chords of CHORDS_DICT_ESSENTIAL whose notes are all in the scale.
+
+    Parameters
+    ----------
+    root : str
+        Root of the scale, any spelling
+    mode : str
+        Mode of SCALES_DICT, or a ModeName
+
+    Returns
+    -------
+    List[Chord]
+        Chords sorted by root from the root of the scale, then in the order
+        of CHORDS_DICT_ESSENTIAL. Roots are spelled as in CHROMATICS_NOTES.
+
+    Raises
+    ------
+    KeyError
+        If the mode is unknown
+    ValueError
+        If the root is not a valid note
+
+    Example
+    -------
+    >>> chords_in_scale("C", "Majorpentatonic")[:3]
+        [Chord(root='C', quality='M'), Chord(root='C', quality='5'),
+         Chord(root='C', quality='6')]
+    """
+    return list(_harmonisation().chords_in_scale[Scale(_chromatic_root(root), mode)])
+
+
+def scales_containing(root: str, quality: str) -> List[Scale]:
+    """Get the scales of SCALES_DICT containing every note of the chord.
+
+    Parameters
+    ----------
+    root : str
+        Root of the chord, any spelling
+    quality : str
+        Quality of CHORDS_DICT_ESSENTIAL, or a ChordName
+
+    Returns
+    -------
+    List[Scale]
+        Scales sorted by root from the root of the chord, then in the order
+        of SCALES_DICT. Roots are spelled as in CHROMATICS_NOTES.
+
+    Raises
+    ------
+    KeyError
+        If the quality is unknown
+    ValueError
+        If the root is not a valid note
+    """
+    return list(
+        _harmonisation().scales_containing[Chord(_chromatic_root(root), quality)]
+    )
@@ -0,0 +1,102 @@
+"""Pitch classes of every fret of a neck, and frets of every pitch class.
+
+A NeckMap only depends on the tuning and the frets range, it is computed
+once for each of them and shared by the fretboards and the containers.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+from fretboardgtr.constants import CHROMATICS_NOTES
+from fretboardgtr.utils import note_to_pitch_class
+
+
+@dataclass(frozen=True)
+class NeckMap:
+    """Fret to pitch class map of each string, from first_fret to last_fret.
+
+    Strings are in the order of the tuning.
+
+    Attributes
+    ----------
+    open_pitch_classes : Tuple[int, ...]
+        Pitch class of each open string
+    pitch_classes : Tuple[Tuple[int, ...], ...]
+        Pitch class of each fret of each string, from first_fret
+    frets : Tuple[Tuple[Tuple[int, ...], ...], ...]
+        Frets of each pitch class of each string, in ascending order
+    """
+
+    tuning: Tuple[str, ...]
+    first_fret: int
+    last_fret: int
+    open_pitch_classes: Tuple[int, ...]
+    pitch_classes: Tuple[Tuple[int, ...], ...]
+    frets: Tuple[Tuple[Tuple[int, ...], ...], ...]
+
+    def pitch_class(self, string_no: int, fret: int) -> int:
+        """Get the pitch class of a fret, even out of the range of the map."""
+        return (self.open_pitch_classes[string_no] + fret) % 12
+
+    def note(self, string_no: int, fret: int) -> str:
+        """Get the chromatic sharp note of a fret, as get_note_from_index."""
+        return CHROMATICS_NOTES[self.pitch_class(string_no, fret)]
+
+
+@lru_cache(maxsize=256)
+def _neck_map(tuning: Tuple[str, ...], first_fret: int, last_fret: int) -> NeckMap:
+    open_pitch_classes = tuple(note_to_pitch_class(note) for note in tuning)
+    pitch_classes = []
+    frets = []
+    for open_pitch_class in open_pitch_classes:
+        string_pitch_classes = tuple(
+            (open_pitch_class + fret) % 12 for fret in range(first_fret, last_fret + 1)
+        )
+        string_frets: Tuple[Tuple[int, ...], ...] = tuple(
+            tuple(
+                fret
+                for fret, fret_pitch_class in enumerate(
+                    string_pitch_classes, first_fret
+                )
+                if fret_pitch_class == pitch_class
+            )
+            for pitch_class in range(12)
+        )
+        pitch_classes.append(string_pitch_classes)
+        frets.append(string_frets)
+    return NeckMap(
+        tuning,
+        first_fret,
+        last_fret,
+        open_pitch_classes,
+        tuple(pitch_classes),
+        tuple(frets),
+    )
+
+
+def get_neck_map(tuning: Sequence[str], first_fret: int, last_fret: int) -> NeckMap:
+    """Get the neck map of a tuning between first_fret and last_fret.
+
+    Neck maps are memoised on the tuning and the frets range.
+
+    Parameters
+    ----------
+    tuning : Sequence[str]
+        Note of each open string
+    first_fret : int
+        First fret of the map
+    last_fret : int
+        Last fret of the map, included
+
+    Returns
+    -------
+    NeckMap
+        Shared neck map
+
+    Example
+    -------
+    >>> neck_map = get_neck_map(["E", "A", "D", "G", "B", "E"], 0, 12)
+    >>> neck_map.frets[0][note_to_pitch_class("G")]
+        (3,)
+    """
+    return _neck_map(tuple(tuning), first_fret, last_fret)
@@ -1,16 +1,85 @@
-from typing import Tuple
+from typing import ClassVar, Dict, Optional, Tuple
 
 from fretboardgtr.constants import FLAT_CHROMATICS_NOTES, SHARP_CHROMATICS_NOTES
 
+# Maximum number of spellings interned by Note
+NOTE_CACHE_SIZE = 1024
+
 
 class Note:
+    """Spelled note, eg C, F# or Bbb.
+
+    Notes are immutable and interned : there is a single Note for each
+    spelling, building it again returns the same object. Derived values
+    are computed once per spelling. Once NOTE_CACHE_SIZE spellings are
+    interned, other spellings are built each time, notes are compared by
+    name so they are still equal.
+    """
+
+    __slots__ = (
+        "name",
+        "_pitch_class",
+        "_accidentals",
+        "_base_note",
+        "_resolved_flat",
+        "_resolved_sharp",
+        "_flat_enharmonic",
+        "_sharp_enharmonic",
+    )
+
     _BASE_NOTES = ["A", "B", "C", "D", "E", "F", "G"]
     _BASE_NOTES_DISTANCE = [2, 2, 1, 2, 2, 1, 2]
+    _instances: ClassVar[Dict[str, "Note"]] = {}
+
+    name: str
+    _pitch_class: int
+    _accidentals: int
+    _base_note: str
+    _resolved_flat: Optional["Note"]
+    _resolved_sharp: Optional["Note"]
+    _flat_enharmonic: Optional["Note"]
+    _sharp_enharmonic: Optional["Note"]
+
+    def __new__(cls, name: str) -> "Note":
+        note = cls._instances.get(name)
+        if note is not None:
+            return note
+
+        note = super().__new__(cls)
+        object.__setattr__(note, "name", name)
+        if not note.check_if_valid():
+            raise ValueError(f"{name} is not a valid note")
+        object.__setattr__(
+            note, "_pitch_class", FLAT_CHROMATICS_NOTES.index(note._resolve())
+        )
+        object.__setattr__(note, "_accidentals", name.count("#") - name.count("b"))
+        object.__setattr__(note, "_base_note", name[0])
+        object.__setattr__(note, "_resolved_flat", None)
+        object.__setattr__(note, "_resolved_sharp", None)
+        object.__setattr__(note, "_flat_enharmonic", None)
+        object.__setattr__(note, "_sharp_enharmonic", None)
+        if len(cls._instances) < NOTE_CACHE_SIZE:
+            # setdefault is atomic : concurrent builds get the same note
+            note = cls._instances.setdefault(name, note)
+        return note
 
     def __init__(self, name: str):
-        self.name = name
-        if not self.check_if_valid():
-            raise ValueError(f"{name} is not a valid note")
+        # Everything is done once per spelling in __new__
+        pass
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self) -> Tuple[type, Tuple[str]]:
+        return (Note, (self.name,))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Note):
+            return NotImplemented
+        return self.name == other.name
+
+    def __hash__(self) -> int:
+        return hash(self.name)
 
     def __str__(self) -> str:
         return self.name
@@ -18,8 +87,18 @@ class Note:
     def __repr__(self) -> str:
         return self.name
 
+    @property
+    def pitch_class(self) -> int:
+        """Pitch class of the note, A being 0."""
+        return self._pitch_class
+
+    @property
+    def accidentals(self) -> int:
+        """Number of sharps of the note, negative for flats."""
+        return self._accidentals
+
     def base_note(self) -> str:
-        return self.name[0]
+        return self._base_note
 
     def _resolve(self, prefer_flat: bool = True) -> str:
         if len(self.name) == 1:
@@ -46,7 +125,12 @@ class Note:
 
     def resolve(self, prefer_flat: bool = True) -> "Note":
         """Resolve alterations in notes."""
-        return Note(self._resolve(prefer_flat))
+        slot = "_resolved_flat" if prefer_flat else "_resolved_sharp"
+        resolved: Optional[Note] = getattr(self, slot)
+        if resolved is None:
+            resolved = Note(self._resolve(prefer_flat))
+            object.__setattr__(self, slot, resolved)
+        return resolved
 
     def check_if_valid(self) -> bool:
         resolved_note = self._resolve()
@@ -119,6 +203,38 @@ class Note:
         If the note has alterations, it retains them and applies flats
         instead of sharps.
 
+        Returns
+        -------
+        Note
+            The enharmonic equivalent note with flats.
+        """
+        if self._flat_enharmonic is None:
+            object.__setattr__(self, "_flat_enharmonic", self._get_flat_enharmonic())
+        assert self._flat_enharmonic is not None
+        return self._flat_enharmonic
+
+    def sharp_enharmonic(self) -> "Note":
+        """Transform the note into its enharmonic sharp equivalent.
+
+        If the note has alterations, it retains them and applies sharps
+        instead of flats.
+
+        Returns
+        -------
+        Note
+            The enharmonic equivalent note with sharps.
+        """
+        if self._sharp_enharmonic is None:
+            object.__setattr__(self, "_sharp_enharmonic", self._get_sharp_enharmonic())
+        assert self._sharp_enharmonic is not None
+        return self._sharp_enharmonic
+
+    def _get_flat_enharmonic(self) -> "Note":
+        """Transform the note into its enharmonic flat equivalent.
+
+        If the note has alterations, it retains them and applies flats
+        instead of sharps.
+
         Returns
         -------
         Note
@@ -140,7 +256,7 @@ class Note:
             flats_to_add = "b" * distance
             return Note(target_note + flats_to_add)
 
-    def sharp_enharmonic(self) -> "Note":
+    def _get_sharp_enharmonic(self) -> "Note":
         """Transform the note into its enharmonic sharp equivalent.
 
         If the note has alterations, it retains them and applies sharps
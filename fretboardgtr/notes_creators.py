@@ -1,9 +1,23 @@
 from dataclasses import dataclass
-from itertools import product
-from typing import List, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from fretboardgtr.constants import CHORDS_DICT_ESSENTIAL, CHROMATICS_NOTES, SCALES_DICT
-from fretboardgtr.utils import chromatic_position_from_root, get_note_from_index
+from fretboardgtr.fingerings import (
+    PlayabilityWeights,
+    best_chord_fingerings,
+    search_chord_fingerings,
+    vectorized_chord_fingerings,
+)
+from fretboardgtr.neck_map import get_neck_map
+from fretboardgtr.scale_positions import PositionSystem, get_scale_positions
+from fretboardgtr.transposition import transpose_note
+from fretboardgtr.utils import (
+    HAS_NUMPY,
+    note_to_pitch_class,
+    notes_to_mask,
+)
 
 
 def find_first_index(_list: List[int], value: int) -> Optional[int]:
@@ -14,11 +28,56 @@ def find_first_index(_list: List[int], value: int) -> Optional[int]:
         return None  # If the value is not found in the tuple, return None
 
 
+@lru_cache(maxsize=1024)
+def _get_scale(
+    pitch_classes: Tuple[int, ...], tuning: Tuple[str, ...], max_spacing: int
+) -> Tuple[Tuple[int, ...], ...]:
+    # Chromatic positions of the notes on each string, from 0 up to
+    # 12 + max_spacing - 1
+    neck_map = get_neck_map(tuning, 0, 12 + max_spacing - 1)
+    return tuple(
+        tuple(
+            sorted(
+                fret
+                for pitch_class in pitch_classes
+                for fret in string_frets[pitch_class]
+            )
+        )
+        for string_frets in neck_map.frets
+    )
+
+
+@lru_cache(maxsize=4096)
+def _notes_pitch_classes(notes: Tuple[str, ...]) -> Tuple[Tuple[int, ...], int]:
+    """Get the pitch class of each note and their 12-bit mask."""
+    return tuple(note_to_pitch_class(note) for note in notes), notes_to_mask(notes)
+
+
 @dataclass
 class NotesContainer:
+    """Notes of a scale or a chord.
+
+    ScaleFromName and ChordFromName build each scale or chord once and give
+    a copy of it, with its own lists, to every caller.
+    """
+
     root: str
     notes: List[str]
 
+    def _copy(self) -> "NotesContainer":
+        """Copy a shared container, with its own list of notes."""
+        return NotesContainer(self.root, list(self.notes))
+
+    @property
+    def pitch_classes(self) -> List[int]:
+        """Pitch class of each note, A being 0."""
+        return list(_notes_pitch_classes(tuple(self.notes))[0])
+
+    @property
+    def pitch_class_mask(self) -> int:
+        """12-bit mask of the pitch classes of the notes."""
+        return _notes_pitch_classes(tuple(self.notes))[1]
+
     def get_scale(self, tuning: List[str], max_spacing: int = 5) -> List[List[int]]:
         """Get the scale of each string in the given tuning.
 
@@ -34,26 +93,49 @@ class NotesContainer:
         List[List[int]]
             The scale of each string in the tuning.
         """
-        scale = []
+        pitch_classes, _ = _notes_pitch_classes(tuple(self.notes))
+        scale = _get_scale(pitch_classes, tuple(tuning), max_spacing)
+        return [list(string_scale) for string_scale in scale]
 
-        # Iterate over each string in the tuning
-        for string_note in tuning:
-            indices = []
+    def transpose(self, semitones: int) -> "NotesContainer":
+        """Get the container transposed by a number of semitones.
 
-            # Iterate over each note in the self.notes list
-            for note in self.notes:
-                _idx = chromatic_position_from_root(note, string_note)
+        Notes are spelled as chromatic sharp notes, like the builders do.
+        Transposed containers are memoised, a copy is returned.
 
-                # Add the chromatic positions of the note on the string
-                # until it reaches or exceeds the maximum position of 16
-                while _idx <= 12 + max_spacing - 1:
-                    indices.append(_idx)
-                    _idx += 12
+        Parameters
+        ----------
+        semitones : int
+            Number of semitones to transpose by, may be negative
 
-            # Sort the indices in ascending order
-            scale.append(sorted(indices))
+        Returns
+        -------
+        NotesContainer
+            Transposed container
 
-        return scale
+        Example
+        -------
+        >>> ScaleFromName(root="C", mode="Ionian").build().transpose(2)
+            NotesContainer(root='D', notes=['D', 'E', 'F#', 'G', 'A', 'B', 'C#'])
+        """
+        if semitones % 12 == 0:
+            return self._copy()
+        return _transposed_container(
+            self.root, tuple(self.notes), semitones % 12
+        )._copy()
+
+    def _chord_search_inputs(
+        self, tuning: List[str], max_spacing: int
+    ) -> Tuple[List[List[int]], List[List[int]], int]:
+        """Get the scale, its pitch class bits and the chord bitmask."""
+        scale = self.get_scale(tuning, max_spacing)
+        neck_map = get_neck_map(tuning, 0, 12 + max_spacing - 1)
+        pitch_classes = []
+        for string_pitch_classes, string_scale in zip(neck_map.pitch_classes, scale):
+            pitch_classes.append(
+                [1 << string_pitch_classes[fret] for fret in string_scale]
+            )
+        return scale, pitch_classes, self.pitch_class_mask
 
     def get_chord_fingerings(
         self,
@@ -64,6 +146,8 @@ class NotesContainer:
     ) -> List[List[Optional[int]]]:
         """Get all probably possible fingering for a specific tuning.
 
+        Uses the numpy vectorized search when numpy is installed.
+
         Parameters
         ----------
         tuning : List[str]
@@ -80,80 +164,204 @@ class NotesContainer:
         List[List[Optional[int]]]
             List of propably possible fingerings
         """
-        scale = self.get_scale(tuning, max_spacing)
+        search_inputs = self._chord_search_inputs(tuning, max_spacing)
+        if HAS_NUMPY:
+            return vectorized_chord_fingerings(
+                *search_inputs, max_spacing, min_notes_in_chord, number_of_fingers
+            )
+        return list(
+            search_chord_fingerings(
+                *search_inputs, max_spacing, min_notes_in_chord, number_of_fingers
+            )
+        )
+
+    def iter_chord_fingerings(
+        self,
+        tuning: List[str],
+        max_spacing: int = 5,
+        min_notes_in_chord: int = 2,
+        number_of_fingers: int = 4,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Iterator[List[Optional[int]]]:
+        """Lazily generate the probably possible fingerings for a specific tuning.
 
-        fingerings = []
-        for combination in product(*scale):
-            non_zero_numbers = [num for num in combination if num != 0]
-            # No more than 4 fingers but duplicated allowed
-            if len(set(non_zero_numbers)) > number_of_fingers:
-                continue
-
-            new_combination = list(combination)
-            while True:
-                # If 0 note or only one this is not a chord so break
-                if len(non_zero_numbers) < min_notes_in_chord:
-                    break
-                # If the spacing is less than 5 then it'ok so break
-                if max(non_zero_numbers) - min(non_zero_numbers) <= max_spacing:
-                    break
-
-                # If the spacing is more than 5 then remplace min values by None
-                index_of_min = find_first_index(new_combination, min(non_zero_numbers))
-                index_of_non_zero_min = find_first_index(
-                    non_zero_numbers, min(non_zero_numbers)
-                )
-                if index_of_min is not None and index_of_non_zero_min is not None:
-                    new_combination[index_of_min] = None
-                    del non_zero_numbers[index_of_non_zero_min]
-
-            notes = []
-            for index, note in zip(new_combination, tuning):
-                if index is not None:
-                    notes.append(get_note_from_index(index, note))
-
-            # Each notes should appear at least once.
-            if set(notes) != set(self.notes):
-                continue
-
-            fingerings.append(list(new_combination))
-        return fingerings
+        Fingerings are generated in the same order as get_chord_fingerings, only
+        computing what is consumed. This allows to get a page of fingerings
+        without building the whole list.
+
+        Parameters
+        ----------
+        tuning : List[str]
+            List of note of the tuning
+        max_spacing : int
+            Maximum spacing between notes
+        min_notes_in_chord : int
+            Minimum number of notes in chord
+        number_of_fingers : int
+            Number of fingers allowed
+        limit : Optional[int]
+            Maximum number of fingerings to generate, by default all of them
+        offset : int
+            Number of fingerings to skip first, by default 0
+
+        Yields
+        ------
+        List[Optional[int]]
+            Probably possible fingering
+
+        Example
+        -------
+        >>> chord = ChordFromName(root="C", quality="M").build()
+        >>> page = list(chord.iter_chord_fingerings(TUNING, limit=20, offset=40))
+        """
+        if offset < 0:
+            raise ValueError(f"Offset should be positive. Got {offset}")
+        if limit is not None and limit < 0:
+            raise ValueError(f"Limit should be positive. Got {limit}")
+
+        fingerings = search_chord_fingerings(
+            *self._chord_search_inputs(tuning, max_spacing),
+            max_spacing,
+            min_notes_in_chord,
+            number_of_fingers,
+        )
+        stop = offset + limit if limit is not None else None
+        yield from islice(fingerings, offset, stop)
+
+    def best_chord_fingerings(
+        self,
+        tuning: List[str],
+        k: int = 5,
+        max_spacing: int = 5,
+        min_notes_in_chord: int = 2,
+        number_of_fingers: int = 4,
+        weights: Optional[PlayabilityWeights] = None,
+    ) -> List[List[Optional[int]]]:
+        """Get the k most playable fingerings for a specific tuning, best first.
+
+        Fingerings are ranked with fingerings.playability_score, the root of
+        the container being the chord root. Only the branches of the search
+        that can make it to the k best fingerings are explored.
+
+        Parameters
+        ----------
+        tuning : List[str]
+            List of note of the tuning
+        k : int
+            Number of fingerings to get
+        max_spacing : int
+            Maximum spacing between notes
+        min_notes_in_chord : int
+            Minimum number of notes in chord
+        number_of_fingers : int
+            Number of fingers allowed
+        weights : Optional[PlayabilityWeights]
+            Weights of the playability score, by default PlayabilityWeights()
+
+        Returns
+        -------
+        List[List[Optional[int]]]
+            At most k fingerings, best first
+
+        Example
+        -------
+        >>> chord = ChordFromName(root="C", quality="M").build()
+        >>> chord.best_chord_fingerings(TUNING, k=3)
+        """
+        return best_chord_fingerings(
+            *self._chord_search_inputs(tuning, max_spacing),
+            [note_to_pitch_class(string_note) for string_note in tuning],
+            note_to_pitch_class(self.root),
+            k,
+            max_spacing,
+            min_notes_in_chord,
+            number_of_fingers,
+            weights,
+        )
 
     def get_scale_positions(
         self,
         tuning: List[str],
         max_spacing: int = 5,
+        system: str = PositionSystem.FIXED_WINDOW,
+        first_fret: int = 0,
+        last_fret: Optional[int] = None,
     ) -> List[List[List[Optional[int]]]]:
         """Get all possible scale positions for a specific tuning.
 
+        See scale_positions.get_scale_positions, the positions are memoised.
+
         Parameters
         ----------
         tuning : List[str]
             List of note of the tuning
         max_spacing : int
             Maximum spacing between notes
+        system : str
+            One of scale_positions.PositionSystem, by default the fixed window
+        first_fret : int
+            Lowest fret of the positions
+        last_fret : Optional[int]
+            Highest fret of the positions, by default 12 + max_spacing - 1
 
         Returns
         -------
         List[List[List[Optional[int]]]]
             List of all possible scale positions
         """
-        scale = self.get_scale(tuning, max_spacing)
-        fingerings: List[List[List[Optional[int]]]] = []
-        for first_string_pos in scale[0]:
-            fingering: List[List[Optional[int]]] = []
-            for string in scale:
-                string_fingering: List[Optional[int]] = []
-                for note in string:
-                    if (
-                        note - first_string_pos < 0
-                        or note - first_string_pos >= max_spacing
-                    ):
-                        continue
-                    string_fingering.append(note)
-                fingering.append(string_fingering)
-            fingerings.append(fingering)
-        return fingerings
+        if last_fret is None:
+            last_fret = 12 + max_spacing - 1
+        positions: List[List[List[Optional[int]]]] = []
+        for position in get_scale_positions(
+            tuning,
+            self.pitch_class_mask,
+            system,
+            first_fret,
+            last_fret,
+            max_spacing,
+            note_to_pitch_class(self.root),
+        ):
+            positions.append([list(frets) for frets in position])
+        return positions
+
+
+def _container_from_intervals(root: str, intervals: List[int]) -> NotesContainer:
+    index = CHROMATICS_NOTES.index(root)
+    scale = []
+    for note_id in intervals:
+        scale.append(CHROMATICS_NOTES[(index + note_id) % 12])
+    return NotesContainer(root, scale)
+
+
+@lru_cache(maxsize=None)
+def _scale_containers() -> Dict[Tuple[str, str], NotesContainer]:
+    """Get the container of every root and mode, built on first use."""
+    return {
+        (root, mode): _container_from_intervals(root, intervals)
+        for root in CHROMATICS_NOTES
+        for mode, intervals in SCALES_DICT.items()
+    }
+
+
+@lru_cache(maxsize=None)
+def _chord_containers() -> Dict[Tuple[str, str], NotesContainer]:
+    """Get the container of every root and chord quality, built on first use."""
+    return {
+        (root, quality): _container_from_intervals(root, intervals)
+        for root in CHROMATICS_NOTES
+        for quality, intervals in CHORDS_DICT_ESSENTIAL.items()
+    }
+
+
+@lru_cache(maxsize=1024)
+def _transposed_container(
+    root: str, notes: Tuple[str, ...], semitones: int
+) -> NotesContainer:
+    return NotesContainer(
+        transpose_note(root, semitones),
+        [transpose_note(note, semitones) for note in notes],
+    )
 
 
 class ScaleFromName:
@@ -178,12 +386,11 @@ class ScaleFromName:
         self.mode = mode
 
     def build(self) -> NotesContainer:
-        index = CHROMATICS_NOTES.index(self.root)
-        mode_idx = SCALES_DICT[self.mode]
-        scale = []
-        for note_id in mode_idx:
-            scale.append(CHROMATICS_NOTES[(index + note_id) % 12])
-        return NotesContainer(self.root, scale)
+        container = _scale_containers().get((self.root, self.mode))
+        if container is None:
+            # Raises for an unknown root or mode
+            return _container_from_intervals(self.root, SCALES_DICT[self.mode])
+        return container._copy()
 
 
 class ChordFromName:
@@ -208,10 +415,10 @@ class ChordFromName:
         self.quality = quality
 
     def build(self) -> NotesContainer:
-        index = CHROMATICS_NOTES.index(self.root)
-
-        quality_idx = CHORDS_DICT_ESSENTIAL[self.quality]
-        scale = []
-        for note_id in quality_idx:
-            scale.append(CHROMATICS_NOTES[(index + note_id) % 12])
-        return NotesContainer(self.root, scale)
+        container = _chord_containers().get((self.root, self.quality))
+        if container is None:
+            # Raises for an unknown root or quality
+            return _container_from_intervals(
+                self.root, CHORDS_DICT_ESSENTIAL[self.quality]
+            )
+        return container._copy()
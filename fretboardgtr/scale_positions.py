@@ -0,0 +1,253 @@
+"""Scale positions over the neck, for several fingering systems.
+
+A position is a list of frets for each string of the tuning, that can be
+given to FretBoard.add_scale. Positions only depend on the tuning, the
+pitch classes of the scale, the system and the frets range, they are
+memoised on those.
+"""
+from enum import Enum
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from fretboardgtr.utils import note_to_pitch_class
+
+_Position = Tuple[Tuple[int, ...], ...]
+
+
+class PositionSystem(str, Enum):
+    """Systems of scale positions.
+
+    FIXED_WINDOW
+        Notes within max_spacing frets of each scale note of the first string
+    THREE_NOTES_PER_STRING
+        Three consecutive scale notes on each string, from each scale note of
+        the first string
+    CAGED
+        Windows of the C, A, G, E and D chord shapes around the root, for a
+        standard tuning
+    """
+
+    FIXED_WINDOW = "fixed_window"
+    THREE_NOTES_PER_STRING = "three_notes_per_string"
+    CAGED = "caged"
+
+
+# Intervals between consecutive strings of a standard six strings tuning
+STANDARD_TUNING_INTERVALS = (5, 5, 5, 4, 5)
+# Shape name : (string of the root from the first string, first fret of the
+# window from the root fret). Windows are CAGED_WINDOW_WIDTH frets wide.
+CAGED_SHAPES: Dict[str, Tuple[int, int]] = {
+    "C": (1, -3),
+    "A": (1, -1),
+    "G": (0, -3),
+    "E": (0, -1),
+    "D": (2, -1),
+}
+CAGED_WINDOW_WIDTH = 4
+
+
+def _in_scale(pitch_class_mask: int, pitch_class: int) -> bool:
+    return bool(pitch_class_mask >> (pitch_class % 12) & 1)
+
+
+def _scale_frets(
+    open_pitch_class: int, pitch_class_mask: int, first_fret: int, last_fret: int
+) -> List[int]:
+    return [
+        fret
+        for fret in range(first_fret, last_fret + 1)
+        if _in_scale(pitch_class_mask, open_pitch_class + fret)
+    ]
+
+
+def _fixed_window_positions(
+    open_pitch_classes: List[int],
+    pitch_class_mask: int,
+    first_fret: int,
+    last_fret: int,
+    max_spacing: int,
+) -> List[_Position]:
+    string_frets = [
+        _scale_frets(open_pitch_class, pitch_class_mask, first_fret, last_fret)
+        for open_pitch_class in open_pitch_classes
+    ]
+    positions = []
+    for start in string_frets[0]:
+        positions.append(
+            tuple(
+                tuple(fret for fret in frets if start <= fret < start + max_spacing)
+                for frets in string_frets
+            )
+        )
+    return positions
+
+
+def _three_notes_per_string_positions(
+    open_pitch_classes: List[int],
+    pitch_class_mask: int,
+    first_fret: int,
+    last_fret: int,
+) -> List[_Position]:
+    # Pitch of each open string from the first one, each string being
+    # less than an octave above the previous one
+    open_pitches = [0]
+    for previous, current in zip(open_pitch_classes, open_pitch_classes[1:]):
+        open_pitches.append(open_pitches[-1] + (current - previous) % 12)
+
+    positions = []
+    for start in _scale_frets(
+        open_pitch_classes[0], pitch_class_mask, first_fret, last_fret
+    ):
+        pitch = start
+        position = []
+        for open_pitch in open_pitches:
+            string_frets = []
+            for _ in range(3):
+                string_frets.append(pitch - open_pitch)
+                pitch += 1
+                while not _in_scale(pitch_class_mask, open_pitch_classes[0] + pitch):
+                    pitch += 1
+            position.append(tuple(string_frets))
+        if all(
+            first_fret <= fret <= last_fret
+            for string_frets in position
+            for fret in string_frets
+        ):
+            positions.append(tuple(position))
+    return positions
+
+
+def _caged_positions(
+    open_pitch_classes: List[int],
+    pitch_class_mask: int,
+    first_fret: int,
+    last_fret: int,
+    root_pitch_class: int,
+) -> List[_Position]:
+    intervals = tuple(
+        (current - previous) % 12
+        for previous, current in zip(open_pitch_classes, open_pitch_classes[1:])
+    )
+    if intervals != STANDARD_TUNING_INTERVALS:
+        raise ValueError("CAGED positions are only defined for a standard tuning")
+
+    windows = []
+    for shape_order, (root_string, offset) in enumerate(CAGED_SHAPES.values()):
+        root_fret = (root_pitch_class - open_pitch_classes[root_string]) % 12
+        # Every octave of the root on the string, the window may start
+        # below the root fret
+        while root_fret + offset < first_fret:
+            root_fret += 12
+        while root_fret + offset + CAGED_WINDOW_WIDTH - 1 <= last_fret:
+            windows.append((root_fret + offset, shape_order))
+            root_fret += 12
+
+    positions = []
+    for start, _ in sorted(windows):
+        positions.append(
+            tuple(
+                tuple(
+                    _scale_frets(
+                        open_pitch_class,
+                        pitch_class_mask,
+                        start,
+                        start + CAGED_WINDOW_WIDTH - 1,
+                    )
+                )
+                for open_pitch_class in open_pitch_classes
+            )
+        )
+    return positions
+
+
+@lru_cache(maxsize=1024)
+def _scale_positions(
+    tuning: Tuple[str, ...],
+    pitch_class_mask: int,
+    system: PositionSystem,
+    first_fret: int,
+    last_fret: int,
+    max_spacing: int,
+    root_pitch_class: Optional[int],
+) -> Tuple[_Position, ...]:
+    if not tuning or pitch_class_mask == 0:
+        return ()
+    open_pitch_classes = [note_to_pitch_class(note) for note in tuning]
+    if system == PositionSystem.FIXED_WINDOW:
+        positions = _fixed_window_positions(
+            open_pitch_classes, pitch_class_mask, first_fret, last_fret, max_spacing
+        )
+    elif system == PositionSystem.THREE_NOTES_PER_STRING:
+        positions = _three_notes_per_string_positions(
+            open_pitch_classes, pitch_class_mask, first_fret, last_fret
+        )
+    else:
+        if root_pitch_class is None:
+            raise ValueError("CAGED positions need the pitch class of the root")
+        positions = _caged_positions(
+            open_pitch_classes,
+            pitch_class_mask,
+            first_fret,
+            last_fret,
+            root_pitch_class,
+        )
+    return tuple(positions)
+
+
+def get_scale_positions(
+    tuning: Sequence[str],
+    pitch_class_mask: int,
+    system: str = PositionSystem.FIXED_WINDOW,
+    first_fret: int = 0,
+    last_fret: int = 24,
+    max_spacing: int = 5,
+    root_pitch_class: Optional[int] = None,
+) -> List[List[List[int]]]:
+    """Get the scale positions of a system between first_fret and last_fret.
+
+    Positions are memoised on the tuning, the pitch classes, the system and
+    the frets range. Scales sharing the same pitch classes, like the modes
+    of a key, share the same positions for the fixed window and three notes
+    per string systems.
+
+    Parameters
+    ----------
+    tuning : Sequence[str]
+        Note of each open string, from the lowest string
+    pitch_class_mask : int
+        Bitmask of the pitch classes of the scale
+    system : str
+        One of PositionSystem, by default PositionSystem.FIXED_WINDOW
+    first_fret : int
+        Lowest fret of the positions
+    last_fret : int
+        Highest fret of the positions
+    max_spacing : int
+        Width of the fixed windows
+    root_pitch_class : Optional[int]
+        Pitch class of the root, needed by the CAGED system only
+
+    Returns
+    -------
+    List[List[List[int]]]
+        Frets of each string for each position, from the lowest position
+
+    Raises
+    ------
+    ValueError
+        If the system is unknown, or the CAGED system is used without root
+        or with a tuning that is not standard
+    """
+    system = PositionSystem(system)
+    if system != PositionSystem.CAGED:
+        root_pitch_class = None
+    positions = _scale_positions(
+        tuple(tuning),
+        pitch_class_mask,
+        system,
+        first_fret,
+        last_fret,
+        max_spacing,
+        root_pitch_class,
+    )
+    return [[list(frets) for frets in position] for position in positions]
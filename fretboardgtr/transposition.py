@@ -0,0 +1,138 @@
+"""Transpose notes, fingerings and scale shapes by a number of semitones.
+
+Fingerings and scale shapes are moved along the neck as a whole, without
+searching them again : every played fret is shifted by the same number of
+frets, open strings included. A shape is moved to the lowest position of
+the transposed key that fits between first_fret and last_fret.
+"""
+from typing import Iterable, List, Optional, Sequence
+
+from fretboardgtr.utils import get_note_from_index
+
+
+def transpose_note(note: str, semitones: int) -> str:
+    """Get the note semitones above the note, as a chromatic sharp note.
+
+    >>> transpose_note("Bb", 3)
+        'C#'
+    """
+    return get_note_from_index(semitones, note)
+
+
+def _shape_shift(
+    frets: Iterable[Optional[int]], semitones: int, first_fret: int, last_fret: int
+) -> Optional[int]:
+    """Get the lowest shift of the shape to the new key that fits the range.
+
+    Open strings of the moved shape are allowed whatever first_fret.
+    """
+    played = [fret for fret in frets if fret is not None]
+    if not played:
+        return 0
+    lowest, highest = min(played), max(played)
+    shift = semitones % 12
+    for candidate in (shift - 12, shift):
+        if highest + candidate > last_fret:
+            continue
+        if lowest + candidate < 0:
+            continue
+        if all(
+            fret + candidate == 0 or fret + candidate >= first_fret for fret in played
+        ):
+            return candidate
+    return None
+
+
+def transpose_fingering(
+    fingering: Sequence[Optional[int]],
+    semitones: int,
+    first_fret: int = 0,
+    last_fret: int = 24,
+) -> Optional[List[Optional[int]]]:
+    """Move a fingering to the key semitones above.
+
+    Parameters
+    ----------
+    fingering : Sequence[Optional[int]]
+        Fret of each string, None for muted strings
+    semitones : int
+        Number of semitones to transpose by, may be negative
+    first_fret : int
+        Lowest fret allowed for the fretted notes
+    last_fret : int
+        Highest fret allowed
+
+    Returns
+    -------
+    Optional[List[Optional[int]]]
+        Moved fingering, or None if it does not fit between first_fret and
+        last_fret
+
+    Example
+    -------
+    >>> transpose_fingering([None, 3, 2, 0, 1, 0], 2)
+        [None, 5, 4, 2, 3, 2]
+    """
+    shift = _shape_shift(fingering, semitones, first_fret, last_fret)
+    if shift is None:
+        return None
+    return [None if fret is None else fret + shift for fret in fingering]
+
+
+def transpose_fingerings(
+    fingerings: Iterable[Sequence[Optional[int]]],
+    semitones: int,
+    first_fret: int = 0,
+    last_fret: int = 24,
+) -> List[List[Optional[int]]]:
+    """Move many fingerings to the key semitones above.
+
+    See transpose_fingering. Fingerings that do not fit the range are
+    dropped, the order of the others is kept.
+
+    Returns
+    -------
+    List[List[Optional[int]]]
+        Moved fingerings
+    """
+    transposed = []
+    for fingering in fingerings:
+        moved = transpose_fingering(fingering, semitones, first_fret, last_fret)
+        if moved is not None:
+            transposed.append(moved)
+    return transposed
+
+
+def transpose_scale(
+    scale: Sequence[Sequence[Optional[int]]],
+    semitones: int,
+    first_fret: int = 0,
+    last_fret: int = 24,
+) -> Optional[List[List[Optional[int]]]]:
+    """Move a scale shape, as given to FretBoard.add_scale, semitones above.
+
+    Parameters
+    ----------
+    scale : Sequence[Sequence[Optional[int]]]
+        Frets of each string
+    semitones : int
+        Number of semitones to transpose by, may be negative
+    first_fret : int
+        Lowest fret allowed for the fretted notes
+    last_fret : int
+        Highest fret allowed
+
+    Returns
+    -------
+    Optional[List[List[Optional[int]]]]
+        Moved shape, or None if it does not fit between first_fret and
+        last_fret
+    """
+    shift = _shape_shift(
+        (fret for frets in scale for fret in frets), semitones, first_fret, last_fret
+    )
+    if shift is None:
+        return None
+    return [
+        [None if fret is None else fret + shift for fret in frets] for frets in scale
+    ]
@@ -1,4 +1,15 @@
-from typing import Collection, Dict, List, Tuple
+from functools import lru_cache
+from itertools import combinations
+from typing import (
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from fretboardgtr.constants import (
     CHROMATICS_INTERVALS,
@@ -9,6 +20,41 @@ from fretboardgtr.constants import (
 )
 from fretboardgtr.notes import Note
 
+# numpy is optional, the other modules import it from here
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    np = None  # type: ignore
+    HAS_NUMPY = False
+
+# Pitch class of each natural note, A being 0
+_NATURAL_PITCH_CLASSES = {"A": 0, "B": 2, "C": 3, "D": 5, "E": 7, "F": 8, "G": 10}
+# Number of sharps or flats covered by the pitch class tables, notes with more
+# alterations are resolved with Note
+MAX_TABLE_ALTERATIONS = 12
+
+
+def _build_pitch_class_table() -> Dict[str, int]:
+    table = {}
+    for natural, pitch_class in _NATURAL_PITCH_CLASSES.items():
+        table[natural] = pitch_class
+        for alterations in range(1, MAX_TABLE_ALTERATIONS + 1):
+            table[natural + "#" * alterations] = (pitch_class + alterations) % 12
+            table[natural + "b" * alterations] = (pitch_class - alterations) % 12
+    return table
+
+
+# Pitch class of every spelling of every note
+_NOTE_PITCH_CLASSES: Dict[str, int] = _build_pitch_class_table()
+# Chromatic note at each interval from every spelling of every note
+_INTERVAL_NOTES: Dict[Tuple[str, int], str] = {
+    (note, interval): CHROMATICS_NOTES[(pitch_class + interval) % 12]
+    for note, pitch_class in _NOTE_PITCH_CLASSES.items()
+    for interval in range(12)
+}
+
 
 def get_valid_dots(first_fret: int, last_fret: int) -> List[int]:
     """Get the valid fretboard dots between frets.
@@ -40,17 +86,16 @@ def _contains_duplicates(iterable: Collection) -> bool:
 
 def chromatics_from_root(root: str) -> List[str]:
     """Create list of notes chromatically starting with root."""
-    notes = []
-    root_idx = CHROMATICS_NOTES.index(root)
-    for i, _ in enumerate(CHROMATICS_NOTES):
-        notes.append(CHROMATICS_NOTES[(root_idx + i) % 12])
-    return notes
+    root_idx = note_to_pitch_class(root)
+    return CHROMATICS_NOTES[root_idx:] + CHROMATICS_NOTES[:root_idx]
 
 
 def get_note_from_index(index: int, root: str) -> str:
     """Get note from chromatic scale from index and root."""
-    chroma_from_root = chromatics_from_root(root)
-    return chroma_from_root[index % 12]
+    note = _INTERVAL_NOTES.get((root, index % 12))
+    if note is None:
+        note = CHROMATICS_NOTES[(note_to_pitch_class(root) + index) % 12]
+    return note
 
 
 def to_sharp_note(note: str) -> str:
@@ -68,13 +113,41 @@ def to_flat_note(note: str) -> str:
 
 
 def chromatic_position_from_root(note: str, root: str) -> int:
-    """Get the index of the note from the root on chromatic scale."""
-    idx = 0
-    chroma_from_root = chromatics_from_root(root)
-    for _idx, chromatic_note in enumerate(chroma_from_root):
-        if chromatic_note == to_sharp_note(note):
-            idx = _idx
-    return idx
+    """Get the index of the note from the root on chromatic scale.
+
+    Any spelling of the note and of the root is accepted.
+    """
+    return (note_to_pitch_class(note) - note_to_pitch_class(root)) % 12
+
+
+def note_to_pitch_class(note: str) -> int:
+    """Get the pitch class of the note, A being 0.
+
+    Any spelling of the note is accepted.
+
+    >>> note_to_pitch_class("C")
+        3
+    >>> note_to_pitch_class("B#")
+        3
+    """
+    pitch_class = _NOTE_PITCH_CLASSES.get(note)
+    if pitch_class is None:
+        pitch_class = Note(note).pitch_class
+    return pitch_class
+
+
+def notes_to_mask(notes: Iterable[str]) -> int:
+    """Get the 12-bit mask of the pitch classes of the notes.
+
+    Bit n is set if a note has the pitch class n.
+
+    >>> bin(notes_to_mask(["A", "C", "E"]))
+        '0b10001001'
+    """
+    mask = 0
+    for note in notes:
+        mask |= 1 << note_to_pitch_class(note)
+    return mask
 
 
 def scale_to_sharp(scale: List[str]) -> List[str]:
@@ -97,9 +170,7 @@ def scale_to_flat(scale: List[str]) -> List[str]:
 
 def note_to_interval(note: str, root: str) -> int:
     """Get note from interval (int)."""
-    sharp_note = to_sharp_note(note)
-    idx = chromatic_position_from_root(sharp_note, root)
-    return idx
+    return chromatic_position_from_root(note, root)
 
 
 def note_to_interval_name(note: str, root: str) -> str:
@@ -108,6 +179,131 @@ def note_to_interval_name(note: str, root: str) -> str:
     return CHROMATICS_INTERVALS[idx]
 
 
+def _pitch_classes(notes: Sequence[str]) -> List[int]:
+    try:
+        return list(map(_NOTE_PITCH_CLASSES.__getitem__, notes))
+    except KeyError:
+        return [note_to_pitch_class(note) for note in notes]
+
+
+def _array_pitch_classes(notes: Union[str, Sequence[str]]) -> "np.ndarray":
+    if isinstance(notes, str):
+        return np.array(note_to_pitch_class(notes), np.int64)
+    if not isinstance(notes, np.ndarray):
+        return np.array(_pitch_classes(notes), np.int64)
+    if notes.dtype.kind != "U" or notes.size == 0:
+        return np.array(_pitch_classes(notes.ravel().tolist()), np.int64).reshape(
+            notes.shape
+        )
+    # Letter and alterations of each note, read from the characters
+    codes = np.ascontiguousarray(notes).view(np.uint32).reshape(notes.size, -1)
+    letters = _array_letter_pitch_classes()[np.minimum(codes[:, 0], 127)]
+    alterations = codes[:, 1:]
+    sharps = (alterations == ord("#")).sum(axis=1)
+    flats = (alterations == ord("b")).sum(axis=1)
+    # Characters after the alterations are padding
+    padding = (alterations == 0).sum(axis=1)
+    valid = (letters >= 0) & (
+        (sharps + padding == alterations.shape[1])
+        | (flats + padding == alterations.shape[1])
+    )
+    pitch_classes = (letters + sharps - flats) % 12
+    if not valid.all():
+        # Raises for invalid notes
+        pitch_classes[~valid] = _pitch_classes(notes.ravel()[~valid].tolist())
+    return pitch_classes.reshape(notes.shape)
+
+
+@lru_cache(maxsize=None)
+def _array_letter_pitch_classes() -> "np.ndarray":
+    """Get the pitch class of each ASCII natural note letter, -1 for others."""
+    letters = np.full(128, -1, np.int64)
+    for natural, pitch_class in _NATURAL_PITCH_CLASSES.items():
+        letters[ord(natural)] = pitch_class
+    return letters
+
+
+def notes_to_intervals(
+    notes: Sequence[str], roots: Union[str, Sequence[str]]
+) -> Union[List[int], "np.ndarray"]:
+    """Get the interval of each note from its root, as note_to_interval.
+
+    Numpy arrays of notes or roots give a numpy array of intervals, computed
+    with array operations. Other sequences give a list.
+
+    Parameters
+    ----------
+    notes : Sequence[str]
+        Notes, as a sequence or a numpy array of strings
+    roots : Union[str, Sequence[str]]
+        Root of each note, or a single root for every note
+
+    Returns
+    -------
+    Union[List[int], np.ndarray]
+        Intervals from 0 to 11, as a numpy array for numpy arrays of notes or
+        roots, otherwise as a list
+
+    Raises
+    ------
+    ValueError
+        If a note is not valid or there are not as many roots as notes
+
+    >>> notes_to_intervals(["C", "E", "G", "E"], ["C", "C", "C", "E"])
+        [0, 4, 7, 0]
+    """
+    if not isinstance(roots, str) and len(roots) != len(notes):
+        raise ValueError(
+            f"There should be as many roots as notes. Got {len(roots)} roots "
+            f"for {len(notes)} notes"
+        )
+    if HAS_NUMPY and (isinstance(notes, np.ndarray) or isinstance(roots, np.ndarray)):
+        return (_array_pitch_classes(notes) - _array_pitch_classes(roots)) % 12
+
+    note_pitch_classes = _pitch_classes(notes)
+    if isinstance(roots, str):
+        root_pitch_class = note_to_pitch_class(roots)
+        return [
+            (pitch_class - root_pitch_class) % 12 for pitch_class in note_pitch_classes
+        ]
+    return [
+        (pitch_class - root_pitch_class) % 12
+        for pitch_class, root_pitch_class in zip(
+            note_pitch_classes, _pitch_classes(roots)
+        )
+    ]
+
+
+def intervals_to_names(
+    intervals: Sequence[int],
+) -> Union[List[str], "np.ndarray"]:
+    """Get the name of each interval, as note_to_interval_name.
+
+    Intervals are taken modulo 12. A numpy array of intervals gives a numpy
+    array of names, other sequences give a list.
+
+    Parameters
+    ----------
+    intervals : Sequence[int]
+        Intervals, as a sequence or a numpy array of integers
+
+    Returns
+    -------
+    Union[List[str], np.ndarray]
+        Interval names, as a numpy array for a numpy array of intervals,
+        otherwise as a list
+
+    >>> intervals_to_names(notes_to_intervals(["C", "Eb", "G"], "C"))
+        ['1', 'b3', '5']
+    >>> intervals_to_names(np.array([0, 3, 7]))
+        array(['1', 'b3', '5'], dtype='<U2')
+    """
+    if HAS_NUMPY and isinstance(intervals, np.ndarray):
+        names = np.array(CHROMATICS_INTERVALS)
+        return names[intervals.astype(np.int64) % 12]
+    return [CHROMATICS_INTERVALS[interval % 12] for interval in intervals]
+
+
 def scale_to_intervals(scale: List[str], root: str) -> List[int]:
     """Get intervals from root.
 
@@ -135,76 +331,73 @@ def sort_scale(scale: List[str]) -> List[str]:
     return sorted(scale, key=_sort_scale)
 
 
-def _enharmonic_duplicates(scale: List[str]) -> Dict[str, List[Tuple[str, int]]]:
-    base_notes_scale = [note[0] for note in scale]
-    duplicates: Dict[str, List[Tuple[str, int]]] = {}
-    for idx, (real_note, base_note) in enumerate(zip(scale, base_notes_scale)):
-        if base_note in duplicates:
-            duplicates[base_note].append((real_note, idx))
-        else:
-            duplicates[base_note] = [(real_note, idx)]
-
-    # Remove key if there is only one note
-    duplicates = {key: value for key, value in duplicates.items() if len(value) > 1}
-    return duplicates
-
-
-def _tuple_note_custom_sort(item: Tuple[str, int]) -> Tuple[str, int]:
-    """Sort b prefix first, then no prefix, then # prefix."""
-    note = item[0]
-    letter = note[0]
-    modifier = note[1:]
-
-    if modifier == "b":
-        return (letter, 0)
-    elif modifier == "#":
-        return (letter, 2)
-    else:
-        return (letter, 1)
-
-
-def __scale_to_enharmonic_sharp(
-    duplicates: Dict[str, List[Tuple[str, int]]], _scale: List[Note]
-) -> List[Note]:
-    # We choose to take '#'-suffix duplicated first to flatten
-    # If not availale take without prefix
-    # Let's say we have these duplicates
-    # ["G", "G#"] Then take G#
-    # ["Gb", "G", "G#"] Then take G#
-    # ["Gb", "G"] Then take G
-    # Once taken use the flat_enharmonic function to get the flat equivalent
-    # Of the given note
-    for _, notes in duplicates.items():
-        sorted_notes = sorted(notes, key=_tuple_note_custom_sort)
-        _, idx = sorted_notes[-1]
-        _scale[idx] = _scale[idx].flat_enharmonic()
-        break
-    return _scale
-
-
-def __scale_to_enharmonic_flat(
-    duplicates: Dict[str, List[Tuple[str, int]]], _scale: List[Note]
-) -> List[Note]:
-    # We choose to take 'b'-suffix duplicated first to flatten
-    # If not availale take without prefix
-    # Let's say we have these duplicates
-    # ["G", "G#"] Then take G
-    # ["Gb", "G", "G#"] Then take Gb
-    # ["Gb", "G"] Then take Gb
-    # Once taken use the sharp_enharmonic function to get the sharp equivalent
-    # Of the given note
-    for _, notes in duplicates.items():
-        sorted_notes = sorted(notes, key=_tuple_note_custom_sort)
-        _, idx = sorted_notes[0]
-        _scale[idx] = _scale[idx].sharp_enharmonic()
-        break
-    return _scale
+# Respellings that are avoided when another spelling is as simple
+_UNUSUAL_SHARPS = {"B#", "E#"}
+
+
+def _spelling_cost(
+    names: List[str], alterations: List[int]
+) -> Tuple[int, int, int, int, int]:
+    """Rank a spelling of a scale, the lower the better.
+
+    Fewer alterations first, then no double alterations, then fewer B# or E#,
+    then keeping the root and the other notes as in CHROMATICS_NOTES.
+    """
+    sharp_names = [CHROMATICS_NOTES[_NOTE_PITCH_CLASSES[name]] for name in names]
+    return (
+        sum(abs(alteration) for alteration in alterations),
+        max(abs(alteration) for alteration in alterations),
+        sum(name in _UNUSUAL_SHARPS for name in names),
+        names[0] != sharp_names[0],
+        sum(name != sharp_name for name, sharp_name in zip(names, sharp_names)),
+    )
+
+
+@lru_cache(maxsize=None)
+def _enharmonic_spelling(mask: int, root_pitch_class: int) -> Tuple[str, ...]:
+    """Get the name of each pitch class of the mask, one letter per note.
+
+    Notes are taken from the root in ascending order, and get letters in
+    ascending order too, so at most 7 pitch classes can be spelled. Every
+    choice of letters is ranked with _spelling_cost. Pitch classes out of the
+    mask get an empty name.
+    """
+    intervals = [
+        interval
+        for interval in range(12)
+        if mask >> (root_pitch_class + interval) % 12 & 1
+    ]
+    naturals = list(_NATURAL_PITCH_CLASSES.items())
+    best: Optional[Tuple[Tuple[int, int, int, int, int], List[str]]] = None
+    for root_letter in range(7):
+        for letters in combinations(range(1, 7), len(intervals) - 1):
+            names = []
+            alterations = []
+            for interval, letter in zip(intervals, (0,) + letters):
+                natural, natural_pitch_class = naturals[(root_letter + letter) % 7]
+                alteration = (root_pitch_class + interval - natural_pitch_class) % 12
+                if alteration > 6:
+                    alteration -= 12
+                alterations.append(alteration)
+                names.append(natural + ("#" * alteration or "b" * -alteration))
+            cost = _spelling_cost(names, alterations)
+            if best is None or cost < best[0]:
+                best = (cost, names)
+
+    spelling = [""] * 12
+    if best is not None:
+        for interval, name in zip(intervals, best[1]):
+            spelling[(root_pitch_class + interval) % 12] = name
+    return tuple(spelling)
 
 
 def scale_to_enharmonic(scale: List[str]) -> List[str]:
     """Modify the scale in order to not repeat note.
 
     Turns into enharmonic way if possible. Otherwise return the original scale.
+    Scales already using each letter once are kept as they are. Otherwise
+    the spelling only depends on the pitch classes of the scale and its first
+    note, and is computed once for each of them.
 
     >>> scale_to_enharmonic(['A#', 'C', 'D', 'D#', 'F', 'G', 'A'])
         ['Bb', 'C', 'D', 'Eb', 'F', 'G', 'A']
@@ -216,62 +409,12 @@ def scale_to_enharmonic(scale: List[str]) -> List[str]:
     # Not possible to get enharmonic scale if there is more than 7 notes
     if len(scale) > 7:
         return scale
-    # 7 times the max scale seems pretty good as we cover all the possible alterations
-    MAX_RETRY = 7 * 7
-
-    # Attempt to convert duplicate notes in the scale to their sharp enharmonic
-    # equivalents until there are no more duplicates or the maximum number of
-    # retries is reached.
-    # It is kind of recursive, so we can get C####### in some case for example
-    sharp_duplicates = _enharmonic_duplicates(scale)
-    sharp_tries = 0
-    sharp_scale: List[Note] = [Note(note) for note in scale]
-    while sharp_duplicates:
-        sharp_scale = __scale_to_enharmonic_sharp(sharp_duplicates, sharp_scale)
-        sharp_duplicates = _enharmonic_duplicates([note.name for note in sharp_scale])
-        sharp_tries += 1
-        if sharp_tries > MAX_RETRY:
-            break
-
-    # Attempt to convert duplicate notes in the scale to their flat enharmonic
-    # equivalents until there are no more duplicates or the maximum number
-    # of retries is reached.
-    # It is kind of recursive, so we can get Cbbbbbbb in some case for example
-    flat_duplicates = _enharmonic_duplicates(scale)
-    flat_scale: List[Note] = [Note(note) for note in scale]
-    flat_tries = 0
-    while flat_duplicates:
-        flat_scale = __scale_to_enharmonic_flat(flat_duplicates, flat_scale)
-        flat_duplicates = _enharmonic_duplicates([note.name for note in flat_scale])
-        flat_tries += 1
-        if flat_tries > MAX_RETRY:
-            break
-
-    # After attempting enharmonic conversions, determine the optimal scale to use.
-    # If both sharp and flat scales have no duplicates, we compare them based on the
-    # total number of alterations (sharps or flats) and select the one with fewer
-    # alterations.
-    # In case of a tie, we avoid scales with unusual alterations like E# or Cb.
-    if len(sharp_duplicates) == 0 and len(flat_duplicates) == 0:
-        # Count total number of alteration
-        sharp_alterations = sum([len(note.name[1:]) for note in sharp_scale])
-        flat_alterations = sum([len(note.name[1:]) for note in flat_scale])
-        # Choose scale with fewer alterations
-        if sharp_alterations == flat_alterations:
-            sharp_weird_alteration = "E#" in sharp_scale or "B#" in sharp_scale
-            flat_weird_alteration = "Cb" in flat_scale or "Fb" in flat_scale
-            if sharp_weird_alteration:
-                return [note.name for note in flat_scale]
-            if flat_weird_alteration:
-                return [note.name for note in sharp_scale]
-
-        elif sharp_alterations < flat_alterations:
-            return [note.name for note in sharp_scale]
-        else:
-            return [note.name for note in flat_scale]
-    # If only one of the scales (sharp or flat) has no duplicates, return that scale.
-    if not sharp_duplicates:
-        return [note.name for note in sharp_scale]
-    if not flat_duplicates:
-        return [note.name for note in flat_scale]
-    return scale
+    if not _contains_duplicates([note[0] for note in scale]):
+        return list(scale)
+
+    pitch_classes = [note_to_pitch_class(note) for note in scale]
+    mask = 0
+    for pitch_class in pitch_classes:
+        mask |= 1 << pitch_class
+    spelling = _enharmonic_spelling(mask, pitch_classes[0])
+    return [spelling[pitch_class] for pitch_class in pitch_classes]
@@ -0,0 +1,323 @@
+"""Persistent, memory-mapped index of chord fingerings.
+
+The index is a single read-only binary file that many processes can map
+at once without loading it into memory. It is laid out as :
+
+    header
+    rows    one byte per string and per fingering, MUTED for muted strings
+    keys    JSON encoded keys of the entries
+    table   open addressing hash table of the entries
+
+A lookup hashes the key and reads a few slots of the table, then returns a
+view on the rows of the entry without copying them.
+"""
+import hashlib
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import (
+    IO,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from fretboardgtr.catalog import ChordVoicings, build_voicing_catalog
+from fretboardgtr.notes_creators import ChordFromName
+
+MAGIC = b"FGTRVIX1"
+# Magic, number of entries, number of slots, keys offset, table offset
+HEADER = struct.Struct("<8sQQQQ")
+# Key hash, rows offset, number of rows, row width, key offset, key length
+SLOT = struct.Struct("<QQIHxxQI4x")
+MUTED = 255
+
+
+class VoicingKey(NamedTuple):
+    """Everything the fingerings of a chord depend on."""
+
+    tuning: Tuple[str, ...]
+    notes: Tuple[str, ...]
+    max_spacing: int = 5
+    min_notes_in_chord: int = 2
+    number_of_fingers: int = 4
+
+    def encode(self) -> bytes:
+        return json.dumps(
+            [
+                list(self.tuning),
+                list(self.notes),
+                self.max_spacing,
+                self.min_notes_in_chord,
+                self.number_of_fingers,
+            ]
+        ).encode()
+
+
+def _hash_key(key: bytes) -> int:
+    # 0 marks an empty slot of the table
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little") or 1
+
+
+def _write_rows(file: IO[bytes], fingerings: List[List[Optional[int]]]) -> None:
+    for fingering in fingerings:
+        row = [MUTED if fret is None else fret for fret in fingering]
+        if any(fret is not None and fret >= MUTED for fret in fingering):
+            raise ValueError(f"Frets should be lower than {MUTED}. Got {fingering}")
+        file.write(bytes(row))
+
+
+def write_voicing_index(
+    to: Union[Path, str],
+    voicings: Iterable[Tuple[VoicingKey, List[List[Optional[int]]]]],
+) -> int:
+    """Write the fingerings of each key to an index file.
+
+    Rows are streamed to the file as the voicings are consumed, only the
+    position of each entry is kept in memory until the table is written.
+
+    Parameters
+    ----------
+    to : Union[Path, str]
+        Path of the index file
+    voicings : Iterable[Tuple[VoicingKey, List[List[Optional[int]]]]]
+        Keys and their fingerings
+
+    Returns
+    -------
+    int
+        Number of entries written
+
+    Raises
+    ------
+    ValueError
+        If a key is duplicated or a fret does not fit in a byte
+    """
+    to = Path(to)
+    to.parent.mkdir(parents=True, exist_ok=True)
+    entries: List[Tuple[bytes, int, int, int]] = []
+    seen_keys = set()
+    with open(to, "wb") as file:
+        file.write(bytes(HEADER.size))
+        for key, fingerings in voicings:
+            encoded_key = key.encode()
+            if encoded_key in seen_keys:
+                raise ValueError(f"Duplicated key {encoded_key.decode()}")
+            seen_keys.add(encoded_key)
+            entries.append((encoded_key, file.tell(), len(fingerings), len(key.tuning)))
+            _write_rows(file, fingerings)
+
+        keys_offset = file.tell()
+        key_offsets = []
+        for encoded_key, _, _, _ in entries:
+            key_offsets.append(file.tell())
+            file.write(encoded_key)
+
+        number_of_slots = 1
+        while number_of_slots < 2 * len(entries):
+            number_of_slots *= 2
+        table = bytearray(SLOT.size * number_of_slots)
+        for (encoded_key, rows_offset, count, width), key_offset in zip(
+            entries, key_offsets
+        ):
+            key_hash = _hash_key(encoded_key)
+            slot = key_hash % number_of_slots
+            while SLOT.unpack_from(table, slot * SLOT.size)[0] != 0:
+                slot = (slot + 1) % number_of_slots
+            SLOT.pack_into(
+                table,
+                slot * SLOT.size,
+                key_hash,
+                rows_offset,
+                count,
+                width,
+                key_offset,
+                len(encoded_key),
+            )
+
+        table_offset = file.tell()
+        file.write(table)
+        file.seek(0)
+        file.write(
+            HEADER.pack(MAGIC, len(entries), number_of_slots, keys_offset, table_offset)
+        )
+    return len(entries)
+
+
+def _unique_voicings(
+    catalog: Iterable[ChordVoicings],
+    max_spacing: int,
+    min_notes_in_chord: int,
+    number_of_fingers: int,
+) -> Iterator[Tuple[VoicingKey, List[List[Optional[int]]]]]:
+    # Some qualities share the same notes (eg dim6 and dim7), and so the
+    # same key and fingerings
+    seen_keys = set()
+    for chord in catalog:
+        key = VoicingKey(
+            tuple(chord.tuning),
+            tuple(ChordFromName(chord.root, chord.quality).build().notes),
+            max_spacing,
+            min_notes_in_chord,
+            number_of_fingers,
+        )
+        if key in seen_keys:
+            continue
+        seen_keys.add(key)
+        yield key, chord.fingerings
+
+
+def build_voicing_index(
+    to: Union[Path, str],
+    tunings: Sequence[Sequence[str]],
+    qualities: Optional[Sequence[str]] = None,
+    roots: Optional[Sequence[str]] = None,
+    workers: Optional[int] = 1,
+    chunksize: int = 4,
+    max_spacing: int = 5,
+    min_notes_in_chord: int = 2,
+    number_of_fingers: int = 4,
+) -> int:
+    """Build the fingerings of every tuning, quality and root into an index.
+
+    See build_voicing_catalog for the parameters. Qualities sharing the
+    same notes are indexed once.
+
+    Returns
+    -------
+    int
+        Number of entries written
+    """
+    catalog = build_voicing_catalog(
+        tunings,
+        qualities,
+        roots,
+        workers=workers,
+        chunksize=chunksize,
+        max_spacing=max_spacing,
+        min_notes_in_chord=min_notes_in_chord,
+        number_of_fingers=number_of_fingers,
+    )
+    return write_voicing_index(
+        to,
+        _unique_voicings(catalog, max_spacing, min_notes_in_chord, number_of_fingers),
+    )
+
+
+class VoicingIndex:
+    """Read-only, memory-mapped index of chord fingerings.
+
+    Opening the index only maps the file, many processes can share the same
+    index file and the operating system will load the pages once.
+
+    Example
+    -------
+    >>> with VoicingIndex("voicings.idx") as index:
+    ...     chord = ChordFromName(root="C", quality="M").build()
+    ...     index.get_chord_fingerings(STANDARD_TUNING, chord.notes)
+    """
+
+    def __init__(self, path: Union[Path, str]):
+        self.path = Path(path)
+        with open(self.path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._entries, self._slots, _, self._table_offset = HEADER.unpack_from(
+            self._mmap
+        )
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{self.path} is not a voicing index")
+        self._view = memoryview(self._mmap)
+
+    def __len__(self) -> int:
+        return self._entries
+
+    def __enter__(self) -> "VoicingIndex":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the index file.
+
+        Views returned by lookup must be released before.
+        """
+        self._view.release()
+        self._mmap.close()
+
+    def lookup(
+        self,
+        tuning: Sequence[str],
+        notes: Sequence[str],
+        max_spacing: int = 5,
+        min_notes_in_chord: int = 2,
+        number_of_fingers: int = 4,
+    ) -> Optional[memoryview]:
+        """Get a zero-copy view on the fingerings of a key.
+
+        The view contains one byte per string of the tuning for each
+        fingering, row after row. Muted strings are set to MUTED.
+
+        Returns
+        -------
+        Optional[memoryview]
+            View on the fingerings, or None if the key is not indexed
+        """
+        encoded_key = VoicingKey(
+            tuple(tuning),
+            tuple(notes),
+            max_spacing,
+            min_notes_in_chord,
+            number_of_fingers,
+        ).encode()
+        key_hash = _hash_key(encoded_key)
+        slot = key_hash % self._slots
+        while True:
+            (
+                slot_hash,
+                rows_offset,
+                count,
+                width,
+                key_offset,
+                key_length,
+            ) = SLOT.unpack_from(self._mmap, self._table_offset + slot * SLOT.size)
+            if slot_hash == 0:
+                return None
+            if (
+                slot_hash == key_hash
+                and self._view[key_offset : key_offset + key_length] == encoded_key
+            ):
+                return self._view[rows_offset : rows_offset + count * width]
+            slot = (slot + 1) % self._slots
+
+    def get_chord_fingerings(
+        self,
+        tuning: Sequence[str],
+        notes: Sequence[str],
+        max_spacing: int = 5,
+        min_notes_in_chord: int = 2,
+        number_of_fingers: int = 4,
+    ) -> Optional[List[List[Optional[int]]]]:
+        """Get the fingerings of a key, as NotesContainer.get_chord_fingerings.
+
+        Returns
+        -------
+        Optional[List[List[Optional[int]]]]
+            Fingerings, or None if the key is not indexed
+        """
+        rows = self.lookup(
+            tuning, notes, max_spacing, min_notes_in_chord, number_of_fingers
+        )
+        if rows is None:
+            return None
+        width = len(tuning)
+        frets = [None if fret == MUTED else fret for fret in rows]
+        rows.release()
+        return [frets[start : start + width] for start in range(0, len(frets), width)]
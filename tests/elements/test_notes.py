@@ -1,8 +1,14 @@
+import copy
+from dataclasses import FrozenInstanceError
+
+import pytest
+
 from fretboardgtr.elements.notes import (
     FrettedNote,
     FrettedNoteConfig,
     OpenNote,
     OpenNoteConfig,
+    get_note_style,
 )
 
 
@@ -66,3 +72,48 @@ def test_fretted_note_get_svg_custom_config():
     text_attribs = text.attribs
     assert float(text_attribs["x"]) == 0.0
     assert float(text_attribs["y"]) == 0.0
+
+
+def test_note_styles_are_shared():
+    style = get_note_style(OpenNoteConfig(radius=30), "red")
+    assert style is get_note_style(OpenNoteConfig(radius=30), "red")
+    assert style is get_note_style(style)
+    assert style is not get_note_style(OpenNoteConfig(radius=30), "blue")
+    assert style is not get_note_style(FrettedNoteConfig(radius=30), "red")
+    assert style.radius == 30
+    assert style.color == "red"
+    assert isinstance(style, OpenNoteConfig)
+    assert len({style, get_note_style(OpenNoteConfig(radius=30), "red")}) == 1
+
+
+def test_note_styles_are_read_only():
+    style = get_note_style(FrettedNoteConfig(), "red")
+    with pytest.raises(FrozenInstanceError):
+        style.color = "blue"
+    config = copy.copy(style)
+    config.color = "blue"
+    assert type(config) is FrettedNoteConfig
+    assert style.color == "red"
+
+
+def test_note_config_copies_shared_style():
+    style = get_note_style(OpenNoteConfig(), "red")
+    note = OpenNote("C", (0.0, 0.0), config=style)
+    other = OpenNote("D", (0.0, 0.0), config=style)
+    note.config.radius = 30
+    assert type(note.config) is OpenNoteConfig
+    assert note.config.color == "red"
+    assert note.get_svg().elements[0].attribs["r"] == 30
+    assert style.radius == 20
+    assert other.get_svg().elements[0].attribs["r"] == 20
+
+
+def test_note_style_of_config_subclass_is_a_copy():
+    class CustomConfig(OpenNoteConfig):
+        pass
+
+    config = CustomConfig()
+    style = get_note_style(config, "red")
+    assert type(style) is CustomConfig
+    assert style.color == "red"
+    assert config.color != "red"
@@ -0,0 +1,53 @@
+import json
+
+import pytest
+
+from fretboardgtr.catalog import build_voicing_catalog, main, write_voicing_catalog
+from fretboardgtr.notes_creators import ChordFromName
+
+TUNING = ["E", "A", "D", "G"]
+
+
+def test_build_voicing_catalog():
+    catalog = list(build_voicing_catalog([TUNING], ["M", "m7"], ["C", "F#"]))
+    assert [(voicings.quality, voicings.root) for voicings in catalog] == [
+        ("M", "C"),
+        ("M", "F#"),
+        ("m7", "C"),
+        ("m7", "F#"),
+    ]
+    for voicings in catalog:
+        assert voicings.tuning == TUNING
+        assert voicings.fingerings == ChordFromName(
+            voicings.root, voicings.quality
+        ).build().get_chord_fingerings(TUNING)
+
+
+def test_build_voicing_catalog_workers():
+    tunings = [TUNING, ["D", "A", "D", "G"]]
+    serial = list(build_voicing_catalog(tunings, ["M", "7"], workers=1))
+    parallel = list(build_voicing_catalog(tunings, ["M", "7"], workers=2))
+    assert len(serial) == 2 * 2 * 12
+    assert parallel == serial
+
+
+def test_build_voicing_catalog_invalid_workers():
+    with pytest.raises(ValueError):
+        next(build_voicing_catalog([TUNING], workers=0))
+
+
+def test_write_voicing_catalog(tmp_path):
+    catalog = list(build_voicing_catalog([TUNING], ["M"], ["C", "D"]))
+    to = tmp_path / "catalog.jsonl"
+    assert write_voicing_catalog(catalog, to) == 2
+    lines = [json.loads(line) for line in to.read_text().splitlines()]
+    assert lines[1]["root"] == "D"
+    assert lines[1]["fingerings"] == catalog[1].fingerings
+
+
+def test_catalog_command(tmp_path):
+    to = tmp_path / "catalog.jsonl"
+    main([str(to), "--tuning", "E,A,D,G", "--quality", "M", "--workers", "1"])
+    lines = to.read_text().splitlines()
+    assert len(lines) == 12
+    assert json.loads(lines[0])["tuning"] == TUNING
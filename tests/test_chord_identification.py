@@ -0,0 +1,56 @@
+import pytest
+
+from fretboardgtr.chord_identification import (
+    ChordMatch,
+    identify_chord,
+    identify_chords,
+)
+from fretboardgtr.constants import CHORDS_DICT_ESSENTIAL
+from fretboardgtr.notes_creators import ChordFromName
+from fretboardgtr.utils import get_note_from_index
+
+TUNING = ["E", "A", "D", "G", "B", "E"]
+
+
+def test_identify_chord_root_position():
+    matches = identify_chord([None, 3, 2, 0, 1, 0], TUNING)
+    assert matches[0] == ChordMatch("C", "M", "C", 0)
+    assert matches[0].name == "C"
+
+
+def test_identify_chord_inversion():
+    matches = identify_chord([0, 3, 2, 0, 1, 0], TUNING)
+    assert ChordMatch("C", "M", "E", 1) in matches
+    assert ChordMatch("C", "M", "E", 1).name == "C/E"
+    assert all(match.inversion == 0 for match in matches[:1])
+
+
+def test_identify_chord_without_match():
+    assert identify_chord([None, None, None, None, None, None], TUNING) == []
+    assert identify_chord([None, None, None, None, 1, None], TUNING) == []
+
+
+def test_identify_chord_with_wrong_number_of_strings():
+    with pytest.raises(ValueError):
+        identify_chord([0, 2, 2], TUNING)
+
+
+@pytest.mark.parametrize("quality", list(CHORDS_DICT_ESSENTIAL))
+def test_identify_chord_matches_chord_from_name(quality):
+    for root in ["C", "F#", "A#"]:
+        chord = ChordFromName(root=root, quality=quality).build()
+        for fingering in chord.get_chord_fingerings(TUNING)[:5]:
+            bass = next(
+                get_note_from_index(fret, note)
+                for fret, note in zip(fingering, TUNING)
+                if fret is not None
+            )
+            matches = identify_chord(fingering, TUNING)
+            assert (root, quality, bass) in [match[:3] for match in matches]
+
+
+def test_identify_chords_batch():
+    fingerings = [[None, 3, 2, 0, 1, 0], [3, 2, 0, 0, 0, 3], [None] * 6]
+    assert identify_chords(fingerings, TUNING) == [
+        identify_chord(fingering, TUNING) for fingering in fingerings
+    ]
@@ -0,0 +1,95 @@
+import pytest
+
+from fretboardgtr.elements.cross import Cross, CrossConfig
+from fretboardgtr.elements.notes import FrettedNote, OpenNote, OpenNoteConfig
+from fretboardgtr.fretboard import FretBoard
+from fretboardgtr.fretboards.compact import CompactElementLayer
+from fretboardgtr.fretboards.config import FretBoardConfig, FretBoardGeneralConfig
+from fretboardgtr.fretboards.converters import FretBoardToSVGConverter
+from fretboardgtr.fretboards.elements import FretBoardElements
+from fretboardgtr.notes_creators import ScaleFromName
+
+
+def _svg(fretboard):
+    return FretBoardToSVGConverter(fretboard).convert().tostring()
+
+
+def test_compact_layer_builds_elements_on_demand():
+    config = OpenNoteConfig(color="rgb(1, 2, 3)")
+    layer = CompactElementLayer()
+    layer.append(OpenNote("E", (30.0, 40.0), config=config))
+    layer.add(FrettedNote, "F", (100.0, 40.0), config)
+    layer.add(Cross, "", (30.0, 10.0), CrossConfig())
+
+    assert len(layer) == 3
+    first, second, cross = layer
+    assert (type(first), first.name, first.x, first.y) == (OpenNote, "E", 30.0, 40.0)
+    assert first.config is config
+    assert (type(second), second.name, second.x) == (FrettedNote, "F", 100.0)
+    assert second.config is config
+    assert (type(cross), cross.name) == (Cross, "X")
+    # Elements are built each time they are read
+    assert layer[0] is not first
+    assert layer[-1].y == 10.0
+
+
+def test_compact_layer_keeps_other_elements():
+    layer = CompactElementLayer()
+    integer_position = OpenNote("C", (0, 0))
+    extra_attribute = FrettedNote("D", (1.0, 1.0))
+    extra_attribute.fret = 2
+    layer.extend([integer_position, extra_attribute])
+    assert layer[0] is integer_position
+    assert layer[1] is extra_attribute
+
+
+def test_compact_layer_is_a_mutable_sequence():
+    notes = [OpenNote(name, (float(x), 0.0)) for x, name in enumerate("ABCDE")]
+    layer = CompactElementLayer(notes)
+    del layer[1]
+    layer.insert(0, FrettedNote("G", (9.0, 9.0)))
+    layer[-1] = OpenNote("F", (4.0, 0.0))
+    del layer[1:2]
+    assert [note.name for note in layer] == ["G", "C", "D", "F"]
+    assert [note.name for note in layer[1:3]] == ["C", "D"]
+    with pytest.raises(IndexError):
+        layer[4]
+
+    assert layer == CompactElementLayer(list(layer))
+    assert layer != CompactElementLayer(list(layer)[:3])
+    layer.clear()
+    assert layer == []
+
+
+def test_use_compact_layers():
+    elements = FretBoardElements()
+    note = FrettedNote("A", (1.0, 2.0))
+    elements.notes.append(note)
+    elements.use_compact_layers()
+    assert isinstance(elements.notes, CompactElementLayer)
+    assert isinstance(elements.crosses, CompactElementLayer)
+    assert elements.to_list()[0].name == "A"
+    elements.clear_layer("notes")
+    assert isinstance(elements.notes, CompactElementLayer)
+    assert len(elements) == 0
+
+
+@pytest.mark.parametrize("vertical", [False, True])
+def test_compact_fretboard_matches_fretboard(vertical):
+    config = FretBoardConfig(general=FretBoardGeneralConfig(last_fret=24))
+    tuning = ["F#", "B", "E", "A", "D", "G", "B", "E"]
+    fretboards = [
+        FretBoard(tuning, config, vertical),
+        FretBoard.from_template(tuning, config, vertical, compact=True),
+    ]
+    for fretboard in fretboards:
+        fretboard.add_notes(ScaleFromName(root="E", mode="Dominantbebop").build())
+        fretboard.add_fingering([None, None, 0, 2, 2, 1, 0, 0], root="E")
+        fretboard.transpose(2)
+    fretboard, compact = fretboards
+    assert _svg(compact) == _svg(fretboard)
+    assert isinstance(compact.elements.notes, CompactElementLayer)
+
+    compact.reset()
+    assert isinstance(compact.elements.notes, CompactElementLayer)
+    assert compact.elements.notes == []
@@ -0,0 +1,236 @@
+from itertools import product
+from typing import List, Optional
+
+import pytest
+
+from fretboardgtr.constants import CHORDS_DICT_ESSENTIAL
+from fretboardgtr.fingerings import (
+    PlayabilityWeights,
+    _popcount,
+    _reduce_fingering,
+    best_chord_fingerings,
+    playability_score,
+    search_chord_fingerings,
+    vectorized_chord_fingerings,
+)
+from fretboardgtr.notes_creators import ChordFromName, NotesContainer
+from fretboardgtr.utils import get_note_from_index, note_to_pitch_class
+
+TUNINGS = [
+    ["E", "A", "D", "G"],
+    ["E", "A", "D", "G", "B", "E"],
+    ["D", "A", "D", "G", "A", "D"],
+]
+
+
+def exhaustive_chord_fingerings(
+    container: NotesContainer,
+    tuning: List[str],
+    max_spacing: int = 5,
+    min_notes_in_chord: int = 2,
+    number_of_fingers: int = 4,
+) -> List[List[Optional[int]]]:
+    """Enumerate every combination of the scale, then filter them."""
+    scale = container.get_scale(tuning, max_spacing)
+    fingerings = []
+    for combination in product(*scale):
+        non_zero_numbers = [num for num in combination if num != 0]
+        if len(set(non_zero_numbers)) > number_of_fingers:
+            continue
+
+        new_combination: List[Optional[int]] = list(combination)
+        while True:
+            if len(non_zero_numbers) < min_notes_in_chord:
+                break
+            if max(non_zero_numbers) - min(non_zero_numbers) <= max_spacing:
+                break
+            minimum = min(non_zero_numbers)
+            new_combination[new_combination.index(minimum)] = None
+            non_zero_numbers.remove(minimum)
+
+        notes = []
+        for index, note in zip(new_combination, tuning):
+            if index is not None:
+                notes.append(get_note_from_index(index, note))
+        if set(notes) != set(container.notes):
+            continue
+        fingerings.append(new_combination)
+    return fingerings
+
+
+@pytest.mark.parametrize("tuning", TUNINGS)
+@pytest.mark.parametrize("quality", ["M", "m7", "dim", "5"])
+def test_search_matches_exhaustive_enumeration(tuning, quality):
+    chord = ChordFromName(root="C", quality=quality).build()
+    assert chord.get_chord_fingerings(tuning) == exhaustive_chord_fingerings(
+        chord, tuning
+    )
+
+
+@pytest.mark.parametrize(
+    "max_spacing, min_notes_in_chord, number_of_fingers",
+    [(3, 2, 4), (5, 3, 4), (5, 1, 3), (6, 4, 5)],
+)
+def test_search_matches_exhaustive_enumeration_parameters(
+    max_spacing, min_notes_in_chord, number_of_fingers
+):
+    chord = ChordFromName(root="F#", quality="7").build()
+    tuning = ["E", "A", "D", "G", "B", "E"]
+    assert chord.get_chord_fingerings(
+        tuning, max_spacing, min_notes_in_chord, number_of_fingers
+    ) == exhaustive_chord_fingerings(
+        chord, tuning, max_spacing, min_notes_in_chord, number_of_fingers
+    )
+
+
+def test_reduce_fingering_mutes_lowest_frets():
+    assert _reduce_fingering([0, 1, 8, 9], 5, 2) == [0, None, 8, 9]
+
+
+def test_reduce_fingering_keeps_min_notes_in_chord():
+    assert _reduce_fingering([1, 2, 10], 5, 3) == [None, 2, 10]
+
+
+@pytest.mark.parametrize("quality", list(CHORDS_DICT_ESSENTIAL))
+@pytest.mark.parametrize(
+    "tuning",
+    [
+        ["E", "A", "D", "G"],
+        ["E", "A", "D", "G", "B"],
+        ["E", "A", "D", "G", "B", "E"],
+        ["B", "E", "A", "D", "G", "B", "E"],
+    ],
+    ids=["4-strings", "5-strings", "6-strings", "7-strings"],
+)
+@pytest.mark.parametrize("min_notes_in_chord, number_of_fingers", [(2, 4), (3, 3)])
+def test_vectorized_search_matches_search(
+    quality, tuning, min_notes_in_chord, number_of_fingers
+):
+    pytest.importorskip("numpy")
+    chord = ChordFromName(root="D", quality=quality).build()
+    search_inputs = chord._chord_search_inputs(tuning, 5)
+    parameters = dict(
+        min_notes_in_chord=min_notes_in_chord, number_of_fingers=number_of_fingers
+    )
+    assert vectorized_chord_fingerings(*search_inputs, **parameters) == list(
+        search_chord_fingerings(*search_inputs, **parameters)
+    )
+
+
+def test_vectorized_search_with_high_frets():
+    pytest.importorskip("numpy")
+    # Frets 64 and 65 overflow the int64 bits counting the fingers
+    scale = [[0, 63, 64], [0, 64, 65]]
+    pitch_classes = [
+        [1 << ((7 + fret) % 12) for fret in scale[0]],
+        [1 << (fret % 12) for fret in scale[1]],
+    ]
+    chord_mask = pitch_classes[0][2] | pitch_classes[1][2]
+    for number_of_fingers in (1, 2):
+        assert vectorized_chord_fingerings(
+            scale, pitch_classes, chord_mask, number_of_fingers=number_of_fingers
+        ) == list(
+            search_chord_fingerings(
+                scale, pitch_classes, chord_mask, number_of_fingers=number_of_fingers
+            )
+        )
+    assert vectorized_chord_fingerings(scale, pitch_classes, chord_mask) == [[64, 65]]
+    assert (
+        vectorized_chord_fingerings(
+            scale, pitch_classes, chord_mask, number_of_fingers=1
+        )
+        == []
+    )
+
+
+def test_popcount_without_bitwise_count(monkeypatch):
+    np = pytest.importorskip("numpy")
+    values = np.array([0, 1, 0b1011, 2**40 + 7], np.int64)
+    expected = _popcount(values).tolist()
+    monkeypatch.delattr(np, "bitwise_count", raising=False)
+    assert _popcount(values).tolist() == expected == [0, 1, 3, 4]
+
+
+def test_chord_fingerings_without_numpy(monkeypatch):
+    chord = ChordFromName(root="C", quality="M").build()
+    tuning = ["E", "A", "D", "G", "B", "E"]
+    fingerings = chord.get_chord_fingerings(tuning)
+    monkeypatch.setattr("fretboardgtr.notes_creators.HAS_NUMPY", False)
+    assert chord.get_chord_fingerings(tuning) == fingerings
+
+
+def test_playability_score():
+    weights = PlayabilityWeights()
+    open_pitch_classes = [note_to_pitch_class(note) for note in "EADGBE"]
+    c_pitch_class = note_to_pitch_class("C")
+    # Open C : span 2, position 3 and the root in the bass
+    assert (
+        playability_score(
+            [None, 3, 2, 0, 1, 0], open_pitch_classes, c_pitch_class, weights
+        )
+        == -(2 * 1.0 + 3 * 0.5) + 2.0
+    )
+    # Barres on the 3rd and 5th frets and a muted interior string, G in the bass
+    assert playability_score(
+        [3, None, 5, 5, 5, 3], open_pitch_classes, c_pitch_class, weights
+    ) == -(2 * 1.0 + 3 * 2.0 + 1 * 3.0 + 5 * 0.5)
+
+
+def test_playability_weights_should_be_positive():
+    with pytest.raises(ValueError):
+        PlayabilityWeights(span=-1)
+
+
+@pytest.mark.parametrize("tuning", TUNINGS)
+@pytest.mark.parametrize("quality", ["M", "m7", "5"])
+@pytest.mark.parametrize("k", [1, 5, 40])
+def test_best_chord_fingerings_matches_sorted_fingerings(tuning, quality, k):
+    chord = ChordFromName(root="A", quality=quality).build()
+    open_pitch_classes = [note_to_pitch_class(note) for note in tuning]
+    root_pitch_class = note_to_pitch_class("A")
+    fingerings = chord.get_chord_fingerings(tuning)
+    ranked = sorted(
+        fingerings,
+        key=lambda fingering: -playability_score(
+            fingering, open_pitch_classes, root_pitch_class
+        ),
+    )
+    assert (
+        best_chord_fingerings(
+            *chord._chord_search_inputs(tuning, 5),
+            open_pitch_classes,
+            root_pitch_class,
+            k,
+        )
+        == ranked[:k]
+    )
+
+
+def test_best_chord_fingerings_with_negative_k():
+    chord = ChordFromName(root="C", quality="M").build()
+    with pytest.raises(ValueError):
+        best_chord_fingerings(*chord._chord_search_inputs(["E", "A"], 5), [7, 0], 3, -1)
+
+
+@pytest.mark.parametrize("min_notes_in_chord", [1, 3])
+@pytest.mark.parametrize(
+    "weights", [PlayabilityWeights(), PlayabilityWeights(1, 0, 0.5, 2, 0)]
+)
+def test_best_chord_fingerings_matches_sorted_fingerings_parameters(
+    min_notes_in_chord, weights
+):
+    chord = ChordFromName(root="D", quality="7").build()
+    tuning = ["E", "A", "D", "G", "B", "E"]
+    open_pitch_classes = [note_to_pitch_class(note) for note in tuning]
+    root_pitch_class = note_to_pitch_class("D")
+    fingerings = chord.get_chord_fingerings(tuning, 5, min_notes_in_chord)
+    ranked = sorted(
+        fingerings,
+        key=lambda fingering: -playability_score(
+            fingering, open_pitch_classes, root_pitch_class, weights
+        ),
+    )
+    assert (
+        chord.best_chord_fingerings(tuning, 10, 5, min_notes_in_chord, weights=weights)
+        == ranked[:10]
+    )
@@ -1,5 +1,8 @@
+import threading
+
 import pytest
 
+import fretboardgtr.fretboard as fretboard_module
 from fretboardgtr.elements.background import Background, BackgroundConfig
 from fretboardgtr.elements.fret_number import FretNumber, FretNumberConfig
 from fretboardgtr.elements.frets import Fret, FretConfig
@@ -13,10 +16,20 @@ from fretboardgtr.elements.notes import (
 from fretboardgtr.elements.nut import Nut, NutConfig
 from fretboardgtr.elements.strings import String, StringConfig
 from fretboardgtr.elements.tuning import Tuning, TuningConfig
-from fretboardgtr.fretboard import FretBoard
-from fretboardgtr.fretboards.config import FretBoardConfig, FretBoardGeneralConfig
+from fretboardgtr.fretboard import (
+    FretBoard,
+    clear_fretboard_pool,
+    clear_skeleton_cache,
+    pooled_fretboard,
+)
+from fretboardgtr.fretboards.config import (
+    NOTE_POLICIES,
+    FretBoardConfig,
+    FretBoardGeneralConfig,
+)
+from fretboardgtr.fretboards.converters import FretBoardToSVGConverter
 from fretboardgtr.note_colors import NoteColors
-from fretboardgtr.notes_creators import NotesContainer
+from fretboardgtr.notes_creators import ChordFromName, NotesContainer, ScaleFromName
 
 
 @pytest.fixture()
@@ -567,6 +580,29 @@ def test_init_fretboard_add_notes(default_config):
     assert any([isinstance(obj, OpenNote) for obj in list_of_elements])
 
 
+def test_init_fretboard_add_notes_enharmonic_spelling(default_config):
+    fretboard = FretBoard(config=default_config)
+    # Spelled with Cb once enharmonic
+    fretboard.add_notes(
+        NotesContainer(root="F#", notes=["F#", "G#", "A#", "B", "C#", "D#", "F"])
+    )
+    c_flat_notes = [note for note in fretboard.elements.notes if note.name == "Cb"]
+    # Cb is the seventh fret of the E strings
+    assert len(c_flat_notes) == 7
+    assert fretboard.fretboard.get_single_note_position(0, 7) in {
+        (note.x, note.y) for note in c_flat_notes
+    }
+
+
+def test_init_fretboard_add_notes_duplicated_pitch_class(default_config):
+    fretboard = FretBoard(config=default_config)
+    fretboard.add_notes(NotesContainer(root="C", notes=["C", "E", "G"]))
+    number_of_notes = len(fretboard.elements.notes)
+    fretboard = FretBoard(config=default_config)
+    fretboard.add_notes(NotesContainer(root="C", notes=["C", "E", "G", "C"]))
+    assert len(fretboard.elements.notes) == number_of_notes
+
+
 def test_add_element(default_config):
     note = OpenNote("C", position=(0, 0))
     fretboard = FretBoard(config=default_config)
@@ -577,3 +613,507 @@ def test_add_wrong_lement(default_config):
     fretboard = FretBoard(config=default_config)
     with pytest.raises(ValueError):
         fretboard.add_element(1)
+
+
+def _note_layer(fretboard):
+    return [
+        (type(note), note.name, note.x, note.y, note.config.color)
+        for note in fretboard.elements.notes
+    ]
+
+
+def test_transpose_notes_matches_new_key(default_config):
+    fretboard = FretBoard(config=default_config)
+    fretboard.add_notes(ScaleFromName(root="C", mode="Ionian").build())
+    skeleton = fretboard.elements.frets
+    fretboard.transpose(2)
+
+    expected = FretBoard(config=default_config)
+    expected.add_notes(ScaleFromName(root="D", mode="Ionian").build())
+    assert _note_layer(fretboard) == _note_layer(expected)
+    assert fretboard.elements.frets is skeleton
+
+
+def test_transpose_fingering(default_config):
+    fretboard = FretBoard(config=default_config)
+    fretboard.add_fingering([None, 3, 2, 0, 1, 0], root="C")
+    original = _note_layer(fretboard)
+    fretboard.transpose(2)
+
+    expected = FretBoard(config=default_config)
+    expected.add_fingering([None, 5, 4, 2, 3, 2], root="D")
+    assert _note_layer(fretboard) == _note_layer(expected)
+    assert len(fretboard.elements.crosses) == 1
+
+    # Transpositions add up and are computed from the original calls
+    fretboard.transpose(-14)
+    assert _note_layer(fretboard) == original
+
+
+def test_transpose_drops_shapes_out_of_range(default_config):
+    fretboard = FretBoard(config=default_config)
+    fretboard.add_fingering([1, None, None, None, None, 12], root="C")
+    fretboard.transpose(3)
+    assert fretboard.elements.notes == []
+    assert fretboard.elements.crosses == []
+    fretboard.transpose(-3)
+    assert len(fretboard.elements.notes) == 2
+
+
+def test_transpose_keeps_note_elements(default_config):
+    fretboard = FretBoard(config=default_config)
+    note = OpenNote("C", position=(0, 0))
+    fretboard.add_note_element(note)
+    fretboard.add_note(0, "C", root="C")
+    fretboard.transpose(5)
+    assert fretboard.elements.notes[0] is note
+    assert {note.name for note in fretboard.elements.notes[1:]} == {"F"}
+
+
+@pytest.mark.parametrize("vertical", [False, True])
+def test_add_notes_batch_matches_note_by_note(default_config, vertical):
+    tuning = ["F#", "B", "E", "A", "D", "G", "B", "E"]
+    default_config.general.last_fret = 24
+    default_config.general.show_degree_name = True
+    scale = ScaleFromName(root="E", mode="Dominantbebop").build()
+    fretboard = FretBoard(tuning=tuning, config=default_config, vertical=vertical)
+    fretboard.add_notes(scale)
+
+    expected = FretBoard(tuning=tuning, config=default_config, vertical=vertical)
+    for string_no, _ in enumerate(tuning):
+        for note in scale.notes:
+            expected.add_note(string_no, note, scale.root)
+    assert _note_layer(fretboard) == _note_layer(expected)
+
+
+def test_add_notes_shares_styles(default_config):
+    fretboard = FretBoard(config=default_config)
+    fretboard.add_notes(ScaleFromName(root="C", mode="Ionian").build())
+    styles = {id(note._config) for note in fretboard.elements.notes}
+    # One open and one fretted style per degree at most
+    assert len(styles) <= 14
+
+
+def test_add_notes_draws_notes_added_to_the_container(default_config):
+    chord = ChordFromName(root="C", quality="M").build()
+    chord.notes.append("A#")
+    fretboard = FretBoard(config=default_config)
+    fretboard.add_notes(chord)
+    expected = FretBoard(config=default_config)
+    expected.add_notes(NotesContainer("C", ["C", "E", "G", "A#"]))
+    assert _note_layer(fretboard) == _note_layer(expected)
+
+
+def test_note_config_is_editable(default_config):
+    fretboard = FretBoard(config=default_config)
+    fretboard.add_notes(ScaleFromName(root="C", mode="Ionian").build())
+    notes = fretboard.elements.notes
+    first, second = [note for note in notes if note._config is notes[0]._config][:2]
+    first.config.color = "red"
+    assert first.config.color == "red"
+    assert second.config.color != "red"
+    assert 'fill="red"' in first.get_svg().tostring()
+
+
+def _svg(fretboard):
+    return FretBoardToSVGConverter(fretboard).convert().tostring()
+
+
+@pytest.mark.parametrize("vertical", [False, True])
+def test_from_template_matches_init(default_config, vertical):
+    clear_skeleton_cache()
+    tuning = ["B", "E", "A", "D", "G", "B", "E"]
+    fretboard = FretBoard.from_template(tuning, default_config, vertical)
+    fretboard.add_fingering([None, 0, 2, 2, 1, 0, 0], root="E")
+    expected = FretBoard(tuning, default_config, vertical)
+    expected.add_fingering([None, 0, 2, 2, 1, 0, 0], root="E")
+    assert _svg(fretboard) == _svg(expected)
+
+
+def test_from_template_shares_skeleton_only(default_config):
+    clear_skeleton_cache()
+    first = FretBoard.from_template(config=default_config)
+    second = FretBoard.from_template(config=default_config)
+    assert first.elements.background is second.elements.background
+    assert first.elements.frets == second.elements.frets
+    assert first.elements.frets is not second.elements.frets
+    first.add_note(0, "C")
+    first.add_element(OpenNote("C", position=(0, 0)))
+    assert second.elements.notes == []
+    assert second.elements.customs == []
+
+
+def test_from_template_depends_on_config(default_config):
+    clear_skeleton_cache()
+    first = FretBoard.from_template(config=default_config)
+    default_config.general.last_fret = 15
+    second = FretBoard.from_template(config=default_config)
+    assert len(second.elements.frets) == len(first.elements.frets) + 3
+    # Note colors do not change the skeleton
+    default_config.general.fretted_colors.root = "rgb(0, 0, 0)"
+    third = FretBoard.from_template(config=default_config)
+    assert third.elements.background is second.elements.background
+
+
+def test_skeleton_layers_are_serialised_once(default_config, monkeypatch):
+    fretboard = FretBoard(config=default_config)
+    first_svg = _svg(fretboard)
+    calls = []
+    original_get_svg = Fret.get_svg
+    monkeypatch.setattr(
+        Fret, "get_svg", lambda self: calls.append(self) or original_get_svg(self)
+    )
+    fretboard.add_fingering([None, 3, 2, 0, 1, 0], root="C")
+    svg = _svg(fretboard)
+    assert calls == []
+    assert fretboard.get_layer_xml("notes") is None
+    assert fretboard.get_layer_xml("frets") is fretboard.get_layer_xml("frets")
+
+    expected = FretBoard(config=default_config)
+    expected.add_fingering([None, 3, 2, 0, 1, 0], root="C")
+    assert svg == _svg(expected)
+    assert svg != first_svg
+
+
+def test_skeleton_cache_is_invalidated(default_config):
+    fretboard = FretBoard(config=default_config)
+    frets_xml = fretboard.get_layer_xml("frets")
+    # Configuration changed in place
+    fretboard.config.frets.color = "rgb(1, 2, 3)"
+    assert fretboard.get_layer_xml("frets") is not frets_xml
+    assert "rgb(1, 2, 3)" in _svg(fretboard)
+
+    # Elements added
+    frets_xml = fretboard.get_layer_xml("frets")
+    fretboard.add_frets()
+    assert len(fretboard.get_layer_xml("frets")) == 2 * len(frets_xml)
+
+    # New configuration
+    strings_xml = fretboard.get_layer_xml("strings")
+    fretboard.set_config(FretBoardConfig())
+    assert fretboard.get_layer_xml("strings") is not strings_xml
+
+    # Element modified in place
+    strings_xml = fretboard.get_layer_xml("strings")
+    fretboard.elements.strings[0].start_position = (0, 0)
+    assert fretboard.get_layer_xml("strings") is not strings_xml
+    strings_xml = fretboard.get_layer_xml("strings")
+    fretboard.elements.strings[0].config.color = "rgb(4, 5, 6)"
+    assert fretboard.get_layer_xml("strings") is not strings_xml
+    assert "rgb(4, 5, 6)" in _svg(fretboard)
+    strings_xml = fretboard.get_layer_xml("strings")
+    assert fretboard.get_layer_xml("strings") is strings_xml
+    fretboard.invalidate_svg_cache()
+    assert fretboard.get_layer_xml("strings") is not strings_xml
+
+
+def test_template_fretboards_share_serialised_skeleton(default_config):
+    clear_skeleton_cache()
+    first = FretBoard.from_template(config=default_config)
+    second = FretBoard.from_template(config=default_config)
+    assert first.get_layer_xml("frets") is second.get_layer_xml("frets")
+
+
+def test_from_template_is_thread_safe(monkeypatch):
+    clear_skeleton_cache()
+    monkeypatch.setattr(fretboard_module, "SKELETON_CACHE_SIZE", 2)
+    errors = []
+    backgrounds = []
+
+    def build(last_fret):
+        config = FretBoardConfig(general=FretBoardGeneralConfig(last_fret=last_fret))
+        try:
+            for _ in range(5):
+                fretboard = FretBoard.from_template(config=config)
+                fretboard.get_layer_xml("frets")
+                backgrounds.append((last_fret, fretboard.elements.background))
+        except Exception as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=build, args=(12 + i % 4,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert len(backgrounds) == 40
+    assert len(fretboard_module._skeletons) <= 2
+
+
+def test_clear_notes(default_config):
+    fretboard = FretBoard(config=default_config)
+    custom = OpenNote("C", position=(0, 0))
+    fretboard.add_element(custom)
+    fretboard.add_fingering([None, 3, 2, 0, 1, 0], root="C")
+    fretboard.transpose(2)
+    fretboard.clear_notes()
+    assert fretboard.elements.notes == []
+    assert fretboard.elements.crosses == []
+    assert fretboard.elements.customs == [custom]
+
+    # Only the calls made after clearing are transposed
+    fretboard.add_fingering([0, 2, 2, 1, 0, 0], root="E")
+    fretboard.transpose(1)
+    expected = FretBoard(config=default_config)
+    expected.add_fingering([1, 3, 3, 2, 1, 1], root="F")
+    assert _note_layer(fretboard) == _note_layer(expected)
+
+
+def test_reset(default_config):
+    fretboard = FretBoard(config=default_config)
+    empty_svg = _svg(fretboard)
+    fretboard.add_notes(ScaleFromName(root="C", mode="Ionian").build())
+    fretboard.add_element(OpenNote("C", position=(0, 0)))
+    fretboard.reset()
+    assert _svg(fretboard) == empty_svg
+
+    # Skeleton layers are built again from the configuration
+    fretboard.config.frets.color = "rgb(1, 2, 3)"
+    fretboard.add_frets()
+    fretboard.reset(["frets"])
+    expected = FretBoard(config=default_config)
+    assert _svg(fretboard) == _svg(expected)
+
+    with pytest.raises(ValueError):
+        fretboard.reset(["chords"])
+
+
+def test_pooled_fretboard_is_reused(default_config):
+    clear_fretboard_pool()
+    with pooled_fretboard(config=default_config) as fretboard:
+        fretboard.add_fingering([None, 3, 2, 0, 1, 0], root="C")
+        svg = _svg(fretboard)
+    assert fretboard.elements.notes == []
+    assert fretboard.elements.crosses == []
+
+    with pooled_fretboard(config=default_config) as other:
+        assert other is fretboard
+        other.add_fingering([None, 3, 2, 0, 1, 0], root="C")
+        assert _svg(other) == svg
+        # Fretboards in use are not shared
+        with pooled_fretboard(config=default_config) as nested:
+            assert nested is not other
+
+    default_config.general.fretted_colors.root = "rgb(0, 0, 0)"
+    with pooled_fretboard(config=default_config) as recolored:
+        assert recolored is not fretboard
+
+
+def test_transpose_uses_copies_of_the_arguments(default_config):
+    fingering = [None, 3, 2, 0, 1, 0]
+    fretboard = FretBoard(config=default_config)
+    fretboard.add_fingering(fingering, root="C")
+    expected = _note_layer(fretboard)
+    fingering[1] = 8
+    fretboard.transpose(12)
+    assert _note_layer(fretboard) == expected
+
+
+def test_recorded_calls_are_bounded(default_config, monkeypatch):
+    def add(fretboard):
+        for fret in range(4):
+            fretboard.add_fingering([None, None, None, None, None, fret], root="C")
+        fretboard.transpose(0)
+        fretboard.add_note(0, "F", root="C")
+
+    expected = FretBoard(config=default_config)
+    add(expected)
+    monkeypatch.setattr(fretboard_module, "MAX_NOTE_LAYER_CALLS", 4)
+    fretboard = FretBoard(config=default_config)
+    add(fretboard)
+    assert fretboard._note_layer == []
+    assert _note_layer(fretboard) == _note_layer(expected)
+    with pytest.raises(ValueError):
+        fretboard.transpose(2)
+
+    fretboard.clear_notes()
+    fretboard.add_fingering([None, 3, 2, 0, 1, 0], root="C")
+    fretboard.transpose(2)
+    assert len(fretboard._note_layer) == 1
+
+
+def test_pooled_fretboard_is_thread_local(default_config):
+    clear_fretboard_pool()
+    with pooled_fretboard(config=default_config) as fretboard:
+        pass
+    borrowed = []
+
+    def borrow():
+        with pooled_fretboard(config=default_config) as other:
+            borrowed.append(other)
+
+    thread = threading.Thread(target=borrow)
+    thread.start()
+    thread.join()
+    assert borrowed[0] is not fretboard
+
+
+def test_pooled_fretboard_with_new_config_is_dropped(default_config):
+    clear_fretboard_pool()
+    with pooled_fretboard(config=default_config) as fretboard:
+        fretboard.set_config(
+            FretBoardConfig(general=FretBoardGeneralConfig(last_fret=24))
+        )
+    with pooled_fretboard(config=default_config) as other:
+        assert other is not fretboard
+
+
+def test_lazy_fretboard_draws_when_read(default_config, monkeypatch):
+    drawn = []
+    original_draw_notes = FretBoard._draw_notes
+    monkeypatch.setattr(
+        FretBoard,
+        "_draw_notes",
+        lambda self, scale: drawn.append(scale) or original_draw_notes(self, scale),
+    )
+    fretboard = FretBoard(config=default_config, lazy=True)
+    fretboard.add_notes(ScaleFromName(root="C", mode="Ionian").build())
+    fretboard.add_fingering([None, 3, 2, 0, 1, 0], root="C")
+    fretboard.transpose(2)
+    assert fretboard.get_size() == FretBoard(config=default_config).get_size()
+    assert drawn == []
+
+    svg = _svg(fretboard)
+    # Drawn once, in the new key
+    assert drawn == [ScaleFromName(root="D", mode="Ionian").build()]
+    expected = FretBoard(config=default_config)
+    expected.add_notes(ScaleFromName(root="C", mode="Ionian").build())
+    expected.add_fingering([None, 3, 2, 0, 1, 0], root="C")
+    expected.transpose(2)
+    assert svg == _svg(expected)
+
+    # Only the new calls are drawn
+    drawn.clear()
+    fretboard.add_note(0, "F", root="D")
+    assert len(fretboard.get_elements().notes) == len(expected.elements.notes) + 1
+    assert drawn == []
+
+
+@pytest.mark.parametrize("note_policy", NOTE_POLICIES)
+def test_lazy_fretboard_matches_eager(default_config, note_policy):
+    default_config.general.note_policy = note_policy
+    note = OpenNote("C", position=(0, 0))
+
+    def add(fretboard):
+        fretboard.add_notes(NotesContainer("C", ["C", "E", "G"]))
+        fretboard.add_notes(NotesContainer("C", ["C", "Fb"]))
+        fretboard.add_notes(ScaleFromName(root="C", mode="Ionian").build())
+        fretboard.add_notes(ScaleFromName(root="C", mode="Majorpentatonic").build())
+        fretboard.add_fingering([None, 3, 2, 0, 1, 0], root="C")
+        fretboard.add_fingering([None, 3, 2, 0, 1, 0], root="C")
+        fretboard.add_note_element(note)
+        fretboard.add_note_element(note)
+        fretboard.add_note(0, "F", root="C")
+        fretboard.add_note(0, "F", root="C")
+
+    eager = FretBoard(config=default_config)
+    lazy = FretBoard(config=default_config, lazy=True)
+    add(eager)
+    add(lazy)
+    assert _svg(lazy) == _svg(eager)
+
+    add(eager)
+    add(lazy)
+    eager.transpose(3)
+    lazy.transpose(3)
+    assert _svg(lazy) == _svg(eager)
+
+
+def test_lazy_fretboard_copies_arguments(default_config):
+    def add(fretboard):
+        fingering = [None, 3, 2, 0, 1, 0]
+        scale = [[None], [3], [2, 5], [0], [1], [0]]
+        container = NotesContainer("C", ["C", "E"])
+        fretboard.add_fingering(fingering, root="C")
+        fretboard.add_scale(scale, root="C")
+        fretboard.add_notes(container)
+        # Changed after being added, only eager fretboards drew them
+        fingering[1] = 8
+        scale[2].append(7)
+        container.notes.append("A#")
+
+    eager = FretBoard(config=default_config)
+    lazy = FretBoard(config=default_config, lazy=True)
+    add(eager)
+    add(lazy)
+    assert _svg(lazy) == _svg(eager)
+
+
+@pytest.mark.parametrize(
+    "note_policy, number_of_draws", [("replace", 2), ("keep", 1), ("stack", 3)]
+)
+def test_lazy_fretboard_merges_calls(
+    default_config, monkeypatch, note_policy, number_of_draws
+):
+    drawn = []
+    original_draw_notes = FretBoard._draw_notes
+    monkeypatch.setattr(
+        FretBoard,
+        "_draw_notes",
+        lambda self, scale: drawn.append(scale) or original_draw_notes(self, scale),
+    )
+    default_config.general.note_policy = note_policy
+    fretboard = FretBoard(config=default_config, lazy=True)
+    fretboard.add_notes(ScaleFromName(root="C", mode="Ionian").build())
+    fretboard.add_notes(ScaleFromName(root="A", mode="Minorpentatonic").build())
+    fretboard.add_notes(ScaleFromName(root="A", mode="Minorpentatonic").build())
+    fretboard.get_elements()
+    assert len(drawn) == number_of_draws
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_note_policies(default_config, compact):
+    scale = ScaleFromName(root="C", mode="Ionian").build()
+    chord = [None, 3, 2, 0, 1, 0]
+
+    fretboard = FretBoard(config=default_config, compact=compact)
+    fretboard.add_notes(scale)
+    number_of_notes = len(fretboard.elements.notes)
+    fretboard.add_fingering(chord, root="C")
+    fretboard.add_fingering(chord, root="C")
+    # The notes of the chord are already on the fretboard
+    assert len(fretboard.elements.notes) == number_of_notes
+    assert len(fretboard.elements.crosses) == 1
+    chord_only = FretBoard(config=default_config)
+    chord_only.add_fingering(chord, root="C")
+    replaced = {repr(note) for note in _note_layer(chord_only)}
+    assert replaced <= {repr(note) for note in _note_layer(fretboard)}
+
+    default_config.general.show_degree_name = True
+    fretboard.set_config(default_config)
+    fretboard.add_fingering(chord, root="C")
+    assert len(fretboard.elements.notes) == number_of_notes
+    assert "1" in {note.name for note in fretboard.elements.notes}
+
+    default_config.general.note_policy = "keep"
+    fretboard = FretBoard(config=default_config, compact=compact)
+    fretboard.add_fingering(chord, root="C")
+    fretboard.add_notes(ScaleFromName(root="G", mode="Ionian").build())
+    # Degrees of the chord, not of the scale
+    chord_notes = fretboard.elements.notes[:5]
+    assert {note.name for note in chord_notes} == {"1", "3", "5"}
+
+    default_config.general.note_policy = "stack"
+    fretboard = FretBoard(config=default_config, compact=compact)
+    fretboard.add_notes(scale)
+    fretboard.add_fingering(chord, root="C")
+    assert len(fretboard.elements.notes) == number_of_notes + 5
+
+    default_config.general.note_policy = "merge"
+    with pytest.raises(ValueError):
+        FretBoard(config=default_config)
+
+
+def test_note_policy_after_layer_change(default_config):
+    fretboard = FretBoard(config=default_config)
+    fretboard.add_fingering([None, 3, 2, 0, 1, 0], root="C")
+    fretboard.elements.notes = []
+    fretboard.add_fingering([None, 3, 2, 0, 1, 0], root="C")
+    assert len(fretboard.elements.notes) == 5
+    fretboard.add_note_element(OpenNote("C", position=(0, 0)))
+    fretboard.add_fingering([None, 3, 2, 0, 1, 0], root="C")
+    assert len(fretboard.elements.notes) == 6
+    # Places beyond the last fret are indexed too
+    fretboard.add_single_note_from_index(0, 20)
+    fretboard.add_single_note_from_index(0, 20)
+    assert len(fretboard.elements.notes) == 7
@@ -0,0 +1,51 @@
+import pytest
+
+from fretboardgtr.constants import ChordName, ModeName
+from fretboardgtr.harmonisation import (
+    Chord,
+    Scale,
+    chords_in_scale,
+    scales_containing,
+)
+from fretboardgtr.notes_creators import ChordFromName, ScaleFromName
+
+
+def test_chords_in_scale_matches_containers():
+    scale = ScaleFromName(root="D", mode="Dorian").build()
+    chords = chords_in_scale("D", "Dorian")
+    assert chords[0].root == "D"
+    for chord in chords:
+        container = ChordFromName(chord.root, chord.quality).build()
+        assert container.pitch_class_mask & ~scale.pitch_class_mask == 0
+    # Every triad of the key of C is found
+    for root, quality in [("D", "m"), ("E", "m"), ("F", "M"), ("B", "dim")]:
+        assert Chord(root, quality) in chords
+    assert Chord("D", "M") not in chords
+
+
+def test_scales_containing_is_the_inverse_relation():
+    scales = scales_containing("A", "m7")
+    assert Scale("A", "Aeolian") in scales
+    assert Scale("A", "Ionian") not in scales
+    for scale in scales:
+        assert Chord("A", "m7") in chords_in_scale(scale.root, scale.mode)
+
+
+def test_any_spelling_and_enums():
+    assert chords_in_scale("Bb", ModeName.IONIAN) == chords_in_scale("A#", "Ionian")
+    assert scales_containing("Db", ChordName.MAJOR)[0] == Scale("C#", "Ionian")
+
+
+def test_queries_return_copies():
+    chords = chords_in_scale("C", "Ionian")
+    chords.clear()
+    assert chords_in_scale("C", "Ionian")
+
+
+def test_unknown_mode_or_quality():
+    with pytest.raises(KeyError):
+        chords_in_scale("C", "Unknown")
+    with pytest.raises(KeyError):
+        scales_containing("C", "Unknown")
+    with pytest.raises(ValueError):
+        chords_in_scale("H", "Ionian")
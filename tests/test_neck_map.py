@@ -0,0 +1,37 @@
+from fretboardgtr.neck_map import get_neck_map
+from fretboardgtr.utils import get_note_from_index, note_to_pitch_class
+
+TUNING = ["E", "A", "D", "G", "B", "E"]
+
+
+def test_neck_map_pitch_classes_and_frets():
+    neck_map = get_neck_map(TUNING, 0, 24)
+    assert neck_map.open_pitch_classes == (7, 0, 5, 10, 2, 7)
+    assert neck_map.pitch_classes[0][:4] == (7, 8, 9, 10)
+    assert neck_map.frets[0][note_to_pitch_class("G")] == (3, 15)
+    assert neck_map.frets[1][note_to_pitch_class("A")] == (0, 12, 24)
+    for string_no, string_frets in enumerate(neck_map.frets):
+        for pitch_class, frets in enumerate(string_frets):
+            for fret in frets:
+                assert neck_map.pitch_classes[string_no][fret] == pitch_class
+
+
+def test_neck_map_range():
+    neck_map = get_neck_map(TUNING, 5, 9)
+    assert neck_map.pitch_classes[0] == (0, 1, 2, 3, 4)
+    assert neck_map.frets[0][0] == (5,)
+    assert neck_map.frets[0][7] == ()
+
+
+def test_neck_map_notes():
+    neck_map = get_neck_map(TUNING, 0, 12)
+    for string_no, string_note in enumerate(TUNING):
+        for fret in range(30):
+            assert neck_map.note(string_no, fret) == get_note_from_index(
+                fret, string_note
+            )
+
+
+def test_neck_map_is_shared():
+    assert get_neck_map(TUNING, 0, 12) is get_neck_map(tuple(TUNING), 0, 12)
+    assert get_neck_map(TUNING, 0, 12) is not get_neck_map(TUNING, 1, 12)
@@ -117,3 +117,91 @@ def test_sharp_enharmonic(note_str, expected_sharp_enharmonic_note):
     note = Note(note_str)
     sharp_enharmonic_note = note.sharp_enharmonic()
     assert str(sharp_enharmonic_note) == expected_sharp_enharmonic_note
+
+
+def test_notes_are_interned():
+    assert Note("C#") is Note("C#")
+    assert Note("C#").sharpen() is Note("C##")
+    assert Note("C#") is not Note("Db")
+
+
+def test_note_cache_is_bounded(monkeypatch):
+    import fretboardgtr.notes as notes_module
+
+    monkeypatch.setattr(Note, "_instances", {"C": Note("C")})
+    monkeypatch.setattr(notes_module, "NOTE_CACHE_SIZE", 1)
+    note = Note("C######")
+    assert note is not Note("C######")
+    assert note == Note("C######")
+    assert len({note, Note("C######")}) == 1
+    assert note != Note("C")
+    assert note.pitch_class == Note("F#").pitch_class
+    assert Note("C") is Note("C")
+    assert Note._instances == {"C": Note("C")}
+
+
+def test_notes_are_interned_across_threads(monkeypatch):
+    import threading
+
+    monkeypatch.setattr(Note, "_instances", {})
+    built = []
+    threads = [
+        threading.Thread(target=lambda: built.append(Note("G##"))) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(note is built[0] for note in built)
+
+
+def test_note_resolutions_are_cached_in_slots():
+    note = Note("C##")
+    assert note.resolve() is note.resolve() is Note("D")
+    assert note.resolve(prefer_flat=False) is Note("D")
+    assert Note("Bbb").resolve(prefer_flat=False) is Note("A")
+    assert not hasattr(note, "__dict__")
+    assert not any(isinstance(getattr(note, slot), dict) for slot in Note.__slots__)
+
+
+def test_note_is_immutable():
+    note = Note("C")
+    with pytest.raises(AttributeError):
+        note.name = "D"
+    with pytest.raises(AttributeError):
+        note.other = "D"
+
+
+def test_note_survives_pickling():
+    import copy
+    import pickle
+
+    note = Note("Bbb")
+    assert pickle.loads(pickle.dumps(note)) is note
+    assert copy.deepcopy(note) is note
+
+
+@pytest.mark.parametrize(
+    "note_str, expected_pitch_class, expected_accidentals",
+    [
+        ("A", 0, 0),
+        ("C", 3, 0),
+        ("B#", 3, 1),
+        ("Dbb", 3, -2),
+        ("G#", 11, 1),
+        ("Ab", 11, -1),
+    ],
+)
+def test_pitch_class_and_accidentals(
+    note_str, expected_pitch_class, expected_accidentals
+):
+    note = Note(note_str)
+    assert note.pitch_class == expected_pitch_class
+    assert note.accidentals == expected_accidentals
+
+
+def test_enharmonics_are_cached():
+    note = Note("F")
+    assert note.flat_enharmonic() is note.flat_enharmonic()
+    assert note.sharp_enharmonic() is Note("E#")
+    assert note.resolve() is Note("F")
@@ -1,4 +1,8 @@
-from fretboardgtr.notes_creators import ChordFromName, ScaleFromName
+import pytest
+
+from fretboardgtr.constants import ModeName, NoteName
+from fretboardgtr.notes_creators import ChordFromName, NotesContainer, ScaleFromName
+from fretboardgtr.utils import notes_to_mask
 
 
 def test_scale_creator():
@@ -11,6 +15,31 @@ def test_chord_creator():
     assert chord.notes == ["C", "E", "G"]
 
 
+def test_notes_container_pitch_classes():
+    chord = NotesContainer(root="C", notes=["C", "Eb", "G", "B#"])
+    assert chord.pitch_classes == [3, 6, 10, 3]
+    assert chord.pitch_class_mask == (1 << 3) | (1 << 6) | (1 << 10)
+
+
+def test_notes_container_follows_its_notes():
+    tuning = ["E", "A", "D", "G", "B", "E"]
+    chord = ChordFromName(root="C", quality="M").build()
+    chord.notes.append("A#")
+    assert chord.pitch_classes == [3, 7, 10, 1]
+    assert chord.pitch_class_mask == notes_to_mask(["C", "E", "G", "A#"])
+    expected = NotesContainer(root="C", notes=["C", "E", "G", "A#"])
+    assert chord.get_chord_fingerings(tuning) == expected.get_chord_fingerings(tuning)
+
+
+def test_chord_creator_fingerings_flat_notes():
+    tuning = ["E", "A", "D", "G", "B", "E"]
+    sharp_chord = ChordFromName(root="C", quality="m").build()
+    flat_chord = NotesContainer(root="C", notes=["C", "Eb", "G"])
+    assert flat_chord.get_chord_fingerings(tuning) == sharp_chord.get_chord_fingerings(
+        tuning
+    )
+
+
 def test_chord_creator_fingerings():
     fingerings = (
         ChordFromName(root="C", quality="M")
@@ -27,3 +56,109 @@ def test_scale_creator_position():
         .get_scale_positions(["E", "A", "D", "G", "B", "E"])
     )
     assert len(scale_positions) > 5
+
+
+def test_chord_creator_iter_fingerings():
+    chord = ChordFromName(root="C", quality="M").build()
+    tuning = ["E", "A", "D", "G", "B", "E"]
+    fingerings = chord.get_chord_fingerings(tuning)
+    assert list(chord.iter_chord_fingerings(tuning)) == fingerings
+    assert list(chord.iter_chord_fingerings(tuning, limit=20)) == fingerings[:20]
+    assert (
+        list(chord.iter_chord_fingerings(tuning, limit=20, offset=40))
+        == fingerings[40:60]
+    )
+    assert list(chord.iter_chord_fingerings(tuning, offset=len(fingerings))) == []
+
+
+def test_chord_creator_iter_fingerings_invalid_page():
+    chord = ChordFromName(root="C", quality="M").build()
+    with pytest.raises(ValueError):
+        next(chord.iter_chord_fingerings(["E", "A", "D", "G"], offset=-1))
+    with pytest.raises(ValueError):
+        next(chord.iter_chord_fingerings(["E", "A", "D", "G"], limit=-1))
+
+
+def test_best_chord_fingerings():
+    chord = ChordFromName(root="C", quality="M").build()
+    tuning = ["E", "A", "D", "G", "B", "E"]
+    best = chord.best_chord_fingerings(tuning, k=3)
+    assert len(best) == 3
+    assert best[0] == [0, 3, 2, 0, 1, 0]
+    assert all(fingering in chord.get_chord_fingerings(tuning) for fingering in best)
+    assert chord.best_chord_fingerings(tuning, k=0) == []
+
+
+def test_builders_return_copies():
+    scale = ScaleFromName(root="C", mode="Dorian").build()
+    assert ScaleFromName(root="C", mode="Dorian").build() == scale
+    chord = ChordFromName(root="A#", quality="m7").build()
+    assert ChordFromName(root="A#", quality="m7").build() == chord
+    scale.root = "D"
+    scale.notes = ["D", "E"]
+    assert scale.pitch_classes == [5, 7]
+    assert ScaleFromName(root="C", mode="Dorian").build().root == "C"
+
+
+def test_builders_are_not_corrupted_by_callers():
+    scale = ScaleFromName(root="C", mode="Ionian").build()
+    scale.transpose(2).notes.pop()
+    scale.pitch_classes.append(11)
+    scale.notes.append("X")
+    chord = ChordFromName(root="C", quality="M").build()
+    chord.notes.clear()
+
+    assert ScaleFromName(root="C", mode="Ionian").build().notes == [
+        "C",
+        "D",
+        "E",
+        "F",
+        "G",
+        "A",
+        "B",
+    ]
+    assert ScaleFromName(root="C", mode="Ionian").build().pitch_classes == [
+        3,
+        5,
+        7,
+        8,
+        10,
+        0,
+        2,
+    ]
+    assert ChordFromName(root="C", quality="M").build().notes == ["C", "E", "G"]
+    assert len(ScaleFromName(root="C", mode="Ionian").build().transpose(2).notes) == 7
+
+
+def test_builders_with_enum_and_unknown_names():
+    assert (
+        ScaleFromName(root=NoteName.C, mode=ModeName.DORIAN).build()
+        == ScaleFromName(root="C", mode="Dorian").build()
+    )
+    with pytest.raises(KeyError):
+        ScaleFromName(root="C", mode="Unknown").build()
+    with pytest.raises(ValueError):
+        ChordFromName(root="Bb", quality="M").build()
+
+
+def test_get_scale_returns_copies():
+    scale = ScaleFromName(root="C", mode="Ionian").build()
+    strings_scale = scale.get_scale(["E", "A"])
+    strings_scale[0].append(99)
+    assert scale.get_scale(["E", "A"]) != strings_scale
+
+
+def test_transpose_container():
+    c_major = ScaleFromName(root="C", mode="Ionian").build()
+    d_major = c_major.transpose(2)
+    assert d_major.root == "D"
+    assert d_major.notes == ScaleFromName(root="D", mode="Ionian").build().notes
+    assert c_major.transpose(14) == d_major
+    assert c_major.transpose(-10) == d_major
+    assert c_major.transpose(12) == c_major
+    assert c_major.transpose(12) is not c_major
+    assert NotesContainer("Bb", ["Bb", "D", "F"]).transpose(1).notes == [
+        "B",
+        "D#",
+        "F#",
+    ]
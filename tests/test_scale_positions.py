@@ -0,0 +1,104 @@
+import pytest
+
+from fretboardgtr.notes_creators import ScaleFromName
+from fretboardgtr.scale_positions import (
+    PositionSystem,
+    _scale_positions,
+    get_scale_positions,
+)
+from fretboardgtr.utils import note_to_pitch_class
+
+TUNING = ["E", "A", "D", "G", "B", "E"]
+C_MAJOR = ScaleFromName(root="C", mode="Ionian").build()
+
+
+def test_fixed_window_positions():
+    positions = get_scale_positions(
+        TUNING, C_MAJOR.pitch_class_mask, first_fret=0, last_fret=12
+    )
+    assert positions[0] == [
+        [0, 1, 3],
+        [0, 2, 3],
+        [0, 2, 3],
+        [0, 2, 4],
+        [0, 1, 3],
+        [0, 1, 3],
+    ]
+    assert len(positions) == 8
+    assert positions[-1][0] == [12]
+
+
+def test_three_notes_per_string_positions():
+    positions = get_scale_positions(
+        TUNING, C_MAJOR.pitch_class_mask, PositionSystem.THREE_NOTES_PER_STRING
+    )
+    assert positions[1] == [
+        [1, 3, 5],
+        [2, 3, 5],
+        [2, 3, 5],
+        [2, 4, 5],
+        [3, 5, 6],
+        [3, 5, 7],
+    ]
+    assert all(len(frets) == 3 for position in positions for frets in position)
+    assert all(0 <= fret <= 24 for p in positions for frets in p for fret in frets)
+
+
+def test_caged_positions():
+    positions = get_scale_positions(
+        TUNING,
+        C_MAJOR.pitch_class_mask,
+        "caged",
+        last_fret=15,
+        root_pitch_class=note_to_pitch_class("C"),
+    )
+    # C, A, G, E, D then C again an octave above
+    assert [min(min(frets) for frets in position) for position in positions] == [
+        0,
+        2,
+        5,
+        7,
+        9,
+        12,
+    ]
+    assert positions[0] == [
+        [0, 1, 3],
+        [0, 2, 3],
+        [0, 2, 3],
+        [0, 2],
+        [0, 1, 3],
+        [0, 1, 3],
+    ]
+
+
+def test_caged_positions_errors():
+    with pytest.raises(ValueError):
+        get_scale_positions(TUNING, C_MAJOR.pitch_class_mask, "caged")
+    with pytest.raises(ValueError):
+        get_scale_positions(
+            ["D", "A", "D", "G", "A", "D"],
+            C_MAJOR.pitch_class_mask,
+            "caged",
+            root_pitch_class=3,
+        )
+    with pytest.raises(ValueError):
+        get_scale_positions(TUNING, C_MAJOR.pitch_class_mask, "unknown")
+
+
+def test_scale_positions_are_memoised_on_pitch_classes():
+    _scale_positions.cache_clear()
+    dorian = ScaleFromName(root="D", mode="Dorian").build()
+    first = get_scale_positions(TUNING, C_MAJOR.pitch_class_mask)
+    second = get_scale_positions(TUNING, dorian.pitch_class_mask)
+    assert first == second
+    assert _scale_positions.cache_info().hits == 1
+    # Returned positions are copies of the memoised ones
+    first[0][0].append(99)
+    assert get_scale_positions(TUNING, C_MAJOR.pitch_class_mask) == second
+
+
+def test_notes_container_scale_positions_systems():
+    positions = C_MAJOR.get_scale_positions(
+        TUNING, system=PositionSystem.CAGED, last_fret=15
+    )
+    assert len(positions) == 6
@@ -0,0 +1,60 @@
+import pytest
+
+from fretboardgtr.transposition import (
+    transpose_fingering,
+    transpose_fingerings,
+    transpose_note,
+    transpose_scale,
+)
+
+
+@pytest.mark.parametrize(
+    "note, semitones, expected",
+    [("C", 2, "D"), ("Bb", 3, "C#"), ("E", -1, "D#"), ("B#", 12, "C"), ("G", 0, "G")],
+)
+def test_transpose_note(note, semitones, expected):
+    assert transpose_note(note, semitones) == expected
+
+
+@pytest.mark.parametrize(
+    "semitones, expected",
+    [
+        (0, [None, 3, 2, 0, 1, 0]),
+        (2, [None, 5, 4, 2, 3, 2]),
+        (14, [None, 5, 4, 2, 3, 2]),
+        # Moved up as the lower position would need negative frets
+        (-2, [None, 13, 12, 10, 11, 10]),
+    ],
+)
+def test_transpose_fingering(semitones, expected):
+    assert transpose_fingering([None, 3, 2, 0, 1, 0], semitones) == expected
+
+
+def test_transpose_fingering_lowest_position():
+    # G major barre shape on the third fret goes down to E major open shape
+    assert transpose_fingering([3, 5, 5, 4, 3, 3], -3) == [0, 2, 2, 1, 0, 0]
+    assert transpose_fingering([3, 5, 5, 4, 3, 3], 9) == [0, 2, 2, 1, 0, 0]
+
+
+def test_transpose_fingering_out_of_range():
+    assert transpose_fingering([None, 3, 2, 0, 1, 0], 2, last_fret=4) is None
+    assert transpose_fingering([3, 5, 5, 4, 3, 3], -3, first_fret=2) == [
+        12,
+        14,
+        14,
+        13,
+        12,
+        12,
+    ]
+    assert transpose_fingering([None] * 6, 5) == [None] * 6
+
+
+def test_transpose_fingerings():
+    fingerings = [[None, 3, 2, 0, 1, 0], [8, 10, 10, 9, 8, 8]]
+    assert transpose_fingerings(fingerings, 2, last_fret=11) == [[None, 5, 4, 2, 3, 2]]
+
+
+def test_transpose_scale():
+    scale = [[0, 2], [0, 2, 4], [1, 2]]
+    assert transpose_scale(scale, 1) == [[1, 3], [1, 3, 5], [2, 3]]
+    assert transpose_scale(scale, 1, last_fret=4) is None
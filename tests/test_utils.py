@@ -1,11 +1,25 @@
+from typing import Dict, List, Tuple
+
 import pytest
 
+from fretboardgtr.constants import (
+    CHORDS_DICT_ESSENTIAL,
+    CHROMATICS_NOTES,
+    SCALES_DICT,
+)
+from fretboardgtr.notes import Note
+from fretboardgtr.notes_creators import ChordFromName, ScaleFromName
 from fretboardgtr.utils import (
     _contains_duplicates,
     chromatic_position_from_root,
     chromatics_from_root,
+    get_note_from_index,
+    intervals_to_names,
     note_to_interval,
     note_to_interval_name,
+    note_to_pitch_class,
+    notes_to_intervals,
+    notes_to_mask,
     scale_to_enharmonic,
     scale_to_flat,
     scale_to_intervals,
@@ -94,6 +108,103 @@ def test_note_to_interval_name():
     assert "5" == note_to_interval_name(note, root)
 
 
+@pytest.mark.parametrize(
+    "note, pitch_class",
+    [
+        ("A", 0),
+        ("C", 3),
+        ("Db", 4),
+        ("C#", 4),
+        ("B#", 3),
+        ("Fb", 7),
+        ("G##", 0),
+        ("Cbbbbbbb", 8),
+        ("C" + "#" * 14, 5),
+    ],
+)
+def test_note_to_pitch_class(note, pitch_class):
+    assert note_to_pitch_class(note) == pitch_class
+
+
+def test_note_to_pitch_class_invalid():
+    with pytest.raises(ValueError):
+        note_to_pitch_class("H")
+
+
+def test_chromatic_position_from_root_any_spelling():
+    assert chromatic_position_from_root(root="C", note="E#") == 5
+    assert chromatic_position_from_root(root="C", note="Cb") == 11
+    assert chromatic_position_from_root(root="Bb", note="D") == 4
+    with pytest.raises(ValueError):
+        chromatic_position_from_root(root="C", note="H")
+
+
+def test_get_note_from_index():
+    assert get_note_from_index(7, "C") == "G"
+    assert get_note_from_index(19, "C") == "G"
+    assert get_note_from_index(-1, "C") == "B"
+    assert get_note_from_index(1, "Bb") == "B"
+    assert get_note_from_index(2, "E###############") == "A"
+
+
+def test_notes_to_mask():
+    assert notes_to_mask(["A", "C", "E"]) == 0b10001001
+    assert notes_to_mask(["C", "B#", "Dbb"]) == 0b1000
+    assert notes_to_mask([]) == 0
+
+
+@pytest.mark.parametrize("has_numpy", [True, False])
+def test_notes_to_intervals(monkeypatch, has_numpy):
+    monkeypatch.setattr("fretboardgtr.utils.HAS_NUMPY", has_numpy)
+    notes = ["C", "E", "G", "Bb", "B#", "C" + "#" * 14]
+    roots = ["C", "C", "C", "C", "C", "A"]
+    expected = [note_to_interval(note, root) for note, root in zip(notes, roots)]
+    assert notes_to_intervals(notes, roots) == expected
+    assert notes_to_intervals(notes, "C") == [0, 4, 7, 10, 0, 2]
+    assert notes_to_intervals([], []) == []
+    with pytest.raises(ValueError):
+        notes_to_intervals(["C", "E"], ["C"])
+    with pytest.raises(ValueError):
+        notes_to_intervals(["C", "H"], "C")
+
+
+@pytest.mark.parametrize("has_numpy", [True, False])
+def test_intervals_to_names(monkeypatch, has_numpy):
+    monkeypatch.setattr("fretboardgtr.utils.HAS_NUMPY", has_numpy)
+    assert intervals_to_names([0, 3, 7, 19, -1]) == ["1", "b3", "5", "5", "7"]
+    notes = ["C", "E", "Gb", "A"]
+    assert intervals_to_names(notes_to_intervals(notes, "Eb")) == [
+        note_to_interval_name(note, "Eb") for note in notes
+    ]
+
+
+def test_notes_to_intervals_numpy_arrays_match_lists():
+    np = pytest.importorskip("numpy")
+    notes = ["C", "B#", "Dbb", "Ab", "G##", "C" + "#" * 14, "Fb" + "b" * 12, "C#b"]
+    intervals = notes_to_intervals(np.array(notes), "A")
+    assert intervals.tolist() == notes_to_intervals(notes, "A")
+    assert notes_to_intervals(np.array([], dtype=str), "A").tolist() == []
+    for invalid in (["C", "H"], ["C", ""]):
+        with pytest.raises(ValueError):
+            notes_to_intervals(np.array(invalid), "C")
+
+
+def test_notes_to_intervals_numpy_arrays():
+    np = pytest.importorskip("numpy")
+    notes = np.array([["C", "D"], ["E", "F"]])
+    intervals = notes_to_intervals(notes, np.array([["C", "C"], ["E", "E"]]))
+    assert isinstance(intervals, np.ndarray)
+    assert intervals.tolist() == [[0, 2], [0, 1]]
+    names = intervals_to_names(intervals)
+    assert isinstance(names, np.ndarray)
+    assert names.tolist() == [["1", "2"], ["1", "b2"]]
+    assert notes_to_intervals(np.array(["C", "E"]), "C").tolist() == [0, 4]
+    assert notes_to_intervals(["C", "E"], np.array(["C", "C"])).tolist() == [0, 4]
+    # Other sequences give lists, even with numpy installed
+    assert type(notes_to_intervals(["C", "E"], "C")) is list
+    assert type(intervals_to_names([0, 4])) is list
+
+
 def test_scale_to_intervals():
     scale = ["C", "E", "G"]
     assert [0, 4, 7] == scale_to_intervals(scale, root="C")
@@ -122,6 +233,144 @@ def test_sort_scale():
     ] == sort_scale(scale)
 
 
+def _legacy_enharmonic_duplicates(
+    scale: List[str],
+) -> Dict[str, List[Tuple[str, int]]]:
+    base_notes_scale = [note[0] for note in scale]
+    duplicates: Dict[str, List[Tuple[str, int]]] = {}
+    for idx, (real_note, base_note) in enumerate(zip(scale, base_notes_scale)):
+        if base_note in duplicates:
+            duplicates[base_note].append((real_note, idx))
+        else:
+            duplicates[base_note] = [(real_note, idx)]
+
+    # Remove key if there is only one note
+    duplicates = {key: value for key, value in duplicates.items() if len(value) > 1}
+    return duplicates
+
+
+def _legacy_note_sort(item: Tuple[str, int]) -> Tuple[str, int]:
+    """Sort b prefix first, then no prefix, then # prefix."""
+    note = item[0]
+    letter = note[0]
+    modifier = note[1:]
+
+    if modifier == "b":
+        return (letter, 0)
+    elif modifier == "#":
+        return (letter, 2)
+    else:
+        return (letter, 1)
+
+
+def _legacy_scale_to_enharmonic_sharp(
+    duplicates: Dict[str, List[Tuple[str, int]]], _scale: List[Note]
+) -> List[Note]:
+    # We choose to take '#'-suffix duplicated first to flatten
+    # If not availale take without prefix
+    # Let's say we have these duplicates
+    # ["G", "G#"] Then take G#
+    # ["Gb", "G", "G#"] Then take G#
+    # ["Gb", "G"] Then take G
+    # Once taken use the flat_enharmonic function to get the flat equivalent
+    # Of the given note
+    for _, notes in duplicates.items():
+        sorted_notes = sorted(notes, key=_legacy_note_sort)
+        _, idx = sorted_notes[-1]
+        _scale[idx] = _scale[idx].flat_enharmonic()
+        break
+    return _scale
+
+
+def _legacy_scale_to_enharmonic_flat(
+    duplicates: Dict[str, List[Tuple[str, int]]], _scale: List[Note]
+) -> List[Note]:
+    # We choose to take 'b'-suffix duplicated first to flatten
+    # If not availale take without prefix
+    # Let's say we have these duplicates
+    # ["G", "G#"] Then take G
+    # ["Gb", "G", "G#"] Then take Gb
+    # ["Gb", "G"] Then take Gb
+    # Once taken use the sharp_enharmonic function to get the sharp equivalent
+    # Of the given note
+    for _, notes in duplicates.items():
+        sorted_notes = sorted(notes, key=_legacy_note_sort)
+        _, idx = sorted_notes[0]
+        _scale[idx] = _scale[idx].sharp_enharmonic()
+        break
+    return _scale
+
+
+def legacy_scale_to_enharmonic(scale: List[str]) -> List[str]:
+    """Previous implementation of scale_to_enharmonic, with retries."""
+    # Not possible to get enharmonic scale if there is more than 7 notes
+    if len(scale) > 7:
+        return scale
+    # 7 times the max scale seems pretty good as we cover all the possible alterations
+    MAX_RETRY = 7 * 7
+
+    # Attempt to convert duplicate notes in the scale to their sharp enharmonic
+    # equivalents until there are no more duplicates or the maximum number of
+    # retries is reached.
+    # It is kind of recursive, so we can get C####### in some case for example
+    sharp_duplicates = _legacy_enharmonic_duplicates(scale)
+    sharp_tries = 0
+    sharp_scale: List[Note] = [Note(note) for note in scale]
+    while sharp_duplicates:
+        sharp_scale = _legacy_scale_to_enharmonic_sharp(sharp_duplicates, sharp_scale)
+        sharp_duplicates = _legacy_enharmonic_duplicates(
+            [note.name for note in sharp_scale]
+        )
+        sharp_tries += 1
+        if sharp_tries > MAX_RETRY:
+            break
+
+    # Attempt to convert duplicate notes in the scale to their flat enharmonic
+    # equivalents until there are no more duplicates or the maximum number
+    # of retries is reached.
+    # It is kind of recursive, so we can get Cbbbbbbb in some case for example
+    flat_duplicates = _legacy_enharmonic_duplicates(scale)
+    flat_scale: List[Note] = [Note(note) for note in scale]
+    flat_tries = 0
+    while flat_duplicates:
+        flat_scale = _legacy_scale_to_enharmonic_flat(flat_duplicates, flat_scale)
+        flat_duplicates = _legacy_enharmonic_duplicates(
+            [note.name for note in flat_scale]
+        )
+        flat_tries += 1
+        if flat_tries > MAX_RETRY:
+            break
+
+    # After attempting enharmonic conversions, determine the optimal scale to use.
+    # If both sharp and flat scales have no duplicates, we compare them based on the
+    # total number of alterations (sharps or flats) and select the one with fewer
+    # alterations.
+    # In case of a tie, we avoid scales with unusual alterations like E# or Cb.
+    if len(sharp_duplicates) == 0 and len(flat_duplicates) == 0:
+        # Count total number of alteration
+        sharp_alterations = sum([len(note.name[1:]) for note in sharp_scale])
+        flat_alterations = sum([len(note.name[1:]) for note in flat_scale])
+        # Choose scale with fewer alterations
+        if sharp_alterations == flat_alterations:
+            sharp_weird_alteration = "E#" in sharp_scale or "B#" in sharp_scale
+            flat_weird_alteration = "Cb" in flat_scale or "Fb" in flat_scale
+            if sharp_weird_alteration:
+                return [note.name for note in flat_scale]
+            if flat_weird_alteration:
+                return [note.name for note in sharp_scale]
+
+        elif sharp_alterations < flat_alterations:
+            return [note.name for note in sharp_scale]
+        else:
+            return [note.name for note in flat_scale]
+    # If only one of the scales (sharp or flat) has no duplicates, return that scale.
+    if not sharp_duplicates:
+        return [note.name for note in sharp_scale]
+    if not flat_duplicates:
+        return [note.name for note in flat_scale]
+    return scale
+
+
 # fmt: off
 @pytest.mark.parametrize(
     "scale, expected_result",
@@ -162,3 +411,54 @@ def test_sort_scale():
 )
 def test_scale_to_enharmonic(scale, expected_result):
     assert scale_to_enharmonic(scale) == expected_result
+
+
+def _single_letters_and_alterations(scale):
+    return len({note[0] for note in scale}) == len(scale) and all(
+        len(note) <= 2 for note in scale
+    )
+
+
+def _alterations(scale):
+    return sum(len(note) - 1 for note in scale)
+
+
+@pytest.mark.parametrize("size", range(1, 8))
+def test_scale_to_enharmonic_agrees_with_legacy(size):
+    # Every scale of size notes rooted on C, spelled with CHROMATICS_NOTES.
+    # Wherever the previous spelling uses each letter once with at most one
+    # alteration per note, the new one is the same or has fewer alterations.
+    root = CHROMATICS_NOTES.index("C")
+    for mask in range(4096):
+        if not mask >> root & 1 or bin(mask).count("1") != size:
+            continue
+        scale = [
+            CHROMATICS_NOTES[(root + interval) % 12]
+            for interval in range(12)
+            if mask >> (root + interval) % 12 & 1
+        ]
+        legacy = legacy_scale_to_enharmonic(scale)
+        spelled = scale_to_enharmonic(scale)
+        assert len({note[0] for note in spelled}) == size
+        if _single_letters_and_alterations(legacy):
+            assert spelled == legacy or _alterations(spelled) < _alterations(legacy)
+
+
+def test_scale_to_enharmonic_agrees_with_legacy_on_builders():
+    for root in CHROMATICS_NOTES:
+        for mode in SCALES_DICT:
+            scale = ScaleFromName(root=root, mode=mode).build().notes
+            assert scale_to_enharmonic(scale) == legacy_scale_to_enharmonic(scale)
+        for quality in CHORDS_DICT_ESSENTIAL:
+            chord = ChordFromName(root=root, quality=quality).build().notes
+            legacy = legacy_scale_to_enharmonic(chord)
+            # 9sus2 repeats a note, that the previous spelling named twice
+            if len(set(chord)) == len(chord) and _single_letters_and_alterations(
+                legacy
+            ):
+                assert scale_to_enharmonic(chord) == legacy
+
+
+def test_scale_to_enharmonic_duplicated_pitch_classes():
+    assert scale_to_enharmonic(["A", "B", "E", "G", "B"]) == ["A", "B", "E", "G", "B"]
+    assert scale_to_enharmonic(["C", "C#", "C"]) == ["C", "Db", "C"]
@@ -0,0 +1,80 @@
+import pytest
+
+from fretboardgtr.catalog import main
+from fretboardgtr.notes_creators import ChordFromName
+from fretboardgtr.voicing_index import (
+    MUTED,
+    VoicingIndex,
+    VoicingKey,
+    build_voicing_index,
+    write_voicing_index,
+)
+
+TUNING = ["E", "A", "D", "G"]
+
+
+def test_build_voicing_index(tmp_path):
+    to = tmp_path / "voicings.idx"
+    assert build_voicing_index(to, [TUNING], ["M", "m7", "dim6", "dim7"]) == 36
+    with VoicingIndex(to) as index:
+        assert len(index) == 36
+        for quality in ["M", "m7"]:
+            for root in ["C", "F#", "G#"]:
+                chord = ChordFromName(root, quality).build()
+                assert index.get_chord_fingerings(
+                    TUNING, chord.notes
+                ) == chord.get_chord_fingerings(TUNING)
+
+
+def test_voicing_index_lookup(tmp_path):
+    to = tmp_path / "voicings.idx"
+    key = VoicingKey(tuple(TUNING), ("C", "E", "G"))
+    write_voicing_index(to, [(key, [[None, 3, 2, 0], [0, 3, 5, None]])])
+    with VoicingIndex(to) as index:
+        rows = index.lookup(TUNING, ["C", "E", "G"])
+        assert rows is not None
+        assert rows.tolist() == [MUTED, 3, 2, 0, 0, 3, 5, MUTED]
+        rows.release()
+        assert index.lookup(TUNING, ["C", "E", "G"], max_spacing=4) is None
+        assert index.get_chord_fingerings(TUNING, ["C", "E"]) is None
+
+
+def test_write_voicing_index_duplicated_key(tmp_path):
+    key = VoicingKey(tuple(TUNING), ("C", "E", "G"))
+    with pytest.raises(ValueError):
+        write_voicing_index(tmp_path / "voicings.idx", [(key, []), (key, [])])
+
+
+def test_invalid_voicing_index(tmp_path):
+    to = tmp_path / "voicings.idx"
+    to.write_bytes(bytes(64))
+    with pytest.raises(ValueError):
+        VoicingIndex(to)
+
+
+def test_catalog_command_index(tmp_path):
+    to = tmp_path / "voicings.idx"
+    main([str(to), "--index", "--tuning", "E,A,D,G", "--quality", "M"])
+    chord = ChordFromName("D", "M").build()
+    with VoicingIndex(to) as index:
+        assert len(index) == 12
+        assert index.get_chord_fingerings(
+            TUNING, chord.notes
+        ) == chord.get_chord_fingerings(TUNING)
+
+
+def test_catalog_command_index_chunksize(tmp_path, monkeypatch):
+    import fretboardgtr.voicing_index as voicing_index
+
+    chunksizes = []
+    original = voicing_index.build_voicing_catalog
+
+    def build_voicing_catalog(*args, **kwargs):
+        chunksizes.append(kwargs["chunksize"])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(voicing_index, "build_voicing_catalog", build_voicing_catalog)
+    to = tmp_path / "voicings.idx"
+    main([str(to), "--index", "--tuning", "E,A,D,G", "--quality", "M"])
+    main([str(to), "--index", "--tuning", "E,A,D,G", "--chunksize", "7"])
+    assert chunksizes == [4, 7]